@@ -0,0 +1,267 @@
+"""
+Compiler benchmarks, using only the standard library. Run from the src directory,
+either directly or with the Makefile target "benchmark":
+
+    cd src && python3 ../benchmarks/benchmark.py
+
+The "synthetic" case is a large schema made by adding extensions holding renamed
+copies of the v1.6.0 event classes.
+
+Each case is compiled several times to report the best wall-clock time, then once more
+under tracemalloc to report peak traced memory, and the memory and number of allocated
+blocks retained by the compiled output. Timing is done without tracemalloc since
+tracing slows allocation considerably.
+
+The compiler's threads option only speeds up compiles on free-threaded Python builds.
+To compare, run the benchmark with the same threads option using a standard build and a
+free-threaded build (for example, python3.14 and python3.14t). The Python build and
+whether the GIL is enabled are printed first.
+
+Start up time is measured first: the best wall-clock time of running the command-line
+tool with --version, and the cumulative import times of its entry module and of the
+compiler module, as reported by python -X importtime. Each is measured in a new Python
+process.
+
+Running with python3 -O skips the compiler's per-access type assertions (see the
+jsonish module), which is the fast path for trusted schemas. Whether assertions are
+enabled is also printed first.
+"""
+
+import gc
+import logging
+import subprocess
+import sys
+import sysconfig
+import tracemalloc
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.jsonish import JObject, j_object
+from ocsf_schema_compiler.sources import MemberData, MemorySource
+from ocsf_schema_compiler.structured_read import read_json_object_file
+
+SCHEMAS_DIR = Path(__file__).parent.parent / "tests" / "uncompiled-schemas"
+SCHEMA_DIR = SCHEMAS_DIR / "ocsf-schema-v1.6.0"
+AWS_DIR = SCHEMAS_DIR / "aws-v1.0.0"
+# Schema version 1.0.0-rc.2 and the splunk extension make heavy use of $include
+RC2_SCHEMA_DIR = SCHEMAS_DIR / "ocsf-schema-v1.0.0-rc.2"
+SPLUNK_DIR = SCHEMAS_DIR / "splunk-v1.16.2"
+
+type CompilerOptions = dict[str, Any]  # pyright: ignore[reportExplicitAny]
+
+
+@dataclass(slots=True)
+class Case:
+    name: str
+    options: CompilerOptions
+
+
+def synthetic_extensions(copies: int) -> list[MemorySource]:
+    """
+    Returns extensions each holding a renamed copy of every v1.6.0 event class (except
+    base_event). Observables are removed from the copies to avoid type_id collisions.
+    """
+    classes: list[JObject] = []
+    for path in sorted((SCHEMA_DIR / "events").rglob("*.json")):
+        cls = read_json_object_file(path)
+        if cls["name"] != "base_event":
+            classes.append(cls)
+
+    extensions: list[MemorySource] = []
+    for i in range(copies):
+        name = f"synthetic{i}"
+        files: dict[str, MemberData] = {
+            "extension.json": {
+                "uid": 900 + i,
+                "name": name,
+                "caption": f"Synthetic {i}",
+                "version": "1.0.0",
+            }
+        }
+        for cls in classes:
+            copy = dict(cls)
+            copy["name"] = f"{cls['name']}_{i}"
+            _ = copy.pop("observables", None)
+            attributes: JObject = {}
+            for attribute_name, attribute in j_object(
+                cls.get("attributes", {})
+            ).items():
+                if isinstance(attribute, dict) and "observable" in attribute:
+                    attribute = dict(attribute)
+                    del attribute["observable"]
+                attributes[attribute_name] = attribute
+            copy["attributes"] = attributes
+            files[f"events/{copy['name']}.json"] = copy
+        extensions.append(MemorySource(files, root=Path(name)))
+    return extensions
+
+
+CASES = [
+    Case("default", {"schema_path": SCHEMA_DIR}),
+    Case("extension", {"schema_path": SCHEMA_DIR, "extensions_paths": [AWS_DIR]}),
+    Case("browser", {"schema_path": SCHEMA_DIR, "browser_mode": True}),
+    Case("legacy", {"schema_path": SCHEMA_DIR, "legacy_mode": True}),
+    Case(
+        "includes",
+        {
+            "schema_path": RC2_SCHEMA_DIR,
+            "ignore_platform_extensions": True,
+            "extensions_paths": [SPLUNK_DIR],
+        },
+    ),
+    Case(
+        "synthetic",
+        {
+            "schema_path": SCHEMA_DIR,
+            "extensions_paths": synthetic_extensions(10),
+        },
+    ),
+]
+
+
+# Modules whose import times are measured
+IMPORTED_MODULES = ["ocsf_schema_compiler.__main__", "ocsf_schema_compiler.compiler"]
+
+
+def version_seconds(repeat: int) -> float:
+    """Returns the best wall-clock time of running the command-line tool with -v."""
+    best_seconds = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        _ = subprocess.run(
+            [sys.executable, "-m", "ocsf_schema_compiler", "--version"],
+            check=True,
+            capture_output=True,
+        )
+        best_seconds = min(best_seconds, perf_counter() - start)
+    return best_seconds
+
+
+def import_seconds(module: str, repeat: int) -> float:
+    """Returns the best cumulative import time of module reported by -X importtime."""
+    best_seconds = float("inf")
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        # Lines are "import time: <self us> | <cumulative us> | <indented module>"
+        for line in result.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                best_seconds = min(best_seconds, int(fields[1]) / 1_000_000)
+    return best_seconds
+
+
+@dataclass(slots=True)
+class Result:
+    case: str
+    best_seconds: float
+    peak_bytes: int
+    retained_bytes: int
+    retained_blocks: int
+
+
+def _compile(case: Case, processes: int, threads: int) -> object:
+    compiler = SchemaCompiler(**case.options, processes=processes, threads=threads)  # pyright: ignore[reportAny]
+    return compiler.compile()
+
+
+def run_case(case: Case, repeat: int, processes: int, threads: int) -> Result:
+    best_seconds = float("inf")
+    for _ in range(repeat):
+        _ = gc.collect()
+        start = perf_counter()
+        _ = _compile(case, processes, threads)
+        best_seconds = min(best_seconds, perf_counter() - start)
+
+    _ = gc.collect()
+    tracemalloc.start()
+    output = _compile(case, processes, threads)
+    _ = gc.collect()
+    retained_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del output
+    retained_blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+
+    return Result(case.name, best_seconds, peak_bytes, retained_bytes, retained_blocks)
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark the OCSF schema compiler.")
+    _ = parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="number of timed compiles per case; default: %(default)s",
+    )
+    _ = parser.add_argument(
+        "-c",
+        "--case",
+        action="append",
+        choices=[case.name for case in CASES],
+        dest="cases",
+        help="case to run; can be repeated; default: all cases",
+    )
+    _ = parser.add_argument(
+        "-p",
+        "--processes",
+        type=int,
+        default=1,
+        help="compiler processes option; default: %(default)s",
+    )
+    _ = parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        default=1,
+        help="compiler threads option; default: %(default)s",
+    )
+    args = parser.parse_args()
+    repeat: int = args.repeat  # pyright: ignore[reportAny]
+    case_names: list[str] | None = args.cases  # pyright: ignore[reportAny]
+    processes: int = args.processes  # pyright: ignore[reportAny]
+    threads: int = args.threads  # pyright: ignore[reportAny]
+
+    # Compiler logging would swamp the results
+    logging.disable(logging.CRITICAL)
+
+    free_threaded: bool = sysconfig.get_config_var("Py_GIL_DISABLED") == 1  # pyright: ignore[reportAny]
+    gil_enabled = sys._is_gil_enabled()  # pyright: ignore[reportPrivateUsage]
+    print(
+        f"Python {sys.version.split()[0]}"
+        f" ({'free-threaded' if free_threaded else 'standard'} build,"
+        f" GIL {'enabled' if gil_enabled else 'disabled'}),"
+        f" assertions {'enabled' if __debug__ else 'disabled'},"
+        f" processes: {processes}, threads: {threads}"
+    )
+    startup = [f"--version {version_seconds(repeat):.3f}s"]
+    for module in IMPORTED_MODULES:
+        startup.append(f"import {module} {import_seconds(module, repeat):.3f}s")
+    print(f"Start up: {', '.join(startup)}")
+    print(
+        f"{'case':<12} {'best time':>10} {'peak MiB':>10} {'output MiB':>11}"
+        f" {'output blocks':>14}"
+    )
+    for case in CASES:
+        if case_names and case.name not in case_names:
+            continue
+        result = run_case(case, repeat, processes, threads)
+        peak_mib = result.peak_bytes / 2**20
+        retained_mib = result.retained_bytes / 2**20
+        print(
+            f"{result.case:<12} {result.best_seconds:>9.3f}s"
+            f" {peak_mib:>10.1f} {retained_mib:>11.1f} {result.retained_blocks:>14,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
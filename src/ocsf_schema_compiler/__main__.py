@@ -1,28 +1,49 @@
 import json
 import logging
+import sys
 from argparse import ArgumentParser
+from itertools import islice
 from pathlib import Path
 from sys import stderr
 from time import perf_counter
+from typing import TYPE_CHECKING
 
 from ocsf_schema_compiler import __version__
-from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.jsonish import JObject
+
+if TYPE_CHECKING:
+    from ocsf_schema_compiler.compiler import CompileProgress
+
+# The compiler and other modules are imported after parsing arguments, where used, so
+# -h, --version, and argument errors are quick. Startup time is measured by the
+# benchmark.
 
 logger = logging.getLogger(__name__)
 
 
 def main():
+    if sys.argv[1:2] == ["diff"]:
+        diff_main(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["changes"]:
+        changes_main(sys.argv[2:])
+        return
+
     parser = ArgumentParser(
         description=f"Open Cybersecurity Schema Framework Schema Compiler, version "
         f"{__version__}. Compile an OCSF schema directory structure down to a single"
         " JSON object written to standard output. Logs are written to standard error."
         " Source code at https://github.com/ocsf/ocsf-schema-compiler.",
+        epilog="To compare two compiled schemas, use: %(prog)s diff LEFT RIGHT"
+        " (see %(prog)s diff -h). To report the compatibility of the changes between"
+        " two schemas, use: %(prog)s changes OLD NEW (see %(prog)s changes -h).",
     )
     _ = parser.add_argument(
         "path",
         type=Path,
         help="path to an OCSF schema directory (e.g., a git clone of"
-        " https://github.com/ocsf/ocsf-schema)",
+        " https://github.com/ocsf/ocsf-schema), or a zip or tar archive of one"
+        " (including .tar.zst)",
     )
     _ = parser.add_argument(
         "-i",
@@ -39,8 +60,8 @@ def main():
         type=Path,
         metavar="PATH",
         dest="extensions_paths",
-        help="optional path to a directory containing one or more OCSF schema"
-        " extensions; can be repeated",
+        help="optional path to a directory, or a zip or tar archive, containing one or"
+        " more OCSF schema extensions; can be repeated",
     )
     group = parser.add_mutually_exclusive_group()
     _ = group.add_argument(
@@ -59,6 +80,23 @@ def main():
         help="output schema in legacy export schema layout; cannot be used with the"
         " -b, --browser-mode option; default: %(default)s",
     )
+    _ = parser.add_argument(
+        "-r",
+        "--runtime-mode",
+        action="store_true",
+        default=False,
+        help="leave documentation, such as descriptions, references, and attribute"
+        " captions, out of the output, keeping what is needed to validate events;"
+        " cannot be used with the -b, --browser-mode option; default: %(default)s",
+    )
+    _ = parser.add_argument(
+        "--normalized",
+        action="store_true",
+        default=False,
+        help="write the output in the normalized layout, with identical attribute"
+        " details and enums stored once and referenced by index; the diff and changes"
+        " subcommands read either layout; default: %(default)s",
+    )
     _ = parser.add_argument(
         "-s",
         "--scope-extension-keys",
@@ -67,6 +105,101 @@ def main():
         help="scope extension keys; can only be used with the -l, --legacy-mode option;"
         " default: %(default)s",
     )
+    _ = parser.add_argument(
+        "-p",
+        "--processes",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of worker processes used to finish class, object, and profile"
+        " attributes; finished attributes are copied back from the workers, so this"
+        " only helps with large schemas on machines with several cores;"
+        " default: %(default)s",
+    )
+    _ = parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of threads used for per-item work such as resolving includes,"
+        " extracting observables, and finishing attributes; this only speeds up"
+        " compiles on free-threaded Python builds; default: %(default)s",
+    )
+    _ = parser.add_argument(
+        "--classes",
+        action="extend",
+        type=_names,
+        metavar="NAMES",
+        help="compile only the classes with comma separated NAMES, along with the"
+        " objects and dictionary attributes they use; can be repeated, and combined"
+        " with --categories",
+    )
+    _ = parser.add_argument(
+        "--categories",
+        action="extend",
+        type=_names,
+        metavar="NAMES",
+        help="compile only the classes in the categories with comma separated NAMES,"
+        " along with the objects and dictionary attributes they use; can be repeated,"
+        " and combined with --classes",
+    )
+    _ = parser.add_argument(
+        "--profiles",
+        action="extend",
+        type=_names,
+        metavar="NAMES",
+        help="include only the profiles with comma separated NAMES in the output; can"
+        " be repeated",
+    )
+    _ = parser.add_argument(
+        "-m",
+        "--validate-metaschema",
+        action="store_true",
+        default=False,
+        help="validate all schema and extension files against the schema's metaschema"
+        " before compiling, reporting all errors found; uses the -t, --threads"
+        " option; default: %(default)s",
+    )
+    _ = parser.add_argument(
+        "-c",
+        "--collect-errors",
+        action="store_true",
+        default=False,
+        help="continue compiling after errors such as collisions and undefined"
+        " references, reporting all errors found at the end; default: %(default)s",
+    )
+    _ = parser.add_argument(
+        "-d",
+        "--diagnostics-file",
+        type=Path,
+        metavar="PATH",
+        help="write the warnings and errors found as a JSON array of diagnostic"
+        " objects to PATH, even if the compile fails",
+    )
+    _ = parser.add_argument(
+        "--diagnostic-code",
+        action="append",
+        metavar="CODE",
+        dest="diagnostic_codes",
+        help="only write diagnostics with CODE to the diagnostics file; can be"
+        " repeated",
+    )
+    _ = parser.add_argument(
+        "--manifest",
+        type=Path,
+        metavar="PATH",
+        help="write a manifest of content hashes of the compiled schema and each of its"
+        " classes, objects, profiles, and dictionary attributes to PATH",
+    )
+    _ = parser.add_argument(
+        "--progress",
+        action="store_true",
+        default=False,
+        help="write a progress line to standard error as each compile phase completes,"
+        " with the elapsed time and the numbers of items processed so far;"
+        " default: %(default)s",
+    )
     _ = parser.add_argument(
         "--log-level",
         choices=("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
@@ -83,6 +216,14 @@ def main():
     args = parser.parse_args()
     if args.scope_extension_keys and not args.legacy_mode:  # pyright: ignore[reportAny]
         parser.error("-s, --scope-extension-keys requires -l, --legacy-mode")
+    if args.runtime_mode and args.browser_mode:  # pyright: ignore[reportAny]
+        parser.error("-r, --runtime-mode cannot be used with -b, --browser-mode")
+    if args.processes < 1:  # pyright: ignore[reportAny]
+        parser.error("-p, --processes must be at least 1")
+    if args.threads < 1:  # pyright: ignore[reportAny]
+        parser.error("-t, --threads must be at least 1")
+    if args.diagnostic_codes and not args.diagnostics_file:  # pyright: ignore[reportAny]
+        parser.error("--diagnostic-code requires -d, --diagnostics-file")
 
     logging.basicConfig(
         format="%(levelname)s: %(message)s",
@@ -93,6 +234,9 @@ def main():
 
     start_seconds = perf_counter()
 
+    from ocsf_schema_compiler.compiler import SchemaCompiler
+    from ocsf_schema_compiler.diagnostics import filter_diagnostics
+
     compiler = SchemaCompiler(
         args.path,  # pyright: ignore[reportAny]
         args.ignore_platform_extensions,  # pyright: ignore[reportAny]
@@ -100,14 +244,186 @@ def main():
         args.browser_mode,  # pyright: ignore[reportAny]
         args.legacy_mode,  # pyright: ignore[reportAny]
         args.scope_extension_keys,  # pyright: ignore[reportAny]
+        processes=args.processes,  # pyright: ignore[reportAny]
+        threads=args.threads,  # pyright: ignore[reportAny]
+        validate_metaschema=args.validate_metaschema,  # pyright: ignore[reportAny]
+        collect_errors=args.collect_errors,  # pyright: ignore[reportAny]
+        create_manifest=args.manifest is not None,  # pyright: ignore[reportAny]
+        classes=args.classes,  # pyright: ignore[reportAny]
+        categories=args.categories,  # pyright: ignore[reportAny]
+        profiles=args.profiles,  # pyright: ignore[reportAny]
+        runtime_mode=args.runtime_mode,  # pyright: ignore[reportAny]
+        progress=_print_progress if args.progress else None,  # pyright: ignore[reportAny]
     )
-    output = compiler.compile()
+    try:
+        output = compiler.compile()
+    finally:
+        if args.diagnostics_file:  # pyright: ignore[reportAny]
+            diagnostics = compiler.diagnostics
+            if args.diagnostic_codes:  # pyright: ignore[reportAny]
+                diagnostics = filter_diagnostics(diagnostics, args.diagnostic_codes)  # pyright: ignore[reportAny]
+            with open(args.diagnostics_file, "w") as f:  # pyright: ignore[reportAny]
+                json.dump([d.to_j_object() for d in diagnostics], f, indent=4)
+
+    if args.manifest:  # pyright: ignore[reportAny]
+        with open(args.manifest, "w") as f:  # pyright: ignore[reportAny]
+            json.dump(compiler.manifest, f, indent=4)
 
     duration = perf_counter() - start_seconds
     logger.info("Schema compilation took %.3f seconds", duration)
 
+    if args.normalized:  # pyright: ignore[reportAny]
+        from ocsf_schema_compiler.normalized import normalize
+
+        output = normalize(output)
     print(json.dumps(output))
 
 
+def _print_progress(progress: CompileProgress) -> None:
+    bar = "#" * progress.completed + "." * (progress.total - progress.completed)
+    print(
+        f"[{bar}] {progress.phase} ({progress.completed}/{progress.total})"
+        f" {progress.elapsed_seconds:.3f} s: {progress.class_count} classes,"
+        f" {progress.object_count} objects, {progress.profile_count} profiles,"
+        f" {progress.dictionary_attribute_count} dictionary attributes",
+        file=stderr,
+        flush=True,
+    )
+
+
+def _names(value: str) -> list[str]:
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def diff_main(argv: list[str]) -> None:
+    parser = ArgumentParser(
+        prog="ocsf-schema-compiler diff",
+        description="Compare two compiled schemas, writing the differences to standard"
+        " output. Exits with status 1 if the schemas differ.",
+    )
+    _ = parser.add_argument(
+        "left",
+        type=Path,
+        help="path to a compiled schema; files ending with .zst are read as Zstandard"
+        " compressed JSON",
+    )
+    _ = parser.add_argument(
+        "right",
+        type=Path,
+        help="path to a compiled schema to compare with left",
+    )
+    _ = parser.add_argument(
+        "--manifests",
+        type=Path,
+        nargs=2,
+        metavar=("LEFT_MANIFEST", "RIGHT_MANIFEST"),
+        help="content hash manifests of left and right, written by the --manifest"
+        " option when compiling; items with the same hash are skipped",
+    )
+    _ = parser.add_argument(
+        "-n",
+        "--max-differences",
+        type=int,
+        default=0,
+        metavar="N",
+        help="stop after N differences; 0 for no limit; default: %(default)s",
+    )
+    args = parser.parse_args(argv)
+    if args.max_differences < 0:  # pyright: ignore[reportAny]
+        parser.error("-n, --max-differences must not be negative")
+
+    from ocsf_schema_compiler.schema_diff import iter_differences, read_compiled_schema
+    from ocsf_schema_compiler.structured_read import read_json_object_file
+
+    left = read_compiled_schema(args.left)  # pyright: ignore[reportAny]
+    right = read_compiled_schema(args.right)  # pyright: ignore[reportAny]
+    left_manifest = None
+    right_manifest = None
+    if args.manifests:  # pyright: ignore[reportAny]
+        left_manifest = read_json_object_file(args.manifests[0])  # pyright: ignore[reportAny]
+        right_manifest = read_json_object_file(args.manifests[1])  # pyright: ignore[reportAny]
+    differences = iter_differences(left, right, left_manifest, right_manifest)
+    if args.max_differences:  # pyright: ignore[reportAny]
+        differences = islice(differences, args.max_differences)  # pyright: ignore[reportAny]
+    count = 0
+    for difference in differences:
+        print(difference.formatted_string())
+        count += 1
+    if count:
+        sys.exit(1)
+
+
+def changes_main(argv: list[str]) -> None:
+    parser = ArgumentParser(
+        prog="ocsf-schema-compiler changes",
+        description="Report the changes between two schemas, such as two OCSF"
+        " releases, as breaking or additive, writing the report to standard output."
+        " Exits with status 1 if there are breaking changes.",
+    )
+    _ = parser.add_argument(
+        "old",
+        type=Path,
+        help="path to a compiled schema (a file ending with .json, or .json.zst for"
+        " Zstandard compressed JSON), or to a schema directory or archive to compile"
+        " with default options",
+    )
+    _ = parser.add_argument(
+        "new",
+        type=Path,
+        help="path to a compiled schema, or schema directory or archive, to compare"
+        " with old",
+    )
+    _ = parser.add_argument(
+        "--json",
+        action="store_true",
+        default=False,
+        help="write the changes as a JSON array; default: %(default)s",
+    )
+    _ = parser.add_argument(
+        "--log-level",
+        choices=("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
+        default="WARNING",
+        help="set log level; logs are written to standard error; default: %(default)s",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        format="%(levelname)s: %(message)s",
+        style="%",
+        stream=stderr,
+        level=args.log_level,  # pyright: ignore[reportAny]
+    )
+
+    old = _load_schema(args.old)  # pyright: ignore[reportAny]
+    new = _load_schema(args.new)  # pyright: ignore[reportAny]
+    from ocsf_schema_compiler.schema_changes import schema_changes
+
+    changes = schema_changes(old, new)
+    breaking = [c for c in changes if c.compatibility == "breaking"]
+    if args.json:  # pyright: ignore[reportAny]
+        print(json.dumps([c.to_j_object() for c in changes], indent=4))
+    else:
+        additive = changes[len(breaking) :]
+        print(f"Breaking changes ({len(breaking)}):")
+        for change in breaking:
+            print(f"    {change.formatted_string()}")
+        print(f"Additive changes ({len(additive)}):")
+        for change in additive:
+            print(f"    {change.formatted_string()}")
+    if breaking:
+        sys.exit(1)
+
+
+def _load_schema(path: Path) -> JObject:
+    # Compiled schemas are read, so cached compiles can be compared quickly
+    if path.name.endswith((".json", ".json.zst")):
+        from ocsf_schema_compiler.schema_diff import read_compiled_schema
+
+        return read_compiled_schema(path)
+    from ocsf_schema_compiler.compiler import SchemaCompiler
+
+    return SchemaCompiler(path).compile()
+
+
 if __name__ == "__main__":
     main()
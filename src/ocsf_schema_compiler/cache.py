@@ -0,0 +1,107 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from pathlib import Path
+from typing import override
+
+from ocsf_schema_compiler.jsonish import JObject
+from ocsf_schema_compiler.structured_read import SchemaSource
+from ocsf_schema_compiler.utils import deep_copy_j_object
+
+
+class FileCache:
+    """
+    Size-bounded least recently used (LRU) cache of parsed JSON object files, keyed by
+    the cache key of a schema source file (see SchemaSource.cache_key). A cache can be
+    shared by any number of SchemaCompiler instances, including from multiple threads,
+    so long-lived processes compiling many schema variants parse each file only once.
+
+    Compilation modifies what it reads, so cached objects are copied both when they
+    are added and when they are returned.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[Hashable, JObject] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> JObject | None:
+        """Returns a copy of cached object with key, or None if it is not cached."""
+        with self._lock:
+            obj = self._entries.get(key)
+            if obj is None:
+                return None
+            self._entries.move_to_end(key)
+        return deep_copy_j_object(obj)
+
+    def put(self, key: Hashable, obj: JObject) -> None:
+        """Caches a copy of obj with key, evicting the least recently used entries."""
+        obj = deep_copy_j_object(obj)
+        with self._lock:
+            self._entries[key] = obj
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _ = self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_shared_file_cache = FileCache()
+
+
+def shared_file_cache() -> FileCache:
+    """Returns the process-wide file cache."""
+    return _shared_file_cache
+
+
+class CachingSource(SchemaSource):
+    """
+    Schema source reading JSON object files through a file cache, counting cache hits
+    and misses. Files without a cache key are read directly and are not counted. Files
+    can be read from multiple threads.
+    """
+
+    def __init__(self, source: SchemaSource, cache: FileCache) -> None:
+        super().__init__(source.root)
+        self.source: SchemaSource = source
+        self.cache: FileCache = cache
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @override
+    def is_file(self, path: Path) -> bool:
+        return self.source.is_file(path)
+
+    @override
+    def is_dir(self, path: Path) -> bool:
+        return self.source.is_dir(path)
+
+    @override
+    def walk(self, path: Path) -> Iterator[tuple[Path, list[str]]]:
+        return self.source.walk(path)
+
+    @override
+    def cache_key(self, path: Path) -> Hashable | None:
+        return self.source.cache_key(path)
+
+    @override
+    def read_json_object(self, path: Path) -> JObject:
+        key = self.source.cache_key(path)
+        if key is None:
+            return self.source.read_json_object(path)
+        obj = self.cache.get(key)
+        if obj is not None:
+            with self._lock:
+                self.hits += 1
+            return obj
+        obj = self.source.read_json_object(path)
+        self.cache.put(key, obj)
+        with self._lock:
+            self.misses += 1
+        return obj
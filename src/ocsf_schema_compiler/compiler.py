@@ -1,9 +1,20 @@
 import logging
-import os
-from dataclasses import dataclass
+import threading
+from collections.abc import Generator, Iterable, Iterator
+
+# ProcessPoolExecutor is imported when used, since importing multiprocessing is a large
+# part of the start up time of small compiles
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, replace
+from functools import partial
+from itertools import repeat
 from pathlib import Path
+from time import perf_counter
 from typing import Callable
 
+from ocsf_schema_compiler.cache import CachingSource, FileCache
+from ocsf_schema_compiler.diagnostics import Diagnostic, DiagnosticCode
 from ocsf_schema_compiler.exceptions import SchemaException
 from ocsf_schema_compiler.jsonish import (
     JValue,
@@ -22,15 +33,33 @@ from ocsf_schema_compiler.legacy_mode import (
     add_extension_scope_to_items,
     add_extension_scope_to_dictionary,
 )
+from ocsf_schema_compiler.manifest import build_manifest
+from ocsf_schema_compiler.metaschema import (
+    METASCHEMA_FILE_NAMES,
+    Metaschema,
+    read_metaschema,
+)
+from ocsf_schema_compiler.runtime_mode import (
+    ITEM_DOCUMENTATION_KEYS,
+    attribute_without_documentation,
+    remove_items_documentation,
+)
+from ocsf_schema_compiler.shape import (
+    validate_categories_shape,
+    validate_dictionary_shape,
+    validate_include_shape,
+)
+from ocsf_schema_compiler.sources import open_source
 from ocsf_schema_compiler.structured_read import (
-    read_json_object_file,
+    SchemaSource,
     read_structured_items,
     read_patchable_structured_items,
 )
 from ocsf_schema_compiler.utils import (
-    deep_copy_j_object,
     deep_copy_j_array,
+    deep_copy_j_object,
     deep_merge,
+    copy_merge,
     put_non_none,
     is_hidden_class,
     is_hidden_object,
@@ -46,8 +75,9 @@ from ocsf_schema_compiler.utils import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Extension:
+    source: SchemaSource
     base_path: Path
     uid: int
     name: str
@@ -64,13 +94,138 @@ class Extension:
     profiles: JObject
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileInfo:
     is_extension_profile: bool
     extension_name: str | None
     caption: str
 
 
+@dataclass(slots=True)
+class CompileStats:
+    error_count: int = 0
+    warning_count: int = 0
+    # File cache counters; these stay zero when compiling without a file cache
+    file_cache_hits: int = 0
+    file_cache_misses: int = 0
+
+
+# Phases of a compile, in order. See CompileProgress.
+COMPILE_PHASES = (
+    "read",
+    "extensions",
+    "classes",
+    "objects",
+    "dictionary",
+    "profiles",
+    "finish",
+    "output",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class CompileProgress:
+    """
+    Progress of a compile, reported to the progress option's callback as each compile
+    phase completes. The get_class and get_object methods report the phases they run
+    before finishing items.
+    """
+
+    # Name of the phase completed, one of COMPILE_PHASES
+    phase: str
+    # Number of phases completed, including this one, out of total
+    completed: int
+    total: int
+    # Seconds since the compile started
+    elapsed_seconds: float
+    # Numbers of items processed so far. Items are counted once read, and stop being
+    # counted when removed, such as hidden classes and objects once their
+    # inheritance is resolved, and items not selected for a subset.
+    class_count: int
+    object_count: int
+    profile_count: int
+    dictionary_attribute_count: int
+
+
+@dataclass(slots=True)
+class Link:
+    """
+    Browser mode link from a dictionary attribute, object, or profile to a class or
+    object that uses it. Links are collected in side tables keyed by the name of the
+    thing linked to, and only converted to JSON objects in the "_links" values once
+    all links are known, so they are sorted once rather than on every addition.
+    """
+
+    group: str
+    type: str
+    caption: JValue
+    extension: JValue = None
+    deprecated: bool = False
+    # Attribute names using an object type; None for dictionary types
+    attribute_keys: list[str] | None = None
+
+    def sort_key(self) -> tuple[str, str]:
+        return self.group, self.type
+
+    def to_j_object(self) -> JObject:
+        link: JObject = {
+            "group": self.group,
+            "type": self.type,
+            "caption": self.caption,
+        }
+        if self.extension is not None:
+            link["extension"] = self.extension
+        if self.deprecated:
+            link["deprecated?"] = True
+        if self.attribute_keys is not None:
+            link["attribute_keys"] = list[JValue](self.attribute_keys)
+        return link
+
+
+@dataclass(slots=True)
+class Observable:
+    """
+    Observable type_id definition found in a class or object. Observables of each item
+    are found independently (possibly in threads), then checked for collisions and
+    added to the observable type_id enum in item order.
+    """
+
+    type_id: str
+    entry: JObject
+    # Where the observable is defined, used in collision error messages
+    source: str
+    # Base directory of the schema or extension defining the observable
+    path: Path
+
+
+@dataclass(slots=True)
+class DictionaryAttributeInfo:
+    """
+    Information about a dictionary attribute used when verifying and consolidating
+    class and object attributes, computed once after the dictionary is enriched.
+    """
+
+    # Type after enrichment; object types are "object_t" with the object in object_type
+    type: str | None
+    object_type: str | None
+    is_timestamp: bool
+    description: str
+    # The description is a placeholder asking for a usage-specific description
+    has_placeholder_description: bool
+
+
+@dataclass(slots=True)
+class ProfileClosure:
+    """
+    Profiles of an object and of all objects reachable through its object type
+    attributes, recursively.
+    """
+
+    profiles: frozenset[str]
+    # Names of the reachable objects defining profiles, used in debug logging
+    sources: frozenset[str]
+
+
 # Type alias for dictionary from patch item name to a list of patch objects.
 # The value is list since different extensions can patch the same thing.
 type PatchList = list[JObject]  # list of patches for an item name
@@ -80,26 +235,87 @@ type PatchDict = dict[str, PatchList]  # dict of item name to list of patches
 class SchemaCompiler:
     def __init__(
         self,
-        schema_path: Path,
+        schema_path: Path | SchemaSource,
         ignore_platform_extensions: bool = False,
-        extensions_paths: list[Path] | None = None,
+        extensions_paths: list[Path | SchemaSource] | None = None,
         browser_mode: bool = False,
         legacy_mode: bool = False,
         scope_extension_keys: bool = False,
+        file_cache: FileCache | None = None,
+        processes: int = 1,
+        threads: int = 1,
+        validate_metaschema: bool = False,
+        collect_errors: bool = False,
+        create_manifest: bool = False,
+        classes: list[str] | None = None,
+        categories: list[str] | None = None,
+        profiles: list[str] | None = None,
+        runtime_mode: bool = False,
+        progress: Callable[[CompileProgress], None] | None = None,
     ) -> None:
         if browser_mode and legacy_mode:
             raise SchemaException("Browser mode and legacy mode are mutually exclusive")
+        if browser_mode and runtime_mode:
+            raise SchemaException(
+                "Browser mode and runtime mode are mutually exclusive"
+            )
         if scope_extension_keys and not legacy_mode:
             raise SchemaException(
                 "Scope extension keys option is only supported in legacy mode"
             )
-
-        self.schema_path: Path = schema_path
+        if processes < 1:
+            raise SchemaException("Processes option must be at least 1")
+        if threads < 1:
+            raise SchemaException("Threads option must be at least 1")
+
+        # Schema and extensions paths can be directories or archives, or sources can
+        # be given directly
+        self._schema_source: SchemaSource = self._to_source(schema_path)
+        self._extensions_sources: list[SchemaSource] = [
+            self._to_source(path) for path in extensions_paths or []
+        ]
+        self.schema_path: Path = self._schema_source.root
         self.ignore_platform_extensions: bool = ignore_platform_extensions
-        self.extensions_paths: list[Path] | None = extensions_paths
+        self.extensions_paths: list[Path] | None = [
+            source.root for source in self._extensions_sources
+        ] or None
         self.browser_mode: bool = browser_mode
         self.legacy_mode: bool = legacy_mode
+        # Leave documentation, such as descriptions, out of the compiled output
+        self.runtime_mode: bool = runtime_mode
         self.scope_extension_keys: bool = scope_extension_keys
+        self.file_cache: FileCache | None = file_cache
+        # Number of worker processes used to finish class, object, and profile
+        # attributes; 1 finishes them in this process
+        self.processes: int = processes
+        # Number of threads used for per-item work: resolving includes, extracting
+        # observables, adding browser mode links, and finishing attributes (unless
+        # processes are used); 1 does everything in the calling thread
+        self.threads: int = threads
+        # Validate all schema and extension files against the schema's metaschema
+        # before compiling
+        self.validate_metaschema: bool = validate_metaschema
+        # Record recoverable errors and continue compiling, raising a single exception
+        # listing all errors at the end, rather than raising at the first error
+        self.collect_errors: bool = collect_errors
+        # Create a content hash manifest of the compiled schema, available from the
+        # manifest property after compiling
+        self.create_manifest: bool = create_manifest
+        # Compile only a subset of the schema: the classes named in classes and those
+        # in categories (all classes if neither is given), the base_event class, and
+        # the objects and dictionary attributes they use. Profiles limits the profiles
+        # included in the output; profiles used by classes are still listed in classes.
+        self.classes: list[str] | None = classes
+        self.categories: list[str] | None = categories
+        self.profiles: list[str] | None = profiles
+        # Called as each compile phase completes. Exceptions raised by progress stop
+        # the compile, so it can also enforce time limits.
+        self.progress: Callable[[CompileProgress], None] | None = progress
+        if file_cache is not None:
+            self._schema_source = CachingSource(self._schema_source, file_cache)
+            self._extensions_sources = [
+                CachingSource(source, file_cache) for source in self._extensions_sources
+            ]
 
         logger.info("Schema path: %s", self.schema_path)
         if self.ignore_platform_extensions:
@@ -123,6 +339,19 @@ class SchemaCompiler:
                 " Including extra information needed by the schema browser (the OCSF"
                 " Server)."
             )
+        if self.classes or self.categories or self.profiles:
+            logger.info(
+                "Compiling a subset of the schema."
+                " Classes: %s. Categories: %s. Profiles: %s.",
+                ", ".join(self.classes or []) or "all",
+                ", ".join(self.categories or []) or "all",
+                ", ".join(self.profiles or []) or "all",
+            )
+        if self.runtime_mode:
+            logger.info(
+                "Runtime mode enabled. Documentation will be left out of the compiled"
+                " output."
+            )
         if self.legacy_mode:
             logger.info(
                 "Legacy mode enabled. Compiled output will be in legacy schema export"
@@ -146,8 +375,17 @@ class SchemaCompiler:
                 )
 
         self._is_compiled: bool = False
-        self._error_count: int = 0
-        self._warning_count: int = 0
+        # perf_counter value when the compile (or get_class and get_object
+        # preparation) started
+        self._start_seconds: float = 0.0
+        self._stats: CompileStats = CompileStats()
+        self._stats_lock: threading.Lock = threading.Lock()
+        # Errors recorded when collecting errors
+        self._errors: list[str] = []
+        # Warnings and errors found, in the order found (guarded by _stats_lock)
+        self._diagnostics: list[Diagnostic] = []
+        # Thread pool used during compile when threads is more than 1
+        self._thread_pool: ThreadPoolExecutor | None = None
         self._version: str = "0.0.0-undefined"
         self._categories: JObject = {}
         self._dictionary: JObject = {}
@@ -168,8 +406,16 @@ class SchemaCompiler:
         # browser, not the complete data used during schema compilation. The values in
         # this JObject are thus a subset of the information in the Extension dataclass.
         self._extensions: JObject = {}
-
-        self._include_cache: dict[Path, JObject] = {}
+        # Base directory of each extension, keyed by extension name, used in errors
+        self._extension_paths: dict[str, Path] = {}
+
+        # Included files and profiles, keyed by source and path, as paths are only
+        # unique within a source (memory sources all have the same default root)
+        self._include_cache: dict[tuple[SchemaSource, Path], JObject] = {}
+        self._include_cache_lock: threading.Lock = threading.Lock()
+        # Ids of the containers nested in included attribute details, which are shared
+        # by the items including them until finishing (guarded by _include_cache_lock)
+        self._included_value_ids: set[int] = set()
         # Observable type_id values extracted from all observable sources
         # Used to detect collisions and populate the observable object's type_id enum
         self._observable_type_id_dict: JObject = {}
@@ -177,34 +423,215 @@ class SchemaCompiler:
         self._all_classes: JObject = {}
         # Slice of objects before removing "hidden" / abstract objects
         self._all_objects: JObject = {}
+        # Cache of the caption and description found for items by searching their
+        # "extends" ancestors, keyed by kind ("Class" or "Object") and item name
+        self._ancestor_captions: dict[tuple[str, str], tuple[str, str] | None] = {}
+        self._ancestor_captions_lock: threading.Lock = threading.Lock()
+        # Browser mode links, keyed by dictionary attribute name and profile name
+        self._dictionary_attribute_links: dict[str, list[Link]] = {}
+        self._profile_links: dict[str, list[Link]] = {}
+        # Dictionary attribute information, keyed by attribute name. Built once the
+        # dictionary is enriched and validated.
+        self._dictionary_index: dict[str, DictionaryAttributeInfo] = {}
+        # Memoized profile closures of objects, keyed by object name
+        self._profile_closures: dict[str, ProfileClosure] = {}
+        self._manifest: JObject | None = None
+        # Compiled output, set by the last compile phase
+        self._output: JObject = {}
+        # State of get_class and get_object: whether the whole-schema compile steps
+        # are done, and the items finished so far, keyed by name
+        self._is_prepared: bool = False
+        # Exception raised while preparing, raised again by later calls, since the
+        # compiler state is left partly prepared
+        self._prepare_exception: Exception | None = None
+        self._compiled_classes: dict[str, JObject] = {}
+        self._compiled_objects: dict[str, JObject] = {}
+
+    @staticmethod
+    def _to_source(path: Path | SchemaSource) -> SchemaSource:
+        if isinstance(path, SchemaSource):
+            return path
+        return open_source(path)
 
     def compile(self) -> JObject:
+        self._start_compile()
+        output = self._collecting_errors(self._compile)
+        self._log_compile_completed()
+        return output
+
+    async def compile_async(
+        self, executor: ThreadPoolExecutor | None = None
+    ) -> JObject:
+        """
+        Compile as compile does, without blocking the event loop. Each compile phase
+        (see COMPILE_PHASES) runs in executor, or the event loop's default executor if
+        None, and the progress option's callback is called in the event loop as each
+        phase completes. Within phases, files are read and items processed with the
+        threads option's thread pool, as with compile.
+
+        Phases modify the compiler in place, so executor must run them in this
+        process: a thread pool, not a process pool. Use the processes option to
+        finish attributes in worker processes.
+
+        Cancelling the calling task stops the compile between phases: a running phase
+        is left to finish, since it cannot be interrupted, and no further phases are
+        run. A cancelled compiler cannot be used again.
+        """
+        # Imported when used, like ProcessPoolExecutor, as importing asyncio adds to
+        # the start up time of the command-line tool
+        import asyncio
+
+        self._start_compile()
+        loop = asyncio.get_running_loop()
+        phases = self._compile_phases()
+        with self._errors_collected(), self._thread_pool_context():
+            for completed, (phase_name, phase) in enumerate(phases, 1):
+                # Pending cancellations of the calling task are delivered here, between
+                # phases
+                await asyncio.sleep(0)
+                future = loop.run_in_executor(executor, phase)
+                try:
+                    await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    logger.info("Compile cancelled during %s phase", phase_name)
+                    # The phase still uses the compiler's thread pool, so it is waited
+                    # for; its errors are superseded by the cancellation
+                    with suppress(Exception):
+                        await future
+                    raise
+                self._report_progress(phase_name, completed, len(phases))
+        self._log_compile_completed()
+        return self._output
+
+    def _start_compile(self) -> None:
         if self._is_compiled:
             raise SchemaException(
                 "Schema already compiled (compile can only be run once)"
             )
+        if self._is_prepared or self._prepare_exception is not None:
+            raise SchemaException(
+                "Schema already prepared for get_class and get_object (compile cannot"
+                " be used with them)"
+            )
         self._is_compiled = True
+        self._start_seconds = perf_counter()
 
         logger.info("Compiling schema")
 
-        if not self.schema_path.is_dir():
+    def _log_compile_completed(self) -> None:
+        stats = self.stats
+        if stats.error_count and stats.warning_count:
+            logger.error(
+                "Compile completed with %d error(s) and %d warning(s)",
+                stats.error_count,
+                stats.warning_count,
+            )
+        elif stats.error_count and not stats.warning_count:
+            logger.error(
+                "Compile completed with %d (tolerated) error(s)", stats.error_count
+            )
+        elif stats.warning_count:
+            logger.warning("Compile completed with %d warnings(s)", stats.warning_count)
+        else:
+            logger.info("Compile completed successfully")
+        if self.file_cache is not None:
+            logger.info(
+                "File cache hits: %d, misses: %d",
+                stats.file_cache_hits,
+                stats.file_cache_misses,
+            )
+
+        logger.info("Compiled schema base version: %s", self._version)
+        if self._extensions:
+            logger.info(
+                "Compiled schema includes the following extension(s):\n%s",
+                pretty_json_encode(self._extensions),
+            )
+
+    def _compile(self) -> JObject:
+        with self._thread_pool_context():
+            self._run_phases(self._compile_phases())
+        return self._output
+
+    def _run_phases(self, phases: list[tuple[str, Callable[[], None]]]) -> None:
+        for completed, (phase_name, phase) in enumerate(phases, 1):
+            phase()
+            self._report_progress(phase_name, completed, len(phases))
+
+    def _report_progress(self, phase_name: str, completed: int, total: int) -> None:
+        if self.progress is None:
+            return
+        self.progress(
+            CompileProgress(
+                phase_name,
+                completed,
+                total,
+                perf_counter() - self._start_seconds,
+                len(self._classes),
+                len(self._objects),
+                len(self._base_profiles) + len(self._extension_profiles),
+                len(j_object(self._dictionary.get("attributes", {}))),
+            )
+        )
+
+    def _compile_phases(self) -> list[tuple[str, Callable[[], None]]]:
+        """Returns the phases of compile as (phase name, phase function), in order."""
+        phases = [
+            *self._prepare_phases(),
+            ("profiles", self._profiles_phase),
+            ("finish", self._finish_phase),
+            ("output", self._output_phase),
+        ]
+        assert tuple(name for name, _ in phases) == COMPILE_PHASES
+        return phases
+
+    def _prepare(self) -> None:
+        """
+        Do the compile steps that work on the whole schema: reading the schema and
+        extensions, resolving includes, patches, and "extends" inheritance, and
+        enriching the dictionary. What remains is done for each class and object.
+        """
+        self._run_phases(self._prepare_phases())
+
+    def _prepare_phases(self) -> list[tuple[str, Callable[[], None]]]:
+        return [
+            ("read", self._read_phase),
+            ("extensions", self._extensions_phase),
+            ("classes", self._process_classes),
+            ("objects", self._process_objects),
+            ("dictionary", self._dictionary_phase),
+        ]
+
+    def _read_phase(self) -> None:
+        if not self._schema_source.is_dir(self.schema_path):
             raise FileNotFoundError(f"Schema path does not exist: {self.schema_path}")
 
+        if self.validate_metaschema:
+            self._validate_with_metaschema()
+
         self._read_base_schema()
-        self._read_and_merge_extensions()
 
+    def _extensions_phase(self) -> None:
+        self._read_and_merge_extensions()
         self._enrich_dictionary_object_types()
 
-        self._process_classes()
-        self._process_objects()
+    def _dictionary_phase(self) -> None:
+        # Observables of the whole dictionary are extracted before selecting items,
+        # so the observable object's type_id enum is the same for subsets
+        self._observables_from_dictionary()
+        if self.classes or self.categories or self.profiles:
+            self._select_items()
 
         self._enrich_and_validate_dictionary()
-        self._observables_from_dictionary()
+        self._index_dictionary()
+        self._update_observable_enum()
+        if self.runtime_mode:
+            self._remove_schema_documentation()
 
+    def _profiles_phase(self) -> None:
         self._validate_object_profiles_and_add_links()
         if self.browser_mode:
             self._add_object_links()
-        self._update_observable_enum()
         self._consolidate_object_profiles()
         self._verify_object_attributes_and_add_datetime()
 
@@ -212,56 +639,421 @@ class SchemaCompiler:
         self._consolidate_class_profiles()
         self._verify_class_attributes_and_add_datetime()
 
-        self._ensure_attributes_have_requirement()
+        if self.profiles:
+            self._remove_unselected_profiles()
+        self._ensure_attributes_have_requirement(
+            [
+                (self._base_profiles, "profile"),
+                (self._extension_profiles, "profile"),
+                (self._classes, "class"),
+                (self._objects, "object"),
+            ]
+        )
 
+    def _finish_phase(self) -> None:
+        if self.runtime_mode:
+            # Before finishing, so finishing does not copy documentation
+            remove_items_documentation(self._classes)
+            remove_items_documentation(self._objects)
+            remove_items_documentation(self._base_profiles)
+            remove_items_documentation(self._extension_profiles)
+        self._copy_included_values()
         self._finish_attributes()
 
-        output = self._create_compile_output()
+    def _copy_included_values(self) -> None:
+        """
+        Replace the included containers in the attributes of classes, objects, and
+        profiles with copies, so items in the output do not share them. Included
+        content is shared while compiling rather than copied for each include, and
+        only these few containers need copying. This is done before finishing, rather
+        than by finishing, since worker processes cannot tell which containers were
+        included.
+        """
+        if not self._included_value_ids:
+            return
+        for items in (
+            self._classes,
+            self._objects,
+            self._base_profiles,
+            self._extension_profiles,
+        ):
+            for item in items.values():
+                attributes = j_object(item).get("attributes")
+                if isinstance(attributes, dict):
+                    for attribute in attributes.values():
+                        _copy_included_containers(
+                            j_object(attribute), self._included_value_ids
+                        )
 
-        if self._error_count and self._warning_count:
-            logger.error(
-                "Compile completed with %d error(s) and %d warning(s)",
-                self._error_count,
-                self._warning_count,
-            )
-        elif self._error_count and not self._warning_count:
-            logger.error(
-                "Compile completed with %d (tolerated) error(s)", self._error_count
+    def _output_phase(self) -> None:
+        self._output = self._create_compile_output()
+        if self.create_manifest:
+            self._manifest = build_manifest(self._output)
+
+    def _remove_schema_documentation(self) -> None:
+        """
+        Remove documentation from the dictionary, categories, and extension information
+        for runtime mode. This is done once the dictionary is indexed, since the index
+        keeps dictionary attribute descriptions for the warnings about placeholder
+        descriptions.
+        """
+        for key in ITEM_DOCUMENTATION_KEYS:
+            _ = self._dictionary.pop(key, None)
+            _ = self._categories.pop(key, None)
+        dictionary_attributes = j_object(self._dictionary.setdefault("attributes", {}))
+        for attribute_name, attribute in dictionary_attributes.items():
+            dictionary_attributes[attribute_name] = attribute_without_documentation(
+                j_object(attribute)
             )
-        elif self._warning_count:
-            logger.warning("Compile completed with %d warnings(s)", self._warning_count)
-        else:
-            logger.info("Compile completed successfully")
+        dictionary_types = j_object(self._dictionary.setdefault("types", {}))
+        for key in ITEM_DOCUMENTATION_KEYS:
+            _ = dictionary_types.pop(key, None)
+        remove_items_documentation(
+            j_object(dictionary_types.setdefault("attributes", {}))
+        )
+        remove_items_documentation(self._extensions)
+        remove_items_documentation(
+            j_object(self._categories.setdefault("attributes", {}))
+        )
 
-        logger.info("Compiled schema base version: %s", self._version)
-        if self._extensions:
-            logger.info(
-                "Compiled schema includes the following extension(s):\n%s",
-                pretty_json_encode(self._extensions),
+    def get_class(self, name: str) -> JObject:
+        """
+        Returns class name compiled as in a full compile, doing only the work needed
+        for it. See get_object.
+        """
+        cls = self._compiled_classes.get(name)
+        if cls is None:
+            self._prepare_once()
+            if name not in self._classes:
+                raise SchemaException(f'Class "{name}" is not defined')
+            cls = self._compile_item(j_object(self._classes[name]), name, "class")
+            self._compiled_classes[name] = cls
+        return cls
+
+    def get_object(self, name: str) -> JObject:
+        """
+        Returns object name compiled as in a full compile, doing only the work needed
+        for it.
+
+        The first call of get_class or get_object does the compile steps that work on
+        the whole schema (reading files and flattening inheritance); each item is then
+        finished when first requested, and returned as is afterward. These methods
+        cannot be used with compile, or in browser mode, where items link to all the
+        items using them.
+        """
+        obj = self._compiled_objects.get(name)
+        if obj is None:
+            self._prepare_once()
+            if name not in self._objects:
+                raise SchemaException(f'Object "{name}" is not defined')
+            obj = self._compile_item(j_object(self._objects[name]), name, "object")
+            self._compiled_objects[name] = obj
+        return obj
+
+    def _prepare_once(self) -> None:
+        if self._is_prepared:
+            return
+        if self._prepare_exception is not None:
+            raise self._prepare_exception
+        if self._is_compiled:
+            raise SchemaException(
+                "Schema already compiled (get_class and get_object cannot be used with"
+                " compile)"
+            )
+        if self.browser_mode:
+            raise SchemaException(
+                "The get_class and get_object methods are not supported in browser mode"
             )
+        if self.scope_extension_keys:
+            raise SchemaException(
+                "The get_class and get_object methods are not supported with the scope"
+                " extension keys option"
+            )
+        self._start_seconds = perf_counter()
 
-        return output
+        logger.info("Preparing schema")
+
+        try:
+            with self._thread_pool_context():
+                self._collecting_errors(self._prepare)
+        except Exception as e:
+            self._prepare_exception = e
+            raise
+        self._is_prepared = True
+
+    def _compile_item(self, item: JObject, item_name: str, kind: str) -> JObject:
+        """
+        Finish a copy of a prepared class or object, doing the steps of a full compile
+        for it alone. Prepared items are left unchanged, as profile closures are
+        computed from the unfinished objects.
+        """
+        items: JObject = {item_name: deep_copy_j_object(item)}
+
+        def finish() -> None:
+            self._validate_item_profiles_and_add_links(kind, items)
+            self._consolidate_profiles(kind, items)
+            self._verify_item_attributes_and_add_datetime(items, kind)
+            self._ensure_attributes_have_requirement([(items, kind)])
+            if self.runtime_mode:
+                remove_items_documentation(items)
+            _ = _finish_items(self._make_finish_context(), items, kind)
+
+        self._collecting_errors(finish)
+        return j_object(items[item_name])
+
+    def _collecting_errors[T](self, fn: Callable[[], T]) -> T:
+        """Call fn, returning its result. See _errors_collected."""
+        with self._errors_collected():
+            return fn()
+
+    @contextmanager
+    def _errors_collected(self) -> Generator[None]:
+        """
+        If errors are recorded in this context while collecting errors, raises a single
+        exception listing them, including the error leaving the context, if any.
+        """
+        first_error = len(self._errors)
+        try:
+            yield
+        except Exception as e:
+            if len(self._errors) > first_error:
+                # Later errors can be caused by the errors already recorded, so they are
+                # reported together
+                if isinstance(e, SchemaException):
+                    self._errors.append(str(e))
+                else:
+                    self._errors.append(f"{type(e).__name__}: {e}")
+                raise self._collected_errors_exception(first_error) from e
+            raise
+        if len(self._errors) > first_error:
+            raise self._collected_errors_exception(first_error)
+
+    def _collected_errors_exception(self, first_error: int) -> SchemaException:
+        errors = self._errors[first_error:]
+        logger.error("Compile failed with %d error(s)", len(errors))
+        return SchemaException(
+            f"Compile failed with {len(errors)} error(s):\n    " + "\n    ".join(errors)
+        )
+
+    @contextmanager
+    def _thread_pool_context(self) -> Generator[None]:
+        if self.threads == 1:
+            yield
+            return
+        logger.info("Using %d threads", self.threads)
+        self._thread_pool = ThreadPoolExecutor(self.threads)
+        try:
+            yield
+        finally:
+            self._thread_pool.shutdown(cancel_futures=True)
+            self._thread_pool = None
 
-    def _warning(self, message: str, *args: JValue | Path) -> None:
-        self._warning_count += 1
+    def _map[T, R](self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """
+        Map fn over items using the thread pool, if any. Results are yielded in the
+        order of items, and the first exception raised by fn (in item order) is raised
+        when its result is reached, so consuming the results behaves as if run serially.
+        """
+        if self._thread_pool is None:
+            return map(fn, items)
+        return self._thread_pool.map(fn, items)
+
+    def _for_each[T](self, fn: Callable[[T], None], items: Iterable[T]) -> None:
+        """Call fn for each of items using the thread pool, if any."""
+        for _ in self._map(fn, items):
+            pass
+
+    @property
+    def stats(self) -> CompileStats:
+        """Statistics of the compile, such as warning and file cache hit counts."""
+        caching_sources = [
+            source
+            for source in [self._schema_source, *self._extensions_sources]
+            if isinstance(source, CachingSource)
+        ]
+        self._stats.file_cache_hits = sum(s.hits for s in caching_sources)
+        self._stats.file_cache_misses = sum(s.misses for s in caching_sources)
+        return self._stats
+
+    @property
+    def manifest(self) -> JObject | None:
+        """
+        Content hash manifest of the compiled schema, if compiled with the
+        create_manifest option. See the manifest module.
+        """
+        return self._manifest
+
+    @property
+    def diagnostics(self) -> list[Diagnostic]:
+        """
+        Warnings and errors found during the compile, in the order found. Errors that
+        stop the compile without a diagnostic code, such as file read errors, are only
+        reported by the raised exception.
+        """
+        with self._stats_lock:
+            return list(self._diagnostics)
+
+    def _warning(
+        self,
+        message: str,
+        *args: JValue | Path,
+        code: DiagnosticCode,
+        item_kind: str | None = None,
+        item_name: str | None = None,
+        attribute: str | None = None,
+        path: Path | None = None,
+    ) -> None:
+        diagnostic = Diagnostic(
+            "warning", code, message % args, item_kind, item_name, attribute, path
+        )
+        with self._stats_lock:
+            self._stats.warning_count += 1
+            self._diagnostics.append(diagnostic)
         logger.warning(message, *args)
 
+    def _error(
+        self,
+        message: str,
+        path: Path,
+        *,
+        code: DiagnosticCode,
+        item_kind: str | None = None,
+        item_name: str | None = None,
+        attribute: str | None = None,
+    ) -> None:
+        """
+        Report an error found in the schema or extension directory at path. The error
+        is raised as a SchemaException, unless collecting errors, in which case it is
+        recorded and the caller continues, skipping the erroneous definition.
+        """
+        diagnostic = Diagnostic(
+            "error", code, message, item_kind, item_name, attribute, path
+        )
+        message = f"{message}: {path}"
+        with self._stats_lock:
+            self._diagnostics.append(diagnostic)
+            if not self.collect_errors:
+                raise SchemaException(message)
+            self._stats.error_count += 1
+            self._errors.append(message)
+        logger.error(message)
+
+    def _item_path(self, item: JObject) -> Path:
+        """Returns the base directory of the schema or extension defining item."""
+        extension_name = item.get("extension")
+        if isinstance(extension_name, str) and extension_name in self._extension_paths:
+            return self._extension_paths[extension_name]
+        return self.schema_path
+
+    def _validate_with_metaschema(self) -> None:
+        """
+        Validate every schema and extension file against the metaschema in the schema's
+        "metaschema" directory, before any compilation work. Files are validated in
+        threads when the threads option is used. All errors are reported together.
+        """
+        metaschema_path = self.schema_path / "metaschema"
+        metaschema = read_metaschema(self._schema_source, metaschema_path)
+        if metaschema is None:
+            self._warning(
+                "Skipping metaschema validation: metaschema directory does not exist:"
+                " %s",
+                metaschema_path,
+                code="metaschema-missing",
+                path=metaschema_path,
+            )
+            return
+
+        files = list(self._metaschema_files())
+        logger.info("Validating %d files against metaschema", len(files))
+
+        def validate(file: tuple[SchemaSource, Path, str]) -> list[Diagnostic]:
+            return self._validate_file_with_metaschema(metaschema, *file)
+
+        errors = [
+            error for file_errors in self._map(validate, files) for error in file_errors
+        ]
+        if errors:
+            with self._stats_lock:
+                self._diagnostics.extend(errors)
+            raise SchemaException(
+                f"Metaschema validation failed with {len(errors)} error(s):\n    "
+                + "\n    ".join(f"{error.path}: {error.message}" for error in errors)
+            )
+
+    def _metaschema_files(self) -> Iterator[tuple[SchemaSource, Path, str]]:
+        """
+        Yields the source, path, and metaschema file name of each schema and extension
+        file to validate.
+        """
+        yield from self._metaschema_files_in(self._schema_source, self.schema_path)
+        extension_bases: list[tuple[SchemaSource, Path]] = []
+        if not self.ignore_platform_extensions:
+            extension_bases.append(
+                (self._schema_source, self.schema_path / "extensions")
+            )
+        for source in self._extensions_sources:
+            extension_bases.append((source, source.root))
+        for source, base_path in extension_bases:
+            for dir_path, file_names in source.walk(base_path):
+                if "extension.json" in file_names:
+                    yield source, dir_path / "extension.json", "extension.schema.json"
+                    yield from self._metaschema_files_in(source, dir_path)
+
+    @staticmethod
+    def _metaschema_files_in(
+        source: SchemaSource, base_path: Path
+    ) -> Iterator[tuple[SchemaSource, Path, str]]:
+        for file_name in ["categories.json", "dictionary.json"]:
+            path = base_path / file_name
+            if source.is_file(path):
+                yield source, path, METASCHEMA_FILE_NAMES[file_name]
+        for kind in ["events", "objects", "profiles"]:
+            for dir_path, file_names in source.walk(base_path / kind):
+                for file_name in sorted(file_names):
+                    if file_name.endswith(".json"):
+                        yield source, dir_path / file_name, METASCHEMA_FILE_NAMES[kind]
+
+    @staticmethod
+    def _validate_file_with_metaschema(
+        metaschema: Metaschema, source: SchemaSource, path: Path, schema_name: str
+    ) -> list[Diagnostic]:
+        try:
+            obj = source.read_json_object(path)
+        except (ValueError, TypeError) as e:
+            errors = [str(e)]
+        else:
+            errors = metaschema.validate(schema_name, obj)
+        return [
+            Diagnostic("error", "metaschema-violation", error, path=path)
+            for error in errors
+        ]
+
     def _read_base_schema(self) -> None:
+        source = self._schema_source
         self._read_version()
-        self._categories = read_json_object_file(self.schema_path / "categories.json")
-        self._dictionary = read_json_object_file(self.schema_path / "dictionary.json")
+        categories_path = self.schema_path / "categories.json"
+        self._categories = source.read_json_object(categories_path)
+        validate_categories_shape(categories_path, self._categories)
+        dictionary_path = self.schema_path / "dictionary.json"
+        self._dictionary = source.read_json_object(dictionary_path)
+        validate_dictionary_shape(dictionary_path, self._dictionary)
         self._classes = read_structured_items(
+            source,
             self.schema_path,
             "events",
             item_callback_fn=self._upgrade_attribute_profiles,
         )
         self._objects = read_structured_items(
+            source,
             self.schema_path,
             "objects",
             item_callback_fn=self._upgrade_attribute_profiles,
         )
         self._base_profiles = read_structured_items(
-            self.schema_path, "profiles", item_callback_fn=self._cache_profile
+            source,
+            self.schema_path,
+            "profiles",
+            item_callback_fn=partial(self._cache_profile, source),
         )
         self._validate_base_profiles()
 
@@ -270,7 +1062,7 @@ class SchemaCompiler:
     def _read_version(self) -> None:
         version_path = self.schema_path / "version.json"
         try:
-            obj = read_json_object_file(version_path)
+            obj = self._schema_source.read_json_object(version_path)
             self._version = j_string(obj["version"])
         except FileNotFoundError as e:
             raise SchemaException(
@@ -308,8 +1100,10 @@ class SchemaCompiler:
                             attribute["profiles"] = [profile]
                         del attribute["profile"]
 
-    def _cache_profile(self, path: Path, profile: JObject) -> None:
-        self._include_cache[path] = profile
+    def _cache_profile(
+        self, source: SchemaSource, path: Path, profile: JObject
+    ) -> None:
+        self._include_cache[(source, path)] = profile
 
     def _validate_base_profiles(self) -> None:
         # Before potentially resolving includes of profiles and then later finding
@@ -372,26 +1166,37 @@ class SchemaCompiler:
         extensions: list[Extension] = []
         if not self.ignore_platform_extensions:
             self._read_extensions_in_path(
-                extensions, self.schema_path / "extensions", is_platform_extension=True
+                extensions,
+                self._schema_source,
+                self.schema_path / "extensions",
+                is_platform_extension=True,
+            )
+        for extensions_source in self._extensions_sources:
+            self._read_extensions_in_path(
+                extensions,
+                extensions_source,
+                extensions_source.root,
+                is_platform_extension=False,
             )
-        if self.extensions_paths:
-            for extensions_path in self.extensions_paths:
-                self._read_extensions_in_path(
-                    extensions, extensions_path, is_platform_extension=False
-                )
 
+        for extension in extensions:
+            self._extension_paths[extension.name] = extension.base_path
         self._enrich_extension_items(extensions)
         return extensions
 
     def _read_extensions_in_path(
-        self, extensions: list[Extension], base_path: Path, is_platform_extension: bool
+        self,
+        extensions: list[Extension],
+        source: SchemaSource,
+        base_path: Path,
+        is_platform_extension: bool,
     ) -> None:
-        for dir_path, _dir_names, file_names in os.walk(base_path, topdown=False):
+        for dir_path, file_names in source.walk(base_path):
             for file_name in file_names:
                 if file_name == "extension.json":
                     # we found an extension at dir_path
                     extension = self._read_extension(
-                        Path(dir_path), is_platform_extension
+                        source, dir_path, is_platform_extension
                     )
                     extensions.append(extension)
                     if is_platform_extension:
@@ -408,7 +1213,7 @@ class SchemaCompiler:
                         )
 
     def _read_extension(
-        self, base_path: Path, is_platform_extension: bool
+        self, source: SchemaSource, base_path: Path, is_platform_extension: bool
     ) -> Extension:
         if is_platform_extension:
             logger.info("Reading platform extension directory: %s", base_path)
@@ -417,7 +1222,7 @@ class SchemaCompiler:
         # This should only be called after we know that extension.json exists in
         # base_path, so there's no need for extra error handling.
         extension_info_path = base_path / "extension.json"
-        info = read_json_object_file(extension_info_path)
+        info = source.read_json_object(extension_info_path)
 
         uid = info.get("uid")
         name = info.get("name")
@@ -435,26 +1240,37 @@ class SchemaCompiler:
             )
 
         categories_path = base_path / "categories.json"
-        if categories_path.is_file():
-            categories = read_json_object_file(categories_path)
+        if source.is_file(categories_path):
+            categories = source.read_json_object(categories_path)
+            validate_categories_shape(categories_path, categories)
         else:
             categories = {}
 
         classes, class_patches = read_patchable_structured_items(
-            base_path, "events", item_callback_fn=self._upgrade_attribute_profiles
+            source,
+            base_path,
+            "events",
+            item_callback_fn=self._upgrade_attribute_profiles,
         )
         objects, object_patches = read_patchable_structured_items(
-            base_path, "objects", item_callback_fn=self._upgrade_attribute_profiles
+            source,
+            base_path,
+            "objects",
+            item_callback_fn=self._upgrade_attribute_profiles,
         )
 
         dictionary_path = base_path / "dictionary.json"
-        if dictionary_path.is_file():
-            dictionary = read_json_object_file(base_path / "dictionary.json")
+        if source.is_file(dictionary_path):
+            dictionary = source.read_json_object(dictionary_path)
+            validate_dictionary_shape(dictionary_path, dictionary)
         else:
             dictionary = {}
 
         profiles = read_structured_items(
-            base_path, "profiles", item_callback_fn=self._cache_profile
+            source,
+            base_path,
+            "profiles",
+            item_callback_fn=partial(self._cache_profile, source),
         )
 
         if is_platform_extension and "version" not in info:
@@ -470,6 +1286,7 @@ class SchemaCompiler:
             )
 
         return Extension(
+            source=source,
             base_path=base_path,
             uid=uid,
             name=name,
@@ -556,7 +1373,7 @@ class SchemaCompiler:
             for profile_name, profile in extension.profiles.items():
                 profile = j_object(profile)
                 profile_attributes = j_object(profile.get("attributes", {}))
-                for attribute_name in profile_attributes.keys():
+                for attribute_name in list(profile_attributes):
                     if (
                         attribute_name not in base_dictionary_attributes
                         and attribute_name not in ext_dictionary_attributes
@@ -577,13 +1394,24 @@ class SchemaCompiler:
                                 " attribute.\n\n    PLEASE FIX by removing the unused"
                                 ' "splunk" profile.\n',
                                 attribute_name,
+                                code="known-issue",
+                                item_kind="profile",
+                                item_name=profile_name,
+                                attribute=attribute_name,
+                                path=extension.base_path,
                             )
                         else:
-                            raise SchemaException(
+                            self._error(
                                 f'Attribute "{attribute_name}" in extension'
                                 f' "{extension.name}" profile "{profile_name}" is not a'
-                                " defined dictionary attribute"
+                                " defined dictionary attribute",
+                                extension.base_path,
+                                code="undefined-attribute",
+                                item_kind="profile",
+                                item_name=profile_name,
+                                attribute=attribute_name,
                             )
+                            del profile_attributes[attribute_name]
 
     def _fix_extension_profile_uses(self, extension: Extension) -> None:
         self._fix_extension_profile_uses_in_items(extension, extension.classes, "class")
@@ -609,11 +1437,15 @@ class SchemaCompiler:
                 profiles_context = f'{item_context} "profiles"'
                 fixed_item_profiles: JArray = []
                 for profile_name in item_profiles:
-                    fixed_item_profiles.append(
-                        self._fix_extension_profile(
-                            extension, j_string(profile_name), profiles_context
-                        )
+                    fixed_profile_name = self._fix_extension_profile(
+                        extension,
+                        j_string(profile_name),
+                        profiles_context,
+                        kind,
+                        item_name,
                     )
+                    if fixed_profile_name is not None:
+                        fixed_item_profiles.append(fixed_profile_name)
                 item["profiles"] = fixed_item_profiles
 
             item_attributes = j_object(item.setdefault("attributes", {}))
@@ -625,9 +1457,16 @@ class SchemaCompiler:
                         attribute_context = (
                             f'{item_context} attribute "{attribute_name}"'
                         )
-                        attribute["profile"] = self._fix_extension_profile(
-                            extension, profile_name, attribute_context
+                        fixed_profile_name = self._fix_extension_profile(
+                            extension,
+                            profile_name,
+                            attribute_context,
+                            kind,
+                            item_name,
+                            attribute_name,
                         )
+                        if fixed_profile_name is not None:
+                            attribute["profile"] = fixed_profile_name
                 else:
                     attribute_profiles = j_array_optional(attribute.get("profiles"))
                     if attribute_profiles:
@@ -636,38 +1475,61 @@ class SchemaCompiler:
                         )
                         fixed_attribute_profiles: JArray = []
                         for profile_name in attribute_profiles:
-                            fixed_attribute_profiles.append(
-                                self._fix_extension_profile(
-                                    extension, j_string(profile_name), attribute_context
-                                )
+                            fixed_profile_name = self._fix_extension_profile(
+                                extension,
+                                j_string(profile_name),
+                                attribute_context,
+                                kind,
+                                item_name,
+                                attribute_name,
                             )
+                            if fixed_profile_name is not None:
+                                fixed_attribute_profiles.append(fixed_profile_name)
                         attribute["profiles"] = fixed_attribute_profiles
 
     def _fix_extension_profile(
-        self, extension: Extension, profile_name: str, context: str
-    ) -> str:
+        self,
+        extension: Extension,
+        profile_name: str,
+        context: str,
+        kind: str,
+        item_name: str,
+        attribute_name: str | None = None,
+    ) -> str | None:
         """
-        Validates a profile reference used in an extension. Raises a SchemaException
-        if validation fails.
+        Validates a profile reference used in an extension by the item_name item of
+        kind, or its attribute_name attribute. Reports an error if validation fails,
+        returning None when collecting errors.
         Returns fixed profile name, adding extension-scope to name if not already
         scoped.
         """
+        error = partial(
+            self._error,
+            code="undefined-profile",
+            item_kind=kind,
+            item_name=item_name,
+            attribute=attribute_name,
+        )
         if "/" in profile_name:
             split = profile_name.split("/")
             extension_name = split[0]
             if extension_name != extension.name:
-                raise SchemaException(
+                error(
                     f'{context} references profile "{profile_name}" that is scoped'
-                    f' to a different extension: "{extension_name}"'
+                    f' to a different extension: "{extension_name}"',
+                    extension.base_path,
                 )
+                return None
             unscoped_profile_name = split[1]
             if unscoped_profile_name in extension.profiles:
                 logger.debug('%s uses scoped profile "%s"', context, profile_name)
             else:
-                raise SchemaException(
+                error(
                     f'{context} references profile "{profile_name}" that is'
-                    f" undefined in this extension and is not a platform extension"
+                    f" undefined in this extension and is not a platform extension",
+                    extension.base_path,
                 )
+                return None
         else:
             if profile_name in extension.profiles:
                 # This is normal - an extension's use of its own profiles are not
@@ -686,72 +1548,55 @@ class SchemaCompiler:
                 # This is fine
                 logger.debug('%s uses base schema profile "%s"', context, profile_name)
             else:
-                raise SchemaException(
+                error(
                     f'{context} references profile "{profile_name}" that is not'
-                    " defined in this extension or the base schema"
+                    " defined in this extension or the base schema",
+                    extension.base_path,
                 )
+                return None
         return profile_name
 
     def _resolve_includes(self) -> None:
-        for cls in self._classes.values():
-            cls = j_object(cls)
+        def resolve(kind: str, item: JObject) -> None:
             self._resolve_item_includes(
-                cls,
-                f'class "{cls.get("name")}"',
-                self._resolver_include_path,
-            )
-        for obj in self._objects.values():
-            obj = j_object(obj)
-            self._resolve_item_includes(
-                obj,
-                f'object "{obj.get("name")}"',
-                self._resolver_include_path,
+                item, f'{kind} "{item.get("name")}"', self._resolver_include_path
             )
 
-    def _resolver_include_path(self, file_name: str) -> Path:
-        return self.schema_path / file_name
+        self._for_each(partial(resolve, "class"), map(j_object, self._classes.values()))
+        self._for_each(
+            partial(resolve, "object"), map(j_object, self._objects.values())
+        )
+
+    def _resolver_include_path(self, file_name: str) -> tuple[SchemaSource, Path]:
+        return self._schema_source, self.schema_path / file_name
 
     def _resolve_extension_includes(self, extensions: list[Extension]) -> None:
         for extension in extensions:
 
-            def path_resolver(file_name: str) -> Path:
+            def path_resolver(file_name: str) -> tuple[SchemaSource, Path]:
                 return self._resolve_extension_include_path(extension, file_name)
 
-            for cls in extension.classes.values():
-                cls = j_object(cls)
-                context = f'extension "{extension.name}" class "{cls.get("name")}"'
-                self._resolve_item_includes(cls, context, path_resolver)
-
-            for cls_patch in extension.class_patches.values():
-                cls_patch = j_object(cls_patch)
-                context = (
-                    f'extension "{extension.name}" class patch'
-                    f' "{cls_patch.get("name")}"'
-                )
-                self._resolve_item_includes(cls_patch, context, path_resolver)
-
-            for obj in extension.objects.values():
-                obj = j_object(obj)
-                context = f'extension "{extension.name}" object "{obj.get("name")}"'
-                self._resolve_item_includes(obj, context, path_resolver)
+            def resolve(kind: str, item: JObject) -> None:
+                context = f'extension "{extension.name}" {kind} "{item.get("name")}"'
+                self._resolve_item_includes(item, context, path_resolver)
 
-            for obj_patch in extension.object_patches.values():
-                obj_patch = j_object(obj_patch)
-                context = (
-                    f'extension "{extension.name}" object patch'
-                    f' "{obj_patch.get("name")}"'
-                )
-                self._resolve_item_includes(obj_patch, context, path_resolver)
+            for kind, items in [
+                ("class", extension.classes),
+                ("class patch", extension.class_patches),
+                ("object", extension.objects),
+                ("object patch", extension.object_patches),
+            ]:
+                self._for_each(partial(resolve, kind), map(j_object, items.values()))
 
     def _resolve_extension_include_path(
         self, extension: Extension, file_name: str
-    ) -> Path:
+    ) -> tuple[SchemaSource, Path]:
         extension_path = extension.base_path / file_name
-        if extension_path.is_file():
-            return extension_path
+        if extension.source.is_file(extension_path):
+            return extension.source, extension_path
         path = self.schema_path / file_name
-        if path.is_file():
-            return path
+        if self._schema_source.is_file(path):
+            return self._schema_source, path
         raise FileNotFoundError(
             f'Extension "{extension.name}" "$include" {file_name} not found in'
             f" extension directory {extension.base_path} or schema directory"
@@ -762,7 +1607,7 @@ class SchemaCompiler:
         self,
         item: JObject,
         context: str,
-        path_resolver: Callable[[str], Path],
+        path_resolver: Callable[[str], tuple[SchemaSource, Path]],
     ) -> None:
         item_attributes = j_object(item.setdefault("attributes", {}))
 
@@ -798,12 +1643,14 @@ class SchemaCompiler:
             # Get $include value and remove it from item attributes
             include_value = item_attributes.pop("$include")
             if isinstance(include_value, str):
-                include_path = path_resolver(include_value)
-                self._merge_attributes_include(item, sub_context, include_path)
+                source, include_path = path_resolver(include_value)
+                self._merge_attributes_include(item, sub_context, source, include_path)
             elif isinstance(include_value, list):
                 for include_file_name in include_value:
-                    include_path = path_resolver(j_string(include_file_name))
-                    self._merge_attributes_include(item, sub_context, include_path)
+                    source, include_path = path_resolver(j_string(include_file_name))
+                    self._merge_attributes_include(
+                        item, sub_context, source, include_path
+                    )
             else:
                 raise TypeError(
                     f"Illegal {sub_context} value type:"
@@ -848,12 +1695,13 @@ class SchemaCompiler:
                 # Get $include value and remove it from attribute
                 include_value = attribute.pop("$include")
                 if isinstance(include_value, str):
-                    include_path = path_resolver(include_value)
+                    source, include_path = path_resolver(include_value)
                     self._merge_attribute_detail_include(
                         item_attributes,
                         attribute_name,
                         attribute,
                         sub_context,
+                        source,
                         include_path,
                     )
                 else:
@@ -863,15 +1711,18 @@ class SchemaCompiler:
                     )
 
     def _merge_attributes_include(
-        self, item: JObject, context: str, include_path: Path
+        self, item: JObject, context: str, source: SchemaSource, include_path: Path
     ) -> None:
-        include_item = self._get_include_contents(context, include_path)
+        include_item = self._get_include_contents(context, source, include_path)
 
         # Include file content should always have "attributes", but we will be
         # defensive.
         if "attributes" not in include_item:
             self._warning(
-                "Include file suspiciously has no attributes: %s", include_path
+                "Include file suspiciously has no attributes: %s",
+                include_path,
+                code="empty-include",
+                path=include_path,
             )
             # Nothing to merge. This should never happen (because it does nothing),
             # but is possible.
@@ -880,8 +1731,21 @@ class SchemaCompiler:
         # Create merged attributes by merging item's attributes on top of included
         # attributes resulting in merge with base of included attributes, overridden by
         # item's.
-
-        attributes = deep_copy_j_object(j_object(include_item["attributes"]))
+        #
+        # Included content is shared by every item including it, so it is never
+        # modified. Only the attribute details are copied here, as these are what the
+        # including item changes; nested values stay shared with the include, and are
+        # replaced rather than modified by later merges (see _merge_attribute_detail).
+        # Nested values still in items when finishing are copied then (see
+        # _copy_included_values).
+
+        attributes: JObject = {
+            attribute_name: dict(j_object(attribute))
+            for attribute_name, attribute in j_object(
+                include_item["attributes"]
+            ).items()
+        }
+        self._add_included_value_ids(attributes.values())
 
         # First do profile-specific enrichment if include is a profile, and annotation
         # enrichment for all include cases (even though currently only profiles use
@@ -922,35 +1786,47 @@ class SchemaCompiler:
         attribute_name: str,
         attribute: JObject,
         context: str,
+        source: SchemaSource,
         include_path: Path,
     ) -> None:
-        include_attribute = self._get_include_contents(context, include_path)
+        include_attribute = self._get_include_contents(context, source, include_path)
 
         # Create merged attribute detail for attributes.{attribute_name} by merging item
         # attribute's details on top of included attribute details resulting in merge
-        # with base of included details overridden by item's.
-
-        new_attribute = deep_copy_j_object(include_attribute)
-
-        # Merge original attribute detail on top of the copy of the included
-        # attribute_detail, preferring the original
-        deep_merge(new_attribute, attribute)
+        # with base of included details overridden by item's. Included content that the
+        # merge does not change is shared rather than copied, until finishing (see
+        # _copy_included_values).
+        self._add_included_value_ids([include_attribute])
 
         # replace existing attribute detail with the new merged detail
-        attributes[attribute_name] = new_attribute
+        attributes[attribute_name] = copy_merge(include_attribute, attribute)
 
-    def _get_include_contents(self, context: str, include_path: Path) -> JObject:
-        if include_path in self._include_cache:
-            return self._include_cache[include_path]
+    def _add_included_value_ids(self, attributes: Iterable[JValue]) -> None:
+        ids: set[int] = set()
+        for attribute in attributes:
+            _add_nested_container_ids(j_object(attribute), ids)
+        with self._include_cache_lock:
+            self._included_value_ids.update(ids)
 
+    def _get_include_contents(
+        self, context: str, source: SchemaSource, include_path: Path
+    ) -> JObject:
+        key = (source, include_path)
+        with self._include_cache_lock:
+            if key in self._include_cache:
+                return self._include_cache[key]
+
+        # Read without holding the lock. If threads race to read the same file, the
+        # first one stored wins, so all includers share the same contents.
         try:
-            include_item = read_json_object_file(include_path)
-            self._include_cache[include_path] = include_item
-            return include_item
+            include_item = source.read_json_object(include_path)
         except FileNotFoundError as e:
             raise SchemaException(
                 f"{context} file does not exist: {include_path}"
             ) from e
+        validate_include_shape(include_path, include_item)
+        with self._include_cache_lock:
+            return self._include_cache.setdefault(key, include_item)
 
     def _merge_categories_from_extensions(self, extensions: list[Extension]) -> None:
         for extension in extensions:
@@ -962,14 +1838,14 @@ class SchemaCompiler:
         for extension in extensions:
             if extension.classes:
                 self._merge_extension_items(
-                    extension.name, extension.classes, self._classes, "class"
+                    extension, extension.classes, self._classes, "class"
                 )
 
     def _merge_objects_from_extensions(self, extensions: list[Extension]) -> None:
         for extension in extensions:
             if extension.objects:
                 self._merge_extension_items(
-                    extension.name, extension.objects, self._objects, "object"
+                    extension, extension.objects, self._objects, "object"
                 )
 
     def _merge_dictionary_from_extensions(self, extensions: list[Extension]) -> None:
@@ -990,10 +1866,15 @@ class SchemaCompiler:
                 for unscoped_profile_name, profile in extension.profiles.items():
                     profile = j_object(profile)
                     if "/" in unscoped_profile_name:
-                        raise SchemaException(
+                        self._error(
                             f'Unexpected scoped profile name in "{extension.name}"'
-                            f' profile "{unscoped_profile_name}"'
+                            f' profile "{unscoped_profile_name}"',
+                            extension.base_path,
+                            code="invalid-profile-name",
+                            item_kind="profile",
+                            item_name=unscoped_profile_name,
                         )
+                        continue
 
                     if unscoped_profile_name in self._unscoped_profiles_info:
                         other_profile_info = self._unscoped_profiles_info[
@@ -1005,24 +1886,34 @@ class SchemaCompiler:
                             )
                         else:
                             where_defined = "base scheme"
-                        raise SchemaException(
+                        self._error(
                             f'Collision: extension "{extension.name}" profile unscoped'
                             f' name "{unscoped_profile_name}" collides with'
                             f" {where_defined} profile with caption"
-                            f' "{other_profile_info.caption}"'
+                            f' "{other_profile_info.caption}"',
+                            extension.base_path,
+                            code="collision",
+                            item_kind="profile",
+                            item_name=unscoped_profile_name,
                         )
+                        continue
 
                     scoped_profile_name = f"{extension.name}/{unscoped_profile_name}"
                     if scoped_profile_name in self._extension_profiles:
                         other_profile = j_object(
                             self._extension_profiles[scoped_profile_name]
                         )
-                        raise SchemaException(
+                        self._error(
                             f'Collision: extension "{extension.name}" profile'
                             f' "{scoped_profile_name}" collides with extension profile'
                             f" with caption"
-                            f' "{other_profile.get("caption", "<no caption>")}"'
+                            f' "{other_profile.get("caption", "<no caption>")}"',
+                            extension.base_path,
+                            code="collision",
+                            item_kind="profile",
+                            item_name=scoped_profile_name,
                         )
+                        continue
 
                     self._extension_profiles[scoped_profile_name] = profile
                     self._unscoped_profiles_info[unscoped_profile_name] = ProfileInfo(
@@ -1070,13 +1961,18 @@ class SchemaCompiler:
                     # This is not allowed as the result is non-deterministic, depending
                     # on the order the extensions are processed. We have no notion of
                     # extension precedence, so this is not supported.
-                    raise SchemaException(
+                    self._error(
                         f'Collision: extension "{extension.name}" {kind} attribute'
                         f' "{ext_attribute_name}" collides with attribute from'
                         f' extension "{base_attribute["extension"]}"; extensions are'
                         f" not allowed to modify each other as the results are"
-                        f" non-deterministic"
+                        f" non-deterministic",
+                        extension.base_path,
+                        code="collision",
+                        item_kind=kind,
+                        attribute=ext_attribute_name,
                     )
+                    continue
 
                 # Second check for a type change. This is not supported as it creates a
                 # schema that is not compatible with the base schema.
@@ -1094,12 +1990,17 @@ class SchemaCompiler:
                                 ' but should be "long_t"'
                             )
                         else:
-                            raise SchemaException(
+                            self._error(
                                 f'Extension "{extension.name}" {kind} attribute'
                                 f' "{ext_attribute_name}" attempted to make unsafe type'
                                 f'  change; "{ext_attribute["type"]}" overwriting'
-                                f' existing "{base_attribute["type"]}"'
+                                f' existing "{base_attribute["type"]}"',
+                                extension.base_path,
+                                code="unsafe-change",
+                                item_kind=kind,
+                                attribute=ext_attribute_name,
                             )
+                            continue
                     if (
                         ext_attribute["type"] == "object_t"
                         # no need to check if base_attribute["type"] == "object_t"
@@ -1107,12 +2008,17 @@ class SchemaCompiler:
                         and ext_attribute["object_type"]
                         != base_attribute["object_type"]
                     ):
-                        raise SchemaException(
+                        self._error(
                             f'Extension "{extension.name}" {kind} attribute'
                             f' "{ext_attribute_name}" attempted to make unsafe object'
                             f' type change; "{ext_attribute["object_type"]}"'
-                            f' overwriting existing "{base_attribute["object_type"]}"'
+                            f' overwriting existing "{base_attribute["object_type"]}"',
+                            extension.base_path,
+                            code="unsafe-change",
+                            item_kind=kind,
+                            attribute=ext_attribute_name,
                         )
+                        continue
 
                 # Third, check if the attribute's requirement is being relaxed. This is
                 # not supported as it creates a schema that is incompatible with the
@@ -1120,12 +2026,17 @@ class SchemaCompiler:
                 ext_req = j_string_optional(ext_attribute.get("requirement"))
                 base_req = j_string_optional(base_attribute.get("requirement"))
                 if requirement_to_rank(ext_req) < requirement_to_rank(base_req):
-                    raise SchemaException(
+                    self._error(
                         f'Extension "{extension.name}" {kind} attribute'
                         f' "{ext_attribute_name}" attempted to make unsafe requirement'
                         f" change with {quote_string(ext_req)} reducing existing"
-                        f" requirement of {quote_string(base_req)}"
+                        f" requirement of {quote_string(base_req)}",
+                        extension.base_path,
+                        code="unsafe-change",
+                        item_kind=kind,
+                        attribute=ext_attribute_name,
                     )
+                    continue
 
                 # TODO: Safely handle enum merges
                 # Other changes are safe. So merge.
@@ -1197,18 +2108,21 @@ class SchemaCompiler:
                         )
                         deep_merge(base_attribute, ext_attribute)
                     else:
-                        raise SchemaException(
+                        self._error(
                             f'Collision: extension "{extension.name}" {kind} dictionary'
                             f' type "{ext_attribute_name}" is trying to overwrite'
                             f" {base_desc} type; modifying dictionary types is not"
-                            f" supported"
+                            f" supported",
+                            extension.base_path,
+                            code="collision",
+                            item_kind=f"{kind} type",
+                            attribute=ext_attribute_name,
                         )
                 else:
                     base_types_attributes[ext_attribute_name] = ext_attribute
 
-    @staticmethod
     def _merge_extension_items(
-        extension_name: str, extension_items: JObject, items: JObject, kind: str
+        self, extension: Extension, extension_items: JObject, items: JObject, kind: str
     ) -> None:
         for ext_item_name, ext_item in extension_items.items():
             if ext_item_name in items:
@@ -1217,11 +2131,16 @@ class SchemaCompiler:
                     item_kind = f'extension "{item["extension"]}" {kind}'
                 else:
                     item_kind = f"base schema {kind}"
-                raise SchemaException(
-                    f'Collision: extension "{extension_name}" {kind} "{ext_item_name}"'
+                self._error(
+                    f'Collision: extension "{extension.name}" {kind} "{ext_item_name}"'
                     f" collides with {item_kind} with caption"
-                    f' "{item.get("caption", "")}"'
+                    f' "{item.get("caption", "")}"',
+                    extension.base_path,
+                    code="collision",
+                    item_kind=kind,
+                    item_name=ext_item_name,
                 )
+                continue
             items[ext_item_name] = ext_item
 
     def _consolidate_extension_patches(self, extensions: list[Extension]) -> None:
@@ -1435,33 +2354,168 @@ class SchemaCompiler:
             if not is_hidden_object(name)
         }
 
+    def _select_items(self) -> None:
+        """
+        Check the selected profiles, then remove the classes not selected by the
+        classes and categories options, if given, and the objects and dictionary
+        attributes not used by the remaining classes (or by the selected profiles in
+        browser mode, where profile attributes are output), so the remaining steps
+        only work on the selected subset of the schema.
+
+        This is done after resolving patches and "extends" inheritance, so classes and
+        objects have all of their attributes, and before anything else is done with
+        the dictionary.
+        """
+        all_profiles = self._base_profiles | self._extension_profiles
+        for profile_name in self.profiles or []:
+            if profile_name not in all_profiles:
+                raise SchemaException(
+                    f'Selected profile "{profile_name}" is not defined'
+                )
+
+        if not (self.classes or self.categories):
+            # Selecting profiles only limits the profiles in the output (see
+            # _remove_unselected_profiles), so all classes and objects are kept
+            return
+
+        selected_classes = set(self.classes or [])
+        for cls_name in selected_classes:
+            if cls_name not in self._classes:
+                raise SchemaException(f'Selected class "{cls_name}" is not defined')
+        selected_categories = set(self.categories or [])
+        categories = j_object(self._categories.setdefault("attributes", {}))
+        for category_name in selected_categories:
+            if category_name not in categories:
+                raise SchemaException(
+                    f'Selected category "{category_name}" is not defined'
+                )
+        # The base_event class is always kept, as it is needed in browser mode and
+        # output on its own in legacy mode
+        self._classes = {
+            name: cls
+            for name, cls in self._classes.items()
+            if name == "base_event"
+            or name in selected_classes
+            or j_object(cls).get("category") in selected_categories
+        }
+
+        # Walk the attributes of the classes, and of the objects they use, transitively
+        dictionary_attributes = j_object(self._dictionary.setdefault("attributes", {}))
+        used_attributes: set[str] = set()
+        used_objects: set[str] = set()
+        walk = [j_object(cls) for cls in self._classes.values()]
+        if self.browser_mode:
+            walk.extend(
+                j_object(all_profiles[name]) for name in self.profiles or all_profiles
+            )
+        while walk:
+            item = walk.pop()
+            for attribute_name in j_object(item.get("attributes", {})):
+                if attribute_name in used_attributes:
+                    continue
+                used_attributes.add(attribute_name)
+                # Undefined attributes are reported later
+                attribute = j_object_optional(dictionary_attributes.get(attribute_name))
+                if attribute is None:
+                    continue
+                # Object types were set by _enrich_dictionary_object_types
+                object_type = j_string_optional(attribute.get("object_type"))
+                if (
+                    object_type
+                    and object_type not in used_objects
+                    and object_type in self._objects
+                ):
+                    used_objects.add(object_type)
+                    walk.append(j_object(self._objects[object_type]))
+
+        self._objects = {
+            name: obj for name, obj in self._objects.items() if name in used_objects
+        }
+        self._dictionary["attributes"] = {
+            name: attribute
+            for name, attribute in dictionary_attributes.items()
+            if name in used_attributes
+        }
+        logger.info(
+            "Selected %d classes, %d objects, and %d dictionary attributes",
+            len(self._classes),
+            len(self._objects),
+            len(j_object(self._dictionary["attributes"])),
+        )
+
+    def _remove_unselected_profiles(self) -> None:
+        # Done after the profiles of classes and objects are validated, as classes and
+        # objects can use profiles that are not selected
+        selected_profiles = set(self.profiles or [])
+        self._base_profiles = {
+            name: profile
+            for name, profile in self._base_profiles.items()
+            if name in selected_profiles
+        }
+        self._extension_profiles = {
+            name: profile
+            for name, profile in self._extension_profiles.items()
+            if name in selected_profiles
+        }
+
     def _observables_from_classes(self) -> None:
         """Detect observable collisions and build up information for schema browser."""
-        for cls_name, cls in self._classes.items():
-            cls = j_object(cls)
-            context = "base schema"
-            self._validate_class_observables(
-                cls_name, cls, "base schema", is_patch=False
-            )
-            self._observables_from_item_attributes(
-                self._classes, cls_name, cls, "Class", context, is_patch=False
-            )
-            self._observables_from_item_observables(
-                self._classes, cls_name, cls, "Class", context, is_patch=False
+
+        def from_class(name_and_class: tuple[str, JValue]) -> list[Observable]:
+            cls_name, cls = name_and_class
+            return self._class_observables(
+                cls_name, j_object(cls), "base schema", is_patch=False
             )
 
-        for patch_name, patch_list in self._class_patches.items():
-            for patch in patch_list:
-                context = f'"{patch["extension"]}" extension patch'
-                self._validate_class_observables(
-                    patch_name, patch, context, is_patch=True
-                )
-                self._observables_from_item_attributes(
-                    self._classes, patch_name, patch, "Class", context, is_patch=True
-                )
-                self._observables_from_item_observables(
-                    self._classes, patch_name, patch, "Class", context, is_patch=True
+        def from_patch(name_and_patch: tuple[str, JObject]) -> list[Observable]:
+            patch_name, patch = name_and_patch
+            context = f'"{patch["extension"]}" extension patch'
+            return self._class_observables(patch_name, patch, context, is_patch=True)
+
+        for observables in self._map(from_class, self._classes.items()):
+            self._add_observables(observables)
+        for observables in self._map(
+            from_patch, self._patches(self._class_patches, self._classes)
+        ):
+            self._add_observables(observables)
+
+    def _class_observables(
+        self, cls_name: str, cls: JObject, context: str, is_patch: bool
+    ) -> list[Observable]:
+        self._validate_class_observables(cls_name, cls, context, is_patch)
+        return [
+            *self._observables_from_item_attributes(
+                self._classes, cls_name, cls, "Class", context, is_patch
+            ),
+            *self._observables_from_item_observables(
+                self._classes, cls_name, cls, "Class", context, is_patch
+            ),
+        ]
+
+    @staticmethod
+    def _patches(patch_dict: PatchDict, items: JObject) -> list[tuple[str, JObject]]:
+        # Patches of undefined items are skipped; they are reported when resolving
+        # patches
+        return [
+            (patch_name, patch)
+            for patch_name, patch_list in patch_dict.items()
+            if patch_name in items
+            for patch in patch_list
+        ]
+
+    def _add_observables(self, observables: list[Observable]) -> None:
+        for observable in observables:
+            if observable.type_id in self._observable_type_id_dict:
+                entry = j_object(self._observable_type_id_dict[observable.type_id])
+                self._error(
+                    f"Collision of observable type_id {observable.type_id} between"
+                    f' {observable.source} and "{entry["caption"]}":'
+                    f" {entry['description']}",
+                    observable.path,
+                    code="observable-collision",
                 )
+                continue
+            self._observable_type_id_dict[observable.type_id] = observable.entry
 
     @staticmethod
     def _validate_class_observables(
@@ -1499,33 +2553,36 @@ class SchemaCompiler:
 
     def _observables_from_objects(self) -> None:
         """Detect observable collisions and build up information for schema browser."""
-        context = "base schema"
-        for obj_name, obj in self._objects.items():
-            obj = j_object(obj)
-            self._validate_object_observables(
-                obj_name, obj, "base schema", is_patch=False
-            )
-            self._observables_from_object(obj_name, obj, context)
-            self._observables_from_item_attributes(
-                self._objects, obj_name, obj, "Object", context, is_patch=False
+
+        def from_object(name_and_object: tuple[str, JValue]) -> list[Observable]:
+            obj_name, obj = name_and_object
+            return self._object_observables(
+                obj_name, j_object(obj), "base schema", is_patch=False
             )
-            # Not supported:
-            # self._observables_from_item_observables(self._objects, obj_name, obj,
-            #     "Object", context, is_patch=False)
 
-        for patch_name, patch_list in self._object_patches.items():
-            for patch in patch_list:
-                context = f'extension "{patch["extension"]}" patch'
-                self._validate_object_observables(
-                    patch_name, patch, context, is_patch=True
-                )
-                self._observables_from_object(patch_name, patch, context)
-                self._observables_from_item_attributes(
-                    self._objects, patch_name, patch, "Object", context, is_patch=True
-                )
-                # Not supported:
-                # self._observables_from_item_observables(self._objects, patch_name,
-                #     patch, "Object", context, is_patch=True)
+        def from_patch(name_and_patch: tuple[str, JObject]) -> list[Observable]:
+            patch_name, patch = name_and_patch
+            context = f'extension "{patch["extension"]}" patch'
+            return self._object_observables(patch_name, patch, context, is_patch=True)
+
+        for observables in self._map(from_object, self._objects.items()):
+            self._add_observables(observables)
+        for observables in self._map(
+            from_patch, self._patches(self._object_patches, self._objects)
+        ):
+            self._add_observables(observables)
+
+    def _object_observables(
+        self, obj_name: str, obj: JObject, context: str, is_patch: bool
+    ) -> list[Observable]:
+        self._validate_object_observables(obj_name, obj, context, is_patch)
+        # Not supported: observables from item "observables" (attribute paths)
+        return [
+            *self._observables_from_object(obj_name, obj, context),
+            *self._observables_from_item_attributes(
+                self._objects, obj_name, obj, "Object", context, is_patch
+            ),
+        ]
 
     @staticmethod
     def _validate_object_observables(
@@ -1565,21 +2622,20 @@ class SchemaCompiler:
 
     def _observables_from_object(
         self, obj_name: str, obj: JObject, context: str
-    ) -> None:
+    ) -> list[Observable]:
         caption, description = self._find_item_caption_and_description(
-            self._objects, obj_name, obj
+            self._objects, obj_name, obj, "Object"
         )
-        if "observable" in obj:
-            observable_type_id = str(obj["observable"])
-            if observable_type_id in self._observable_type_id_dict:
-                entry = j_object(self._observable_type_id_dict[observable_type_id])
-                raise SchemaException(
-                    f"Collision of observable type_id {observable_type_id} between"
-                    f' {context} "{caption}" object "observable" and'
-                    f' "{entry["caption"]}": {entry["description"]}'
-                )
-            entry = self._make_observable_enum_entry(caption, description, "Object")
-            self._observable_type_id_dict[observable_type_id] = entry
+        if "observable" not in obj:
+            return []
+        return [
+            Observable(
+                str(obj["observable"]),
+                self._make_observable_enum_entry(caption, description, "Object"),
+                f'{context} "{caption}" object "observable"',
+                self._item_path(obj),
+            )
+        ]
 
     def _observables_from_item_attributes(
         self,
@@ -1589,35 +2645,36 @@ class SchemaCompiler:
         kind: str,
         context: str,
         is_patch: bool,
-    ) -> None:
+    ) -> list[Observable]:
         # kind should be "Class" or "Object"
         if is_patch:
             caption, _ = self._find_parent_item_caption_and_description(
-                items, item_name, item
+                items, item_name, item, kind
             )
         else:
-            caption, _ = self._find_item_caption_and_description(items, item_name, item)
+            caption, _ = self._find_item_caption_and_description(
+                items, item_name, item, kind
+            )
+        observables: list[Observable] = []
         attributes = j_object(item.setdefault("attributes", {}))
         for attribute_name, attribute in attributes.items():
             attribute = j_object(attribute)
             if "observable" in attribute:
-                observable_type_id = str(attribute["observable"])
-                if observable_type_id in self._observable_type_id_dict:
-                    entry = j_object(self._observable_type_id_dict[observable_type_id])
-                    raise SchemaException(
-                        f"Collision of observable type_id {observable_type_id}"
-                        f' between {context} {kind} "{item_name}" caption "{caption}"'
-                        f' attribute "{attribute_name}" "observable" and'
-                        f' "{entry["caption"]}": {entry["description"]}'
-                    )
-                self._observable_type_id_dict[observable_type_id] = (
-                    self._make_observable_enum_entry(
-                        f"{caption} {kind}: {attribute_name}",
-                        f'{kind}-specific attribute "{attribute_name}" for the'
-                        f" {caption} {kind}.",
-                        f"{kind}-Specific Attribute",
+                observables.append(
+                    Observable(
+                        str(attribute["observable"]),
+                        self._make_observable_enum_entry(
+                            f"{caption} {kind}: {attribute_name}",
+                            f'{kind}-specific attribute "{attribute_name}" for the'
+                            f" {caption} {kind}.",
+                            f"{kind}-Specific Attribute",
+                        ),
+                        f'{context} {kind} "{item_name}" caption "{caption}"'
+                        f' attribute "{attribute_name}" "observable"',
+                        self._item_path(item),
                     )
                 )
+        return observables
 
     def _observables_from_item_observables(
         self,
@@ -1627,36 +2684,35 @@ class SchemaCompiler:
         kind: str,
         context: str,
         is_patch: bool,
-    ) -> None:
+    ) -> list[Observable]:
         # kind should be title-case: "Class" or "Object"
+        observables: list[Observable] = []
         if "observables" in item:
             if is_patch:
                 caption, _ = self._find_parent_item_caption_and_description(
-                    items, item_name, item
+                    items, item_name, item, kind
                 )
             else:
                 caption, _ = self._find_item_caption_and_description(
-                    items, item_name, item
+                    items, item_name, item, kind
                 )
-            observables = j_object(item["observables"])
-            for attribute_path, observable_type_id_num in observables.items():
-                observable_type_id = str(observable_type_id_num)
-                if observable_type_id in self._observable_type_id_dict:
-                    entry = j_object(self._observable_type_id_dict[observable_type_id])
-                    raise SchemaException(
-                        f"Collision of observable type_id {observable_type_id} between"
-                        f' {context} {kind} "{item_name}" caption "{caption}"'
-                        f' "observables" attribute path "{attribute_path}" and'
-                        f' "{entry["caption"]}": {entry["description"]}'
-                    )
-                self._observable_type_id_dict[observable_type_id] = (
-                    self._make_observable_enum_entry(
-                        f"{caption} {kind}: {attribute_path}",
-                        f'{kind}-specific attribute "{attribute_path}" for the'
-                        f" {caption} {kind}.",
-                        f"{kind}-Specific Attribute",
+            item_observables = j_object(item["observables"])
+            for attribute_path, observable_type_id in item_observables.items():
+                observables.append(
+                    Observable(
+                        str(observable_type_id),
+                        self._make_observable_enum_entry(
+                            f"{caption} {kind}: {attribute_path}",
+                            f'{kind}-specific attribute "{attribute_path}" for the'
+                            f" {caption} {kind}.",
+                            f"{kind}-Specific Attribute",
+                        ),
+                        f'{context} {kind} "{item_name}" caption "{caption}"'
+                        f' "observables" attribute path "{attribute_path}"',
+                        self._item_path(item),
                     )
                 )
+        return observables
 
     def _make_observable_enum_entry(
         self, caption: str, description: str, observable_kind: str
@@ -1669,40 +2725,64 @@ class SchemaCompiler:
             entry["_observable_kind"] = observable_kind
         return entry
 
-    @staticmethod
     def _find_item_caption_and_description(
-        items: JObject, item_name: str, item: JObject
+        self, items: JObject, item_name: str, item: JObject, kind: str
     ) -> tuple[str, str]:
         if "caption" in item:
             caption = j_string(item["caption"])
             description = j_string(item.get("description", caption))
             return caption, description
-        return SchemaCompiler._find_parent_item_caption_and_description(
-            items, item_name, item
+        return self._find_parent_item_caption_and_description(
+            items, item_name, item, kind
         )
 
-    @staticmethod
     def _find_parent_item_caption_and_description(
-        items: JObject, item_name: str, item: JObject
+        self, items: JObject, item_name: str, item: JObject, kind: str
     ) -> tuple[str, str]:
-        current_item: JObject = item
-        while True:
-            if "extends" in item:
-                parent_name = current_item["extends"]
-                if parent_name in items:
-                    parent_item = j_object(items[parent_name])
-                    if "caption" in parent_item:
-                        caption = j_string(parent_item["caption"])
-                        description = j_string(parent_item.get("description", caption))
-                        return caption, description
-                    current_item = parent_item
-                else:
+        parent_name = j_string_optional(item.get("extends"))
+        if parent_name:
+            found = self._find_ancestor_caption_and_description(
+                items, item_name, parent_name, kind
+            )
+            if found:
+                return found
+        return item_name, item_name  # fallback
+
+    def _find_ancestor_caption_and_description(
+        self, items: JObject, item_name: str, ancestor_name: str, kind: str
+    ) -> tuple[str, str] | None:
+        """
+        Returns the caption and description of ancestor_name or its nearest ancestor
+        with a caption, or None if there is none. Results are cached for every ancestor
+        walked, so each inheritance chain is only walked once.
+        """
+        with self._ancestor_captions_lock:
+            chain: list[str] = []
+            name: str | None = ancestor_name
+            found: tuple[str, str] | None = None
+            while name:
+                if (kind, name) in self._ancestor_captions:
+                    found = self._ancestor_captions[(kind, name)]
+                    break
+                if name in chain:
                     raise SchemaException(
-                        f'Ancestor "{parent_name}" of "{item_name}" is undefined.'
+                        self._extends_cycle_message(kind.lower(), [*chain, name])
                     )
-            else:
-                break
-        return item_name, item_name  # fallback
+                if name not in items:
+                    raise SchemaException(
+                        f'Ancestor "{name}" of "{item_name}" is undefined.'
+                    )
+                chain.append(name)
+                ancestor = j_object(items[name])
+                if "caption" in ancestor:
+                    caption = j_string(ancestor["caption"])
+                    found = caption, j_string(ancestor.get("description", caption))
+                    break
+                name = j_string_optional(ancestor.get("extends"))
+
+            for name in chain:
+                self._ancestor_captions[(kind, name)] = found
+            return found
 
     @staticmethod
     def _add_source_to_item_attributes(items: JObject) -> None:
@@ -1735,9 +2815,14 @@ class SchemaCompiler:
                     f'extension "{patch["extension"]}" {kind} patch "{patch_name}"'
                 )
                 if base_name not in items:
-                    raise SchemaException(
-                        f'{context} attempted to patch undefined {kind} "{base_name}"'
+                    self._error(
+                        f'{context} attempted to patch undefined {kind} "{base_name}"',
+                        self._item_path(patch),
+                        code="undefined-patch-target",
+                        item_kind=kind,
+                        item_name=patch_name,
                     )
+                    continue
 
                 base = j_object(items[base_name])
 
@@ -1745,12 +2830,17 @@ class SchemaCompiler:
                     # This is not allowed as the result is non-deterministic, depending
                     # on the order the extensions are processed. We have no notion of
                     # extension precedence, so this is not supported.
-                    raise SchemaException(
+                    self._error(
                         f"Illegal patch attempt: {context} attempted to patch"
                         f' "{base_name}" from extension "{base["extension"]}";'
                         f" extensions are not allowed to patch each other as the"
-                        f" results are non-deterministic"
+                        f" results are non-deterministic",
+                        self._item_path(patch),
+                        code="illegal-patch",
+                        item_kind=kind,
+                        item_name=patch_name,
                     )
+                    continue
                 else:
                     logger.info(
                         'Patch: %s is patching "%s" from base schema',
@@ -1875,12 +2965,13 @@ class SchemaCompiler:
                 # TODO: This will add "extension" and "extension_id" because they exist
                 #       in source attribute. Consider tracking that this ends up in dest
                 #       because of a merge / overwrite?
-                if isinstance(dest_attribute[source_key], dict) and isinstance(
-                    source_value, dict
-                ):
+                dest_value = dest_attribute[source_key]
+                if isinstance(dest_value, dict) and isinstance(source_value, dict):
                     # TODO: Detect collisions? Perhaps with overwrite flag in
                     #       utils.deep_merge?
-                    deep_merge(j_object(dest_attribute[source_key]), source_value)
+                    # The dest value can be shared with included content, so it is
+                    # replaced with a merged copy rather than modified
+                    dest_attribute[source_key] = copy_merge(dest_value, source_value)
                 else:
                     dest_attribute[source_key] = source_value
 
@@ -1905,60 +2996,82 @@ class SchemaCompiler:
                 del base["constraints"]
 
     def _resolve_extends(self, items: JObject, kind: str) -> None:
-        for item_name, item in items.items():
-            self._resolve_item_extends(items, item_name, j_object(item), kind)
+        for item_name in self._extends_order(items, kind):
+            self._resolve_item_extends(items, item_name, kind)
 
-    def _resolve_item_extends(
-        self, items: JObject, item_name: str | None, item: JObject | None, kind: str
-    ) -> None:
-        if item_name is None or item is None:
-            return
+    def _extends_order(self, items: JObject, kind: str) -> list[str]:
+        """
+        Returns the names of items in an order where every item comes after its
+        "extends" parent, so each item can be flattened exactly once, on top of its
+        already flattened parent. Raises a SchemaException for undefined parents and
+        circular inheritance.
+        """
+        order: list[str] = []
+        ordered: set[str] = set()
+        for item_name in items:
+            # Walk up to the first already ordered ancestor (or root), then order the
+            # walked chain from the top down
+            chain: list[str] = []
+            name: str | None = item_name
+            while name and name not in ordered:
+                if name in chain:
+                    raise SchemaException(
+                        self._extends_cycle_message(kind, [*chain, name])
+                    )
+                chain.append(name)
+                parent_name = j_string_optional(j_object(items[name]).get("extends"))
+                if parent_name and parent_name not in items:
+                    raise SchemaException(
+                        f'{kind} "{name}" extends undefined {kind} "{parent_name}"'
+                    )
+                name = parent_name
+            chain.reverse()
+            order.extend(chain)
+            ordered.update(chain)
+        return order
 
-        parent_name = j_string_optional(item.get("extends"))
-        parent = None
-        if parent_name:
-            parent = j_object(items[parent_name])
-        self._resolve_item_extends(items, parent_name, parent, kind)
-        assert parent_name == item.get("extends"), (
-            f'{kind} "{item_name}" "extends" value should not change after'
-            f' recursively processing parent: original value: "{parent_name}",'
-            f' current value: "{item.get("extends", "<deleted>")}"'
+    @staticmethod
+    def _extends_cycle_message(kind: str, chain: list[str]) -> str:
+        cycle = chain[chain.index(chain[-1]) :]
+        return (
+            f'{kind} "{cycle[0]}" has circular "extends" inheritance:'
+            f" {' -> '.join(cycle)}"
         )
 
+    def _resolve_item_extends(self, items: JObject, item_name: str, kind: str) -> None:
+        item = j_object(items[item_name])
+        parent_name = j_string_optional(item.get("extends"))
         if parent_name:
-            parent_item = j_object_optional(items.get(parent_name))
-            if parent_item:
-                # Create flattened item by merging item on top of a copy of it's parent
-                # with the result that new and overlapping things in item "win" over
-                # those in parent. This new item replaces the existing one.
-                new_item = deep_copy_j_object(parent_item)
-                # The values of most keys simply replace what is in the parent, except
-                # for attributes and profiles
-                for source_key, source_value in item.items():
-                    if source_key == "attributes":
-                        new_attributes = j_object(new_item.get("attributes", {}))
-                        self._merge_attributes(
-                            new_attributes,
-                            j_object(source_value),
-                            f'{kind} "{item_name}" extending "{parent_name}"',
-                        )
-                        new_item["attributes"] = new_attributes
-                    elif source_key == "profiles":
-                        self._merge_profiles(new_item, item)
-                    else:
-                        new_item[source_key] = source_value
+            # The parent has already been flattened
+            parent_item = j_object(items[parent_name])
+            # Create flattened item by merging item on top of a copy of it's parent
+            # with the result that new and overlapping things in item "win" over
+            # those in parent. This new item replaces the existing one.
+            new_item = deep_copy_j_object(parent_item)
+            # The values of most keys simply replace what is in the parent, except
+            # for attributes and profiles
+            for source_key, source_value in item.items():
+                if source_key == "attributes":
+                    new_attributes = j_object(new_item.get("attributes", {}))
+                    self._merge_attributes(
+                        new_attributes,
+                        j_object(source_value),
+                        f'{kind} "{item_name}" extending "{parent_name}"',
+                    )
+                    new_item["attributes"] = new_attributes
+                elif source_key == "profiles":
+                    self._merge_profiles(new_item, item)
+                else:
+                    new_item[source_key] = source_value
 
-                items[item_name] = new_item
-            else:
-                raise SchemaException(
-                    f'{kind} "{item_name}" extends undefined {kind} "{parent_name}"'
-                )
+            items[item_name] = new_item
 
     def _enrich_and_validate_dictionary(self) -> None:
         if self.browser_mode:
             self._add_common_dictionary_attribute_links()
             self._add_class_dictionary_attribute_links()
             self._add_object_dictionary_attribute_links()
+            self._set_dictionary_attribute_links()
         self._enrich_and_validate_dictionary_attribute_types()
         self._add_datetime_sibling_dictionary_attributes()
 
@@ -1969,58 +3082,73 @@ class SchemaCompiler:
             raise SchemaException('Schema has not defined a "base_event" class')
         base_event = j_object(self._classes["base_event"])
         link = self._make_link("common", "base_event", base_event)
-        self._add_links_to_dictionary_attributes(
-            "class", "base_event", base_event, link
+        self._add_dictionary_attribute_links(
+            self._dictionary_attribute_links_of_item(
+                "class", "base_event", base_event, link
+            )
         )
 
     def _add_class_dictionary_attribute_links(self) -> None:
         if not self.browser_mode:
             return
-        for cls_name, cls in self._classes.items():
+
+        def class_links(name_and_class: tuple[str, JValue]) -> list[tuple[str, Link]]:
+            cls_name, cls = name_and_class
             cls = j_object(cls)
             link = self._make_link("class", cls_name, cls)
-            self._add_links_to_dictionary_attributes("class", cls_name, cls, link)
+            return self._dictionary_attribute_links_of_item(
+                "class", cls_name, cls, link
+            )
+
+        for links in self._map(class_links, self._classes.items()):
+            self._add_dictionary_attribute_links(links)
 
     def _add_object_dictionary_attribute_links(self) -> None:
         if not self.browser_mode:
             return
-        for obj_name, obj in self._objects.items():
+
+        def object_links(name_and_object: tuple[str, JValue]) -> list[tuple[str, Link]]:
+            obj_name, obj = name_and_object
             obj = j_object(obj)
             link = self._make_link("object", obj_name, obj)
-            self._add_links_to_dictionary_attributes("object", obj_name, obj, link)
+            return self._dictionary_attribute_links_of_item(
+                "object", obj_name, obj, link
+            )
+
+        for links in self._map(object_links, self._objects.items()):
+            self._add_dictionary_attribute_links(links)
 
     @staticmethod
-    def _make_link(group: str, item_name: str, item: JObject) -> JObject:
+    def _make_link(group: str, item_name: str, item: JObject) -> Link:
         """
         Create link reference. The group value should be "common", "class", or "object",
         with "common" being a group holding the "base_event" class, which is treated
         specially.
         """
-        link: JObject = {
-            "group": group,
-            "type": item_name,
-            "caption": item.get("caption", "*No name*"),
-        }
-        if "extension" in item:
-            link["extension"] = item["extension"]
-        if item.get("@deprecated"):
-            link["deprecated?"] = True
-        return link
+        return Link(
+            group,
+            item_name,
+            item.get("caption", "*No name*"),
+            item.get("extension"),
+            bool(item.get("@deprecated")),
+        )
 
     @staticmethod
-    def _sort_links(links: JArray) -> None:
-        def link_to_key(link: JValue) -> tuple[str, str]:
-            link = j_object(link)
-            return j_string(link["group"]), j_string(link["type"])
-
-        links.sort(key=link_to_key)
-
-    def _add_links_to_dictionary_attributes(
-        self, kind: str, item_name: str, item: JObject, link: JObject
-    ) -> None:
-        if not self.browser_mode:
-            return
-        dictionary_attributes = j_object(self._dictionary.setdefault("attributes", {}))
+    def _links_to_j_array(links: list[Link]) -> JArray:
+        # Sorting is stable, so links with the same group and type keep the order in
+        # which they were added
+        return [link.to_j_object() for link in sorted(links, key=Link.sort_key)]
+
+    def _dictionary_attribute_links_of_item(
+        self, kind: str, item_name: str, item: JObject, link: Link
+    ) -> list[tuple[str, Link]]:
+        """
+        Returns the links from the dictionary attributes used by an item to the item,
+        as tuples of dictionary attribute name and link. This only modifies the item,
+        so it can be run in threads, with the results added in item order.
+        """
+        links: list[tuple[str, Link]] = []
+        dictionary_attributes = j_object(self._dictionary["attributes"])
         item_attributes = j_object(item.setdefault("attributes", {}))
         for item_attribute_name in item_attributes.keys():
             if item_attribute_name in dictionary_attributes:
@@ -2028,22 +3156,44 @@ class SchemaCompiler:
                     dictionary_attributes[item_attribute_name]
                 )
 
-                # Create copy of link to avoid polluting original in case at least one
-                # attribute is an object type.
-                attribute_link = deep_copy_j_object(link)
                 # attribute_keys is only used to track the different attribute name uses
                 # of object types. We don't track the various attribute names that use
                 # dictionary types.
                 if "object_type" in dictionary_attribute:
-                    attribute_link["attribute_keys"] = [item_attribute_name]
-                links = j_array(dictionary_attribute.setdefault("_links", []))
-                links.append(attribute_link)
-                self._sort_links(links)
+                    attribute_link = replace(link, attribute_keys=[item_attribute_name])
+                else:
+                    attribute_link = link
+                links.append((item_attribute_name, attribute_link))
             else:
                 raise SchemaException(
                     f'{kind} "{item_name}" uses undefined attribute'
                     f' "{item_attribute_name}"'
                 )
+        return links
+
+    def _add_dictionary_attribute_links(self, links: list[tuple[str, Link]]) -> None:
+        for attribute_name, link in links:
+            self._dictionary_attribute_links.setdefault(attribute_name, []).append(link)
+
+    def _index_dictionary(self) -> None:
+        dictionary_attributes = j_object(self._dictionary.setdefault("attributes", {}))
+        for attribute_name, attribute in dictionary_attributes.items():
+            attribute = j_object(attribute)
+            attribute_type = j_string_optional(attribute.get("type"))
+            description = j_string(attribute.get("description", ""))
+            self._dictionary_index[attribute_name] = DictionaryAttributeInfo(
+                attribute_type,
+                j_string_optional(attribute.get("object_type")),
+                attribute_type == "timestamp_t",
+                description,
+                "See specific usage" in description,
+            )
+
+    def _set_dictionary_attribute_links(self) -> None:
+        dictionary_attributes = j_object(self._dictionary.setdefault("attributes", {}))
+        for attribute_name, links in self._dictionary_attribute_links.items():
+            attribute = j_object(dictionary_attributes[attribute_name])
+            attribute["_links"] = self._links_to_j_array(links)
 
     def _enrich_and_validate_dictionary_attribute_types(self) -> None:
         dictionary_attributes = j_object(self._dictionary.setdefault("attributes", {}))
@@ -2185,12 +3335,18 @@ class SchemaCompiler:
                 if observable_type_id in self._observable_type_id_dict:
                     entry = j_object(self._observable_type_id_dict[observable_type_id])
                     if "extension" in detail:
-                        kind = f'extension "{detail["extension"]}" {kind}'
-                    raise SchemaException(
+                        full_kind = f'extension "{detail["extension"]}" {kind}'
+                    else:
+                        full_kind = kind
+                    self._error(
                         f"Collision of observable type_id {observable_type_id} between"
-                        f' {kind} "{key}" caption "{detail.get("caption")}"'
+                        f' {full_kind} "{key}" caption "{detail.get("caption")}"'
                         f' "observable" and "{entry["caption"]}":'
-                        f" {entry['description']}"
+                        f" {entry['description']}",
+                        self._item_path(detail),
+                        code="observable-collision",
+                        item_kind=kind.lower(),
+                        attribute=key,
                     )
                 else:
                     entry = self._make_observable_enum_entry(
@@ -2202,9 +3358,11 @@ class SchemaCompiler:
 
     def _validate_object_profiles_and_add_links(self) -> None:
         self._validate_item_profiles_and_add_links("object", self._objects)
+        self._set_profile_links()
 
     def _validate_class_profiles_and_add_links(self) -> None:
         self._validate_item_profiles_and_add_links("class", self._classes)
+        self._set_profile_links()
 
     def _validate_item_profiles_and_add_links(self, group: str, items: JObject) -> None:
         for item_name, item in items.items():
@@ -2213,67 +3371,85 @@ class SchemaCompiler:
                 for profile_name in j_array(item["profiles"]):
                     profile_name = j_string(profile_name)
                     if "/" in profile_name:
-                        if profile_name in self._extension_profiles:
-                            profile = j_object(self._extension_profiles[profile_name])
-                        else:
+                        if profile_name not in self._extension_profiles:
                             if "extension" in item:
                                 full_group = f'extension "{item["extension"]}" {group}'
                             else:
                                 full_group = group
-                            raise SchemaException(
+                            self._error(
                                 f'Undefined extension profile "{profile_name}" used in'
-                                f' {full_group} "{item_name}"'
+                                f' {full_group} "{item_name}"',
+                                self._item_path(item),
+                                code="undefined-profile",
+                                item_kind=group,
+                                item_name=item_name,
                             )
-                    elif profile_name in self._base_profiles:
-                        profile = j_object(self._base_profiles[profile_name])
-                    else:
+                            continue
+                    elif profile_name not in self._base_profiles:
                         if "extension" in item:
                             full_group = f'extension "{item["extension"]}" {group}'
                         else:
                             full_group = group
-                        raise SchemaException(
+                        self._error(
                             f'Undefined base schema profile "{profile_name}" used in'
-                            f' {full_group} "{item_name}"'
+                            f' {full_group} "{item_name}"',
+                            self._item_path(item),
+                            code="undefined-profile",
+                            item_kind=group,
+                            item_name=item_name,
                         )
+                        continue
 
                     if self.browser_mode:
                         link = self._make_link(group, item_name, item)
-                        links = j_array(profile.setdefault("_links", []))
-                        links.append(link)
-                        self._sort_links(links)
+                        self._profile_links.setdefault(profile_name, []).append(link)
+
+    def _set_profile_links(self) -> None:
+        # Profile names are unique across base and extension profiles, since extension
+        # profile names are extension-scoped
+        for profile_name, links in self._profile_links.items():
+            if profile_name in self._extension_profiles:
+                profile = j_object(self._extension_profiles[profile_name])
+            else:
+                profile = j_object(self._base_profiles[profile_name])
+            profile["_links"] = self._links_to_j_array(links)
 
     def _add_object_links(self) -> None:
         if not self.browser_mode:
             return
 
-        dictionary_attributes = j_object(self._dictionary.setdefault("attributes", {}))
+        # Map object names to the links of dictionary attributes using them, in
+        # dictionary attribute order
+        object_type_links: dict[str, list[Link]] = {}
+        for attribute_name, info in self._dictionary_index.items():
+            if (
+                info.object_type is not None
+                and attribute_name in self._dictionary_attribute_links
+            ):
+                object_type_links.setdefault(info.object_type, []).extend(
+                    self._dictionary_attribute_links[attribute_name]
+                )
+
         for obj_name, obj in self._objects.items():
             obj = j_object(obj)
-            links: JArray = []
-            for attribute in dictionary_attributes.values():
-                attribute = j_object(attribute)
-                if attribute.get("object_type") == obj_name and "_links" in attribute:
-                    attribute_links = deep_copy_j_array(j_array(attribute["_links"]))
-                    links.extend(attribute_links)
-
             # Group by group and type and merge attribute_keys
-            grouped_links: JObject = {}
-            for link in links:
-                link = j_object(link)
-                group_key = f"{link['group']}:{link['type']}"
+            grouped_links: dict[tuple[str, str], Link] = {}
+            for link in object_type_links.get(obj_name, []):
+                group_key = link.sort_key()
                 if group_key in grouped_links:
-                    group = j_object(grouped_links[group_key])
-                    group_attribute_keys = j_array(group["attribute_keys"])
-                    for key in j_array(link["attribute_keys"]):
+                    group_attribute_keys = grouped_links[group_key].attribute_keys
+                    assert group_attribute_keys is not None
+                    for key in link.attribute_keys or []:
                         if key not in group_attribute_keys:
                             group_attribute_keys.append(key)
                 else:
-                    grouped_links[group_key] = link
+                    # Copy so merging attribute_keys does not change the original
+                    grouped_links[group_key] = replace(
+                        link, attribute_keys=list(link.attribute_keys or [])
+                    )
 
             # The final result is the values of the grouped_link dict
-            links = list(grouped_links.values())
-            self._sort_links(links)
-            obj["_links"] = links
+            obj["_links"] = self._links_to_j_array(list(grouped_links.values()))
 
     def _update_observable_enum(self) -> None:
         if "observable" in self._objects:
@@ -2282,7 +3458,10 @@ class SchemaCompiler:
             observable_type_id = j_object(
                 observable_attributes.setdefault("type_id", {})
             )
-            dest_enum_dict = j_object(observable_type_id.setdefault("enum", {}))
+            # Replace rather than modify the enum, which can be shared with included
+            # content
+            dest_enum_dict = dict(j_object(observable_type_id.get("enum", {})))
+            observable_type_id["enum"] = dest_enum_dict
             for (
                 source_type_id_key,
                 source_enum_detail,
@@ -2313,23 +3492,22 @@ class SchemaCompiler:
         """
         self._consolidate_profiles("class", self._classes)
 
-    # ProfilesDict is a mapping from class or object name to list of profiles or None
-    # We really prefer to list[str] rather than JArray (list[JValue]), however JArray
-    # works better with the types used here, and keeps Pyright happy.
-    type ProfilesDict = dict[str, JArray | None]
-
     def _consolidate_profiles(self, group: str, items: JObject) -> None:
         for item_name, item in items.items():
             item = j_object(item)
-            profiles_dict: SchemaCompiler.ProfilesDict = {}
             try:
                 if group == "class":
-                    # The recursive step is for objects. For classes, we need to do the
-                    # first step here.
+                    # Classes are not object types, so the profiles of a class are
+                    # gathered here from its own profiles and the closures of the
+                    # objects its attributes refer to
+                    all_profiles: set[str] = set()
+                    sources: set[str] = set()
                     if "profiles" in item:
-                        # Use prefix for class so it does not collide with object names
                         item_profiles = j_array(item["profiles"])
-                        profiles_dict[f"class:{item_name}"] = item_profiles
+                        if item_profiles:
+                            all_profiles.update(map(j_string, item_profiles))
+                            # Use prefix for class so it does not collide with objects
+                            sources.add(f"class:{item_name}")
 
                     item_attributes = j_object(item.setdefault("attributes", {}))
                     for attribute_name, attribute in item_attributes.items():
@@ -2340,29 +3518,21 @@ class SchemaCompiler:
                             attribute_name, j_object(attribute)
                         )
                         if object_type:
-                            self._gather_profiles(object_type, profiles_dict)
-
+                            closure = self._object_profile_closure(object_type)
+                            all_profiles.update(closure.profiles)
+                            sources.update(closure.sources)
                 else:
-                    # for object, we can jump straight to _gather_profiles
-                    self._gather_profiles(item_name, profiles_dict)
+                    closure = self._object_profile_closure(item_name)
+                    all_profiles = set(closure.profiles)
+                    sources = set(closure.sources)
             except SchemaException as e:
                 raise SchemaException(
                     f'Consolidating profiles of {group} "{item_name}" failed: {e}'
                 ) from e
 
-            all_profiles: set[JValue] = set()
-            for profile_list in profiles_dict.values():
-                if profile_list:
-                    all_profiles.update(profile_list)
-
             if all_profiles:
-                sorted_profiles = sorted(all_profiles, key=lambda v: j_string(v))
+                sorted_profiles = list[JValue](sorted(all_profiles))
                 if logger.isEnabledFor(logging.DEBUG):
-                    items_with_profiles: JArray = []
-                    for profile_name, profile_list in profiles_dict.items():
-                        if profile_list:
-                            items_with_profiles.append(profile_name)
-                    items_with_profiles.sort(key=lambda v: j_string(v))
                     original_profiles = item.get("profiles")
                     if sorted_profiles == original_profiles:
                         logger.debug(
@@ -2379,38 +3549,110 @@ class SchemaCompiler:
                             group,
                             item_name,
                             original_profiles,
-                            items_with_profiles,
+                            sorted(sources),
                             sorted_profiles,
                         )
-                item["profiles"] = j_array(sorted_profiles)
+                item["profiles"] = sorted_profiles
             else:
                 logger.debug(
                     'Consolidated profiles of %s "%s": no profiles.', group, item_name
                 )
 
-    def _gather_profiles(
-        self, obj_name: str, profiles_dict: SchemaCompiler.ProfilesDict
-    ) -> None:
+    def _object_profile_closure(self, obj_name: str) -> ProfileClosure:
         """
-        Gather profiles from obj_name object (if any) and its attributes that are object
-        types, recursively.
+        Returns the profile closure of obj_name object: its profiles and those of all
+        objects reachable through its object type attributes, recursively.
+
+        Closures are memoized, so the object graph is walked once for all classes and
+        objects. Objects can refer to each other in cycles, and all objects in a cycle
+        have the same closure, so the strongly connected components of the object graph
+        are found using Tarjan's algorithm (iteratively, to avoid deep recursion), and a
+        closure is computed once per component.
         """
-        if obj_name in profiles_dict:
-            return  # obj_name already processed
-
-        if obj_name not in self._objects:
-            raise SchemaException(f'object "{obj_name}" is not defined')
+        if obj_name in self._profile_closures:
+            return self._profile_closures[obj_name]
+
+        # Tarjan's algorithm bookkeeping
+        index: dict[str, int] = {}
+        low_link: dict[str, int] = {}
+        component_stack: list[str] = []
+        on_stack: set[str] = set()
+        # Objects referred to by each object's attributes, gathered during the walk
+        references: dict[str, list[str]] = {}
+        # Walk stack of object names and iterators of their referred to objects
+        walk: list[tuple[str, Iterator[str]]] = []
+
+        def visit(name: str) -> None:
+            if name not in self._objects:
+                raise SchemaException(f'object "{name}" is not defined')
+            index[name] = low_link[name] = len(index)
+            component_stack.append(name)
+            on_stack.add(name)
+            references[name] = []
+            walk.append((name, self._referred_object_types(name)))
+
+        visit(obj_name)
+        while walk:
+            name, referred = walk[-1]
+            for object_type in referred:
+                references[name].append(object_type)
+                if object_type in self._profile_closures:
+                    continue
+                if object_type not in index:
+                    visit(object_type)
+                    break
+                if object_type in on_stack:
+                    low_link[name] = min(low_link[name], index[object_type])
+            else:
+                # All objects referred to by name have been walked
+                _ = walk.pop()
+                if walk:
+                    parent_name = walk[-1][0]
+                    low_link[parent_name] = min(low_link[parent_name], low_link[name])
+                if low_link[name] == index[name]:
+                    # name is the root of a strongly connected component
+                    component: list[str] = []
+                    while not component or component[-1] != name:
+                        component.append(component_stack.pop())
+                        on_stack.remove(component[-1])
+                    self._set_component_profile_closure(component, references)
+
+        return self._profile_closures[obj_name]
+
+    def _referred_object_types(self, obj_name: str) -> Iterator[str]:
         obj = j_object(self._objects[obj_name])
-
-        # We specifically want actual and None values since profiles_dict is doing both
-        # gathering profiles and marking things that have been processed.
-        profiles_dict[obj_name] = j_array_optional(obj.get("profiles"))
-
         obj_attributes = j_object(obj.setdefault("attributes", {}))
         for attribute_name, attribute in obj_attributes.items():
             object_type = self._find_object_type(attribute_name, j_object(attribute))
             if object_type:
-                self._gather_profiles(object_type, profiles_dict)
+                yield object_type
+
+    def _set_component_profile_closure(
+        self, component: list[str], references: dict[str, list[str]]
+    ) -> None:
+        """
+        Set the profile closure of all objects in a strongly connected component of the
+        object graph. Closures of objects referred to from outside the component have
+        already been set.
+        """
+        members = set(component)
+        profiles: set[str] = set()
+        sources: set[str] = set()
+        for name in component:
+            obj_profiles = j_array_optional(
+                j_object(self._objects[name]).get("profiles")
+            )
+            if obj_profiles:
+                profiles.update(map(j_string, obj_profiles))
+                sources.add(name)
+            for object_type in references[name]:
+                if object_type not in members:
+                    closure = self._profile_closures[object_type]
+                    profiles.update(closure.profiles)
+                    sources.update(closure.sources)
+        closure = ProfileClosure(frozenset(profiles), frozenset(sources))
+        for name in component:
+            self._profile_closures[name] = closure
 
     def _find_object_type(self, attribute_name: str, attribute: JObject) -> str | None:
         """
@@ -2427,14 +3669,13 @@ class SchemaCompiler:
             ' "object_type"'
         )
 
-        dictionary_attributes = j_object(self._dictionary.setdefault("attributes", {}))
-        if attribute_name not in dictionary_attributes:
+        info = self._dictionary_index.get(attribute_name)
+        if info is None:
             raise SchemaException(
                 f'attribute "{attribute_name}" is not a defined dictionary attributes'
             )
-        dictionary_attribute = j_object(dictionary_attributes[attribute_name])
-        # will return None if "object_type" is not present
-        return j_string_optional(dictionary_attribute.get("object_type"))
+        # None if the attribute is not an object type
+        return info.object_type
 
     def _verify_object_attributes_and_add_datetime(self) -> None:
         self._verify_item_attributes_and_add_datetime(self._objects, "object")
@@ -2445,7 +3686,6 @@ class SchemaCompiler:
     def _verify_item_attributes_and_add_datetime(
         self, items: JObject, kind: str
     ) -> None:
-        dictionary_attributes = j_object(self._dictionary.setdefault("attributes", {}))
         dictionary_types = j_object(self._dictionary.setdefault("types", {}))
         dictionary_types_attributes = j_object(
             dictionary_types.setdefault("attributes", {})
@@ -2462,31 +3702,36 @@ class SchemaCompiler:
             attributes = j_object(item.setdefault("attributes", {}))
             for attribute_name, attribute in attributes.items():
                 attribute = j_object(attribute)
-                dictionary_attribute = j_object(
-                    dictionary_attributes.get(attribute_name, {})
-                )
-                if "description" not in attribute:
-                    # No description. Make sure fallback dictionary description isn't
-                    # meant to be overridden.
-                    dictionary_description = j_string(
-                        dictionary_attribute.get("description", "")
+                # Attributes should be defined in the dictionary, though this is
+                # verified later
+                info = self._dictionary_index.get(attribute_name)
+                if (
+                    info is not None
+                    and info.has_placeholder_description
+                    and "description" not in attribute
+                ):
+                    # No description, and the fallback dictionary description is meant
+                    # to be overridden
+                    self._warning(
+                        'Please update the "description" of %s "%s" attribute "%s":'
+                        ' "%s"',
+                        kind,
+                        item_name,
+                        attribute_name,
+                        info.description,
+                        code="placeholder-description",
+                        item_kind=kind,
+                        item_name=item_name,
+                        attribute=attribute_name,
+                        path=self._item_path(item),
                     )
-                    if "See specific usage" in dictionary_description:
-                        self._warning(
-                            'Please update the "description" of %s "%s" attribute "%s":'
-                            ' "%s"',
-                            kind,
-                            item_name,
-                            attribute_name,
-                            dictionary_description,
-                        )
 
                 if add_datetime:
                     if "type" in attribute:
-                        attribute_type = attribute["type"]
+                        is_timestamp = attribute["type"] == "timestamp_t"
                     else:
-                        attribute_type = dictionary_attribute.get("type")
-                    if attribute_type == "timestamp_t":
+                        is_timestamp = info is not None and info.is_timestamp
+                    if is_timestamp:
                         dt_attribute = deep_copy_j_object(attribute)
                         if self.legacy_mode:
                             dt_attribute["profile"] = "datetime"
@@ -2505,33 +3750,39 @@ class SchemaCompiler:
                     # keep profiles sorted
                     profiles.sort(key=lambda v: j_string(v))
 
-    def _ensure_attributes_have_requirement(self) -> None:
+    def _ensure_attributes_have_requirement(
+        self, item_tables: list[tuple[JObject, str]]
+    ) -> None:
+        """
+        Default the requirement of attributes without one in item_tables, given as
+        tuples of items and their kind.
+        """
         # Track attributes in profiles, classes, and objects that incorrectly do _not_
         # have a "requirement"
         missing_requirements: list[str] = []
-        self._ensure_item_attributes_have_requirement(
-            self._base_profiles, "profile", missing_requirements
-        )
-        self._ensure_item_attributes_have_requirement(
-            self._extension_profiles, "profile", missing_requirements
-        )
-        self._ensure_item_attributes_have_requirement(
-            self._classes, "class", missing_requirements
-        )
-        self._ensure_item_attributes_have_requirement(
-            self._objects, "object", missing_requirements
-        )
+        # One diagnostic per attribute, though these are logged as a single warning
+        diagnostics: list[Diagnostic] = []
+        for items, kind in item_tables:
+            self._ensure_item_attributes_have_requirement(
+                items, kind, missing_requirements, diagnostics
+            )
         if missing_requirements:
             missing_requirements.sort()
-            self._warning(
+            with self._stats_lock:
+                self._stats.warning_count += 1
+                self._diagnostics.extend(diagnostics)
+            logger.warning(
                 'The following attributes do not have a "requirement" property and a'
                 ' value of "optional" will be used:\n    %s',
                 "\n    ".join(missing_requirements),
             )
 
-    @staticmethod
     def _ensure_item_attributes_have_requirement(
-        items: JObject, kind: str, missing_requirements: list[str]
+        self,
+        items: JObject,
+        kind: str,
+        missing_requirements: list[str],
+        diagnostics: list[Diagnostic],
     ) -> None:
         for item_name, item in items.items():
             item = j_object(item)
@@ -2542,6 +3793,18 @@ class SchemaCompiler:
                 if attribute.get("requirement") is None:
                     attribute["requirement"] = "optional"
                     fixed.append(f'"{attribute_name}"')
+                    diagnostics.append(
+                        Diagnostic(
+                            "warning",
+                            "missing-requirement",
+                            f'{kind} "{item_name}" attribute "{attribute_name}" does'
+                            ' not have a "requirement" property; "optional" is used',
+                            kind,
+                            item_name,
+                            attribute_name,
+                            self._item_path(item),
+                        )
+                    )
             if fixed:
                 fixed.sort()
                 if "extension" in item:
@@ -2551,8 +3814,22 @@ class SchemaCompiler:
                 missing_requirements.append(f"{name} attribute(s): {', '.join(fixed)}")
 
     def _finish_attributes(self):
-        self._finish_item_attributes(self._classes, "class")
-        self._finish_item_attributes(self._objects, "object")
+        if self.processes > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            logger.info("Finishing attributes using %d processes", self.processes)
+            with ProcessPoolExecutor(
+                self.processes,
+                initializer=_init_finish_worker,
+                initargs=(self._make_finish_context(),),
+            ) as executor:
+                self._finish_all_item_attributes(executor)
+        else:
+            self._finish_all_item_attributes(self._thread_pool)
+
+    def _finish_all_item_attributes(self, executor: Executor | None) -> None:
+        self._finish_item_attributes(self._classes, "class", executor)
+        self._finish_item_attributes(self._objects, "object", executor)
 
         # Profile attributes are only used for schema browser UI of profiles. They are
         # not needed for event validation as the attribute details are merged into the
@@ -2577,8 +3854,8 @@ class SchemaCompiler:
                         attribute = j_object(attribute)
                         self._add_attribute_annotations(annotations, attribute)
             # Finish the attributes, enriching with dictionary attribute information
-            self._finish_item_attributes(self._base_profiles, "profile")
-            self._finish_item_attributes(self._extension_profiles, "profile")
+            self._finish_item_attributes(self._base_profiles, "profile", executor)
+            self._finish_item_attributes(self._extension_profiles, "profile", executor)
         else:
             for profile in self._base_profiles.values():
                 profile = j_object(profile)
@@ -2589,93 +3866,41 @@ class SchemaCompiler:
                 if "attributes" in profile:
                     del profile["attributes"]
 
-    def _finish_item_attributes(self, items: JObject, kind: str) -> None:
-        dictionary_attributes = j_object(self._dictionary.setdefault("attributes", {}))
-        for item_name, item in items.items():
-            item = j_object(item)
-            attributes = j_object(item.setdefault("attributes", {}))
-            new_attributes: JObject = {}
-            for attribute_name, attribute in attributes.items():
-                # TODO: Attribute that is not defined in dictionary attributes should
-                #       never happen at this point, but does today due to the flawed
-                #       splunk/splunk profile in the "splunk" extension. Once fixed,
-                #       the if / else block can be removed, and here we can use an
-                #       assert to catch logic bugs.
-                # TODO: Start of what this block of code should eventually look like
-                # assert attribute_name in dictionary_attributes, (
-                #     f'Attribute "{attribute_name}" is not a defined dictionary'
-                #     " attribute; this should have been caught earlier in the compile"
-                #     " process"
-                # )
-                # new_attribute = deep_copy_j_object(
-                #     j_object(dictionary_attributes[attribute_name])
-                # )
-                # deep_merge(new_attribute, attribute)
-                # new_attributes[attribute_name] = new_attribute
-                # TODO: End of what this block of code should eventually look like
-                attribute = j_object(attribute)
-                if attribute_name in dictionary_attributes:
-                    new_attribute = deep_copy_j_object(
-                        j_object(dictionary_attributes[attribute_name])
-                    )
-                    deep_merge(new_attribute, attribute)
-                    new_attributes[attribute_name] = new_attribute
-                else:
-                    # This is a known issue with the 1.0.0-rc.2 with "splunk" extension
-                    # compilation, so we will log and ignore this specific case, and
-                    # assert otherwise.
-                    if (
-                        item_name == "splunk/splunk"
-                        and "splunk" in self._extensions
-                        and self._version == "1.0.0-rc.2"
-                    ):
-                        logger.debug(
-                            "_finish_item_attributes - ignoring know issue with"
-                            ' extension "splunk": attribute "%s" in %s "%s" is not a'
-                            " defined dictionary attribute",
-                            attribute_name,
-                            kind,
-                            item_name,
-                        )
-                    else:
-                        assert attribute_name in dictionary_attributes, (
-                            f'Attribute "{attribute_name}" in {kind} "{item_name}" is'
-                            f" not a defined dictionary attribute; this should have"
-                            f" been caught earlier in the compile process"
-                        )
-
-            item["attributes"] = new_attributes
-            if self.browser_mode:
-                self._add_sibling_of_to_attributes(new_attributes)
-
-    @staticmethod
-    def _add_sibling_of_to_attributes(attributes: JObject) -> None:
-        # This must be done after finalizing attributes so full enum attribute details
-        # are present. Specifically the enum attribute "sibling" key.
-
-        sibling_of_dict: dict[str, str] = {}
-        # Enum attributes point to their enum sibling through the :sibling attribute,
-        # however the siblings do _not_ refer back to their related enum attribute,
-        # so let's build that.
-        # First pass, iterate attributes to find enum attributes and create mapping to
-        # their siblings.
-        for attribute_name, attribute in attributes.items():
-            attribute = j_object(attribute)
-            if "sibling" in attribute:
-                # This is an enum attribute
-                sibling_of_dict[j_string(attribute["sibling"])] = attribute_name
-
-        if not sibling_of_dict:
-            # no enum attributes present in attributes, so nothing to do
-            return  # skip iterating attributes again uselessly
+    def _finish_item_attributes(
+        self, items: JObject, kind: str, executor: Executor | None
+    ) -> None:
+        context = self._make_finish_context()
+        if executor is None:
+            _ = _finish_items(context, items, kind)
+            return
 
-        # Second pass, look for enum attributes and add "_sibling_of" mapping
-        for attribute_name, attribute in attributes.items():
-            attribute = j_object(attribute)
-            if attribute_name in sibling_of_dict:
-                # This is an enum sibling. Add "_sibling_of" pointing back to its
-                # related enum attribute.
-                attribute["_sibling_of"] = sibling_of_dict[attribute_name]
+        # Worker processes get the finish context once, when started, while threads
+        # share it. The executor is a process pool when using processes.
+        if self.processes > 1:
+            finish_fn = _finish_items_in_worker
+            workers = self.processes
+        else:
+            finish_fn = partial(_finish_items, context)
+            workers = self.threads
+
+        # Partition items into several chunks per worker to balance the load, then
+        # reassemble in the original order. Updating existing keys keeps item order.
+        names = list(items)
+        chunk_count = min(len(names), workers * 4)
+        chunks: list[JObject] = [
+            {name: items[name] for name in names[i::chunk_count]}
+            for i in range(chunk_count)
+        ]
+        for finished_items in executor.map(finish_fn, chunks, repeat(kind)):
+            items.update(finished_items)
+
+    def _make_finish_context(self) -> FinishContext:
+        return FinishContext(
+            j_object(self._dictionary.setdefault("attributes", {})),
+            self.browser_mode,
+            # Known issue with the 1.0.0-rc.2 with "splunk" extension
+            "splunk" in self._extensions and self._version == "1.0.0-rc.2",
+        )
 
     def _create_compile_output(self) -> JObject:
         if self.legacy_mode:
@@ -2706,8 +3931,164 @@ class SchemaCompiler:
             "version": self._version,
             "compile_version": 1,
         }
+        if self.runtime_mode:
+            output["runtime_mode?"] = True
         if self.browser_mode:
             output["browser_mode?"] = True
             output["all_classes"] = self._all_classes
             output["all_objects"] = self._all_objects
         return output
+
+
+# Finishing item attributes is independent for each item, so it can be done in worker
+# processes or threads. These functions are at module level so worker processes can run
+# them.
+
+
+@dataclass(slots=True)
+class FinishContext:
+    """Information needed to finish item attributes, sent once to each worker."""
+
+    dictionary_attributes: JObject
+    browser_mode: bool
+    # Tolerate the undefined attribute in the "splunk/splunk" profile of the "splunk"
+    # extension compiled with schema version 1.0.0-rc.2
+    tolerate_splunk_issue: bool
+
+
+# The finish context of a worker process, set by _init_finish_worker
+_worker_finish_context: FinishContext | None = None
+
+
+def _init_finish_worker(context: FinishContext) -> None:
+    global _worker_finish_context
+    _worker_finish_context = context
+
+
+def _finish_items_in_worker(items: JObject, kind: str) -> JObject:
+    assert _worker_finish_context is not None, "finish worker is not initialized"
+    return _finish_items(_worker_finish_context, items, kind)
+
+
+def _finish_items(context: FinishContext, items: JObject, kind: str) -> JObject:
+    """Finish the attributes of items in place, returning items."""
+    dictionary_attributes = context.dictionary_attributes
+    for item_name, item in items.items():
+        item = j_object(item)
+        attributes = j_object(item.setdefault("attributes", {}))
+        new_attributes: JObject = {}
+        for attribute_name, attribute in attributes.items():
+            # TODO: Attribute that is not defined in dictionary attributes should
+            #       never happen at this point, but does today due to the flawed
+            #       splunk/splunk profile in the "splunk" extension. Once fixed,
+            #       the if / else block can be removed, and here we can use an
+            #       assert to catch logic bugs.
+            # TODO: Start of what this block of code should eventually look like
+            # assert attribute_name in dictionary_attributes, (
+            #     f'Attribute "{attribute_name}" is not a defined dictionary'
+            #     " attribute; this should have been caught earlier in the compile"
+            #     " process"
+            # )
+            # new_attribute = deep_copy_j_object(
+            #     j_object(dictionary_attributes[attribute_name])
+            # )
+            # deep_merge(new_attribute, attribute)
+            # new_attributes[attribute_name] = new_attribute
+            # TODO: End of what this block of code should eventually look like
+            attribute = j_object(attribute)
+            if attribute_name in dictionary_attributes:
+                new_attribute = deep_copy_j_object(
+                    j_object(dictionary_attributes[attribute_name])
+                )
+                deep_merge(new_attribute, attribute)
+                new_attributes[attribute_name] = new_attribute
+            else:
+                # This is a known issue with the 1.0.0-rc.2 with "splunk" extension
+                # compilation, so we will log and ignore this specific case, and
+                # assert otherwise.
+                if item_name == "splunk/splunk" and context.tolerate_splunk_issue:
+                    logger.debug(
+                        "_finish_item_attributes - ignoring know issue with"
+                        ' extension "splunk": attribute "%s" in %s "%s" is not a'
+                        " defined dictionary attribute",
+                        attribute_name,
+                        kind,
+                        item_name,
+                    )
+                else:
+                    assert attribute_name in dictionary_attributes, (
+                        f'Attribute "{attribute_name}" in {kind} "{item_name}" is'
+                        f" not a defined dictionary attribute; this should have"
+                        f" been caught earlier in the compile process"
+                    )
+
+        item["attributes"] = new_attributes
+        if context.browser_mode:
+            _add_sibling_of_to_attributes(new_attributes)
+    return items
+
+
+def _add_nested_container_ids(value: JObject | JArray, ids: set[int]) -> None:
+    for child in value.values() if isinstance(value, dict) else value:
+        if isinstance(child, (dict, list)):
+            ids.add(id(child))
+            _add_nested_container_ids(child, ids)
+
+
+def _copy_included_containers(value: JObject | JArray, ids: set[int]) -> None:
+    """Replace the containers nested in value whose ids are in ids with copies."""
+    if isinstance(value, dict):
+        for key, child in value.items():
+            copy = _included_container_copy(child, ids)
+            if copy is not None:
+                value[key] = copy
+    else:
+        for i, child in enumerate(value):
+            copy = _included_container_copy(child, ids)
+            if copy is not None:
+                value[i] = copy
+
+
+def _included_container_copy(value: JValue, ids: set[int]) -> JValue:
+    """
+    Returns a copy of value if it is a container whose id is in ids. Otherwise, copies
+    the included containers nested in value, returning None.
+    """
+    if isinstance(value, dict):
+        if id(value) in ids:
+            return deep_copy_j_object(value)
+        _copy_included_containers(value, ids)
+    elif isinstance(value, list):
+        if id(value) in ids:
+            return deep_copy_j_array(value)
+        _copy_included_containers(value, ids)
+    return None
+
+
+def _add_sibling_of_to_attributes(attributes: JObject) -> None:
+    # This must be done after finalizing attributes so full enum attribute details
+    # are present. Specifically the enum attribute "sibling" key.
+
+    sibling_of_dict: dict[str, str] = {}
+    # Enum attributes point to their enum sibling through the :sibling attribute,
+    # however the siblings do _not_ refer back to their related enum attribute,
+    # so let's build that.
+    # First pass, iterate attributes to find enum attributes and create mapping to
+    # their siblings.
+    for attribute_name, attribute in attributes.items():
+        attribute = j_object(attribute)
+        if "sibling" in attribute:
+            # This is an enum attribute
+            sibling_of_dict[j_string(attribute["sibling"])] = attribute_name
+
+    if not sibling_of_dict:
+        # no enum attributes present in attributes, so nothing to do
+        return  # skip iterating attributes again uselessly
+
+    # Second pass, look for enum attributes and add "_sibling_of" mapping
+    for attribute_name, attribute in attributes.items():
+        attribute = j_object(attribute)
+        if attribute_name in sibling_of_dict:
+            # This is an enum sibling. Add "_sibling_of" pointing back to its
+            # related enum attribute.
+            attribute["_sibling_of"] = sibling_of_dict[attribute_name]
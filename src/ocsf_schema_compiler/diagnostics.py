@@ -0,0 +1,72 @@
+"""
+Structured records of the warnings and errors found while compiling, so tools can
+inspect them without parsing log messages.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+from ocsf_schema_compiler.jsonish import JObject
+
+type Severity = Literal["error", "warning"]
+
+# Codes identifying the kind of problem. Codes are stable, unlike message text.
+type DiagnosticCode = Literal[
+    # Warnings
+    "metaschema-missing",
+    "known-issue",
+    "empty-include",
+    "placeholder-description",
+    "missing-requirement",
+    # Errors
+    "collision",
+    "observable-collision",
+    "unsafe-change",
+    "undefined-attribute",
+    "undefined-profile",
+    "invalid-profile-name",
+    "undefined-patch-target",
+    "illegal-patch",
+    "metaschema-violation",
+]
+
+
+@dataclass(slots=True, frozen=True)
+class Diagnostic:
+    severity: Severity
+    code: DiagnosticCode
+    message: str
+    # Kind of item with the problem, such as "class", "object", "profile", or
+    # "dictionary", when known
+    item_kind: str | None = None
+    item_name: str | None = None
+    attribute: str | None = None
+    # Base directory of the schema or extension, or the file, with the problem
+    path: Path | None = None
+
+    def to_j_object(self) -> JObject:
+        """Returns diagnostic as a JSON object, leaving out unknown values."""
+        obj: JObject = {
+            "severity": self.severity,
+            "code": self.code,
+            "message": self.message,
+        }
+        if self.item_kind is not None:
+            obj["item_kind"] = self.item_kind
+        if self.item_name is not None:
+            obj["item_name"] = self.item_name
+        if self.attribute is not None:
+            obj["attribute"] = self.attribute
+        if self.path is not None:
+            obj["path"] = str(self.path)
+        return obj
+
+
+def filter_diagnostics(
+    diagnostics: Iterable[Diagnostic], codes: Iterable[str]
+) -> list[Diagnostic]:
+    """Returns the diagnostics with one of codes."""
+    code_set = set(codes)
+    return [d for d in diagnostics if d.code in code_set]
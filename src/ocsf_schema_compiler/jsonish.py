@@ -22,21 +22,47 @@ def json_type_from_value(value: object) -> str:
         return "array"
     if isinstance(value, str):
         return "string"
-    if isinstance(value, int):
-        return "number (integer)"
-    if isinstance(value, float):
-        return "number (float)"
+    # bool is a subclass of int, so check it first
     if isinstance(value, bool):
         if value:
             return "true"
         return "false"
+    if isinstance(value, int):
+        return "number (integer)"
+    if isinstance(value, float):
+        return "number (float)"
     if value is None:
         return "null"
     return f"non-JSON type: {type(value).__name__}"
 
 
+def json_equal(left: JValue, right: JValue) -> bool:
+    """
+    Returns whether left and right are equal as JSON values. Unlike with Python's
+    equality, booleans, integers, and floats are never equal to each other, so True,
+    1, and 1.0 all differ.
+    """
+    return left is right or (left == right and _same_types(left, right))
+
+
+def _same_types(left: JValue, right: JValue) -> bool:
+    # Only called with values that compare equal, so objects have the same keys and
+    # arrays the same length
+    if left is right:
+        return True
+    if type(left) is not type(right):
+        return False
+    if isinstance(left, dict) and isinstance(right, dict):
+        return all(_same_types(value, right[key]) for key, value in left.items())
+    if isinstance(left, list) and isinstance(right, list):
+        return all(map(_same_types, left, right))
+    return True
+
+
 # These j_* function are for type safety. They keep Pyright happy.
 # The assertion error messages are given in terms of JSON types, mostly.
+# The shapes of schema files are validated when read (see the shape module), so these
+# assertions only catch compiler bugs, and can be skipped with python -O.
 # JSON does not have a integer type, though we have j_integer rather than a more
 # general j_number.
 
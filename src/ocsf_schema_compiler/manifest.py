@@ -0,0 +1,130 @@
+"""
+Content hash manifests of compiled schemas.
+
+A manifest has a SHA-256 hash of each class, object, profile, and dictionary attribute,
+and of the whole schema. Hashes are of canonical JSON (sorted keys, no whitespace), so
+they only depend on content. The hashes form a Merkle tree: the hash of an item table,
+such as "classes", is computed from the hashes of its items, and the schema hash from
+the hashes of its top-level values, so each item is serialized only once. Items whose
+hash is unchanged between two schemas are unchanged.
+
+Manifest layout:
+    {
+        "algorithm": "sha256",
+        "hash": <schema hash>,
+        "tables": [
+            {"path": ["classes"], "hash": <table hash>, "items": {<name>: <hash>}},
+            ...
+        ]
+    }
+"""
+
+import hashlib
+import json
+
+from ocsf_schema_compiler.jsonish import JArray, JObject, JValue, j_array, j_object
+
+ALGORITHM = "sha256"
+
+# Paths of item tables in compiled schemas, including the legacy layout
+ITEM_TABLE_PATHS: list[tuple[str, ...]] = [
+    ("classes",),
+    ("objects",),
+    ("profiles",),
+    ("dictionary", "attributes"),
+    ("dictionary_attributes",),
+]
+
+# Paths of objects holding item tables, whose hashes are computed from their children
+_PARENT_PATHS: set[tuple[str, ...]] = {
+    path[:i] for path in ITEM_TABLE_PATHS for i in range(len(path))
+}
+
+
+def build_manifest(schema: JObject) -> JObject:
+    """Returns the content hash manifest of a compiled schema."""
+    tables: JArray = []
+    schema_hash = _node_hash(schema, (), tables)
+    return {"algorithm": ALGORITHM, "hash": schema_hash, "tables": tables}
+
+
+def content_hash(value: JValue) -> str:
+    """Returns the hash of the canonical JSON encoding of value."""
+    encoded = json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def item_table_hashes(manifest: JObject) -> dict[tuple[str, ...], JObject]:
+    """Returns the item hashes of each item table in manifest, keyed by table path."""
+    hashes: dict[tuple[str, ...], JObject] = {}
+    for table in j_array(manifest.get("tables", [])):
+        table = j_object(table)
+        path = tuple(str(key) for key in j_array(table["path"]))
+        hashes[path] = j_object(table["items"])
+    return hashes
+
+
+def manifest_matches(schema: JObject, manifest: JObject) -> bool:
+    """
+    Returns whether manifest could be the manifest of schema. The schema hash is
+    recomputed from the values of schema outside item tables and the item hashes of
+    manifest, and each item table must have the same item names as in schema. Items are
+    not hashed, which would cost as much as building the manifest, so a manifest with a
+    stale hash for an item is not detected.
+    """
+    if manifest.get("algorithm") != ALGORITHM:
+        return False
+    tables = item_table_hashes(manifest)
+    return _manifest_node_hash(schema, (), tables) == manifest.get("hash")
+
+
+def _node_hash(value: JValue, path: tuple[str, ...], tables: JArray) -> str:
+    if not isinstance(value, dict):
+        return content_hash(value)
+    if path in _PARENT_PATHS:
+        child_hashes: JObject = {
+            key: _node_hash(child, (*path, key), tables) for key, child in value.items()
+        }
+    elif path in ITEM_TABLE_PATHS:
+        child_hashes = {name: content_hash(item) for name, item in value.items()}
+        tables.append(
+            {
+                "path": list[JValue](path),
+                "hash": _merkle_hash(child_hashes),
+                "items": child_hashes,
+            }
+        )
+    else:
+        return content_hash(value)
+    return _merkle_hash(child_hashes)
+
+
+def _manifest_node_hash(
+    value: JValue, path: tuple[str, ...], tables: dict[tuple[str, ...], JObject]
+) -> str | None:
+    # Like _node_hash, but with item hashes from a manifest; None if they do not match
+    if not isinstance(value, dict):
+        return content_hash(value)
+    if path in _PARENT_PATHS:
+        child_hashes: JObject = {}
+        for key, child in value.items():
+            child_hash = _manifest_node_hash(child, (*path, key), tables)
+            if child_hash is None:
+                return None
+            child_hashes[key] = child_hash
+    elif path in ITEM_TABLE_PATHS:
+        item_hashes = tables.get(path)
+        if item_hashes is None or item_hashes.keys() != value.keys():
+            return None
+        child_hashes = item_hashes
+    else:
+        return content_hash(value)
+    return _merkle_hash(child_hashes)
+
+
+def _merkle_hash(child_hashes: JObject) -> str:
+    # Prefixed so the hash of an object's child hashes cannot be mistaken for the hash
+    # of an object with the same (hash string) values
+    return content_hash(["merkle", child_hashes])
@@ -0,0 +1,312 @@
+"""
+Validation of schema files against the JSON Schema metaschema shipped in a schema's
+"metaschema" directory.
+
+This implements the subset of JSON Schema (draft 2020-12) used by the OCSF metaschema,
+keeping this project free of runtime dependencies. Unsupported keywords, such as
+"format", are ignored.
+"""
+
+import re
+from pathlib import Path
+
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.jsonish import JObject, JValue, json_type_from_value
+from ocsf_schema_compiler.structured_read import SchemaSource
+
+# Metaschema file names for each kind of schema file. Class, object, and profile files
+# are keyed by the name of the directory holding them.
+METASCHEMA_FILE_NAMES: dict[str, str] = {
+    "events": "event.schema.json",
+    "objects": "object.schema.json",
+    "profiles": "profile.schema.json",
+    "categories.json": "categories.schema.json",
+    "dictionary.json": "dictionary.schema.json",
+    "extension.json": "extension.schema.json",
+}
+
+# Type of JSON Schema, which can also be a boolean
+type JSONSchema = JObject | bool
+
+
+class Metaschema:
+    """
+    JSON schemas of schema files, keyed by file name. References ("$ref") between the
+    schemas are by file name, optionally followed by a JSON pointer fragment.
+    """
+
+    def __init__(self, schemas: dict[str, JObject]) -> None:
+        self.schemas: dict[str, JObject] = schemas
+        self._patterns: dict[str, re.Pattern[str]] = {}
+
+    def validate(self, schema_name: str, instance: JValue) -> list[str]:
+        """
+        Validate instance against the metaschema file schema_name, returning error
+        messages, each starting with the JSON pointer of the invalid value. Returns an
+        empty list if the instance is valid, or if the metaschema does not have
+        schema_name.
+        """
+        if schema_name not in self.schemas:
+            return []
+        errors: list[str] = []
+        self._validate(self.schemas[schema_name], schema_name, instance, "", errors)
+        return errors
+
+    def _validate(
+        self,
+        schema: JSONSchema,
+        base: str,
+        instance: JValue,
+        pointer: str,
+        errors: list[str],
+    ) -> None:
+        """
+        Validate instance against schema, adding error messages to errors. The base is
+        the name of the metaschema file containing schema, used to resolve references.
+        """
+        if schema is True:
+            return
+        if schema is False:
+            errors.append(f"{pointer or '/'}: value is not allowed")
+            return
+
+        if "$ref" in schema:
+            ref_base, ref_schema = self._resolve_ref(base, str(schema["$ref"]))
+            self._validate(ref_schema, ref_base, instance, pointer, errors)
+
+        if "type" in schema and not _is_type(instance, schema["type"]):
+            errors.append(
+                f"{pointer or '/'}: expected {_type_text(schema['type'])}, but got"
+                f" {json_type_from_value(instance)}"
+            )
+            # Other keywords assume the type is right, so avoid cascading errors
+            return
+
+        if "const" in schema and not _json_equal(instance, schema["const"]):
+            errors.append(f"{pointer or '/'}: expected {schema['const']!r}")
+        if "enum" in schema:
+            allowed = schema["enum"]
+            if isinstance(allowed, list) and not any(
+                _json_equal(instance, a) for a in allowed
+            ):
+                errors.append(
+                    f"{pointer or '/'}: {instance!r} is not one of"
+                    f" {', '.join(repr(a) for a in allowed)}"
+                )
+
+        if isinstance(instance, dict):
+            self._validate_object(schema, base, instance, pointer, errors)
+        elif isinstance(instance, list):
+            self._validate_array(schema, base, instance, pointer, errors)
+        elif isinstance(instance, str):
+            self._validate_string(schema, instance, pointer, errors)
+        elif isinstance(instance, (int, float)) and not isinstance(instance, bool):
+            _validate_number(schema, instance, pointer, errors)
+
+        for sub_schema in _schemas(schema.get("allOf")):
+            self._validate(sub_schema, base, instance, pointer, errors)
+        any_of = _schemas(schema.get("anyOf"))
+        if any_of and not any(self._is_valid(s, base, instance) for s in any_of):
+            errors.append(f"{pointer or '/'}: does not match any allowed form")
+        one_of = _schemas(schema.get("oneOf"))
+        if one_of and sum(self._is_valid(s, base, instance) for s in one_of) != 1:
+            errors.append(f"{pointer or '/'}: does not match exactly one allowed form")
+        not_schema = schema.get("not")
+        if isinstance(not_schema, (dict, bool)) and self._is_valid(
+            not_schema, base, instance
+        ):
+            errors.append(f"{pointer or '/'}: matches a disallowed form")
+        if_schema = schema.get("if")
+        if isinstance(if_schema, (dict, bool)):
+            if self._is_valid(if_schema, base, instance):
+                then_schema = schema.get("then")
+                if isinstance(then_schema, (dict, bool)):
+                    self._validate(then_schema, base, instance, pointer, errors)
+            else:
+                else_schema = schema.get("else")
+                if isinstance(else_schema, (dict, bool)):
+                    self._validate(else_schema, base, instance, pointer, errors)
+
+    def _is_valid(self, schema: JSONSchema, base: str, instance: JValue) -> bool:
+        errors: list[str] = []
+        self._validate(schema, base, instance, "", errors)
+        return not errors
+
+    def _validate_object(
+        self,
+        schema: JObject,
+        base: str,
+        instance: JObject,
+        pointer: str,
+        errors: list[str],
+    ) -> None:
+        required = schema.get("required")
+        if isinstance(required, list):
+            for key in required:
+                if key not in instance:
+                    errors.append(f'{pointer or "/"}: missing required "{key}"')
+
+        properties = schema.get("properties")
+        if not isinstance(properties, dict):
+            properties = {}
+        pattern_properties = schema.get("patternProperties")
+        if not isinstance(pattern_properties, dict):
+            pattern_properties = {}
+        additional = schema.get("additionalProperties", True)
+
+        for key, value in instance.items():
+            key_pointer = f"{pointer}/{_escape_pointer(key)}"
+            matched = False
+            if key in properties:
+                matched = True
+                property_schema = properties[key]
+                if isinstance(property_schema, (dict, bool)):
+                    self._validate(property_schema, base, value, key_pointer, errors)
+            for pattern, pattern_schema in pattern_properties.items():
+                if self._pattern(pattern).search(key):
+                    matched = True
+                    if isinstance(pattern_schema, (dict, bool)):
+                        self._validate(pattern_schema, base, value, key_pointer, errors)
+            if not matched:
+                if additional is False:
+                    errors.append(f'{pointer or "/"}: unexpected "{key}"')
+                elif isinstance(additional, dict):
+                    self._validate(additional, base, value, key_pointer, errors)
+
+    def _validate_array(
+        self,
+        schema: JObject,
+        base: str,
+        instance: list[JValue],
+        pointer: str,
+        errors: list[str],
+    ) -> None:
+        min_items = schema.get("minItems")
+        if isinstance(min_items, int) and len(instance) < min_items:
+            errors.append(f"{pointer or '/'}: expected at least {min_items} items")
+        max_items = schema.get("maxItems")
+        if isinstance(max_items, int) and len(instance) > max_items:
+            errors.append(f"{pointer or '/'}: expected at most {max_items} items")
+        items = schema.get("items")
+        if isinstance(items, (dict, bool)):
+            for i, value in enumerate(instance):
+                self._validate(items, base, value, f"{pointer}/{i}", errors)
+
+    def _validate_string(
+        self, schema: JObject, instance: str, pointer: str, errors: list[str]
+    ) -> None:
+        min_length = schema.get("minLength")
+        if isinstance(min_length, int) and len(instance) < min_length:
+            errors.append(
+                f"{pointer or '/'}: expected at least {min_length} characters"
+            )
+        max_length = schema.get("maxLength")
+        if isinstance(max_length, int) and len(instance) > max_length:
+            errors.append(f"{pointer or '/'}: expected at most {max_length} characters")
+        pattern = schema.get("pattern")
+        if isinstance(pattern, str) and not self._pattern(pattern).search(instance):
+            errors.append(
+                f"{pointer or '/'}: {instance!r} does not match pattern {pattern!r}"
+            )
+
+    def _resolve_ref(self, base: str, ref: str) -> tuple[str, JSONSchema]:
+        file_name, _, fragment = ref.partition("#")
+        if file_name:
+            # References are relative to the referring file, and all metaschema files
+            # are in the same directory
+            base = file_name.rsplit("/", 1)[-1]
+        if base not in self.schemas:
+            raise SchemaException(
+                f'Metaschema reference "{ref}" to undefined file "{base}"'
+            )
+        schema: JValue = self.schemas[base]
+        for token in fragment.split("/")[1:]:
+            token = token.replace("~1", "/").replace("~0", "~")
+            if isinstance(schema, dict) and token in schema:
+                schema = schema[token]
+            elif isinstance(schema, list) and token.isdigit():
+                schema = schema[int(token)]
+            else:
+                raise SchemaException(f'Metaschema reference "{ref}" not found')
+        if not isinstance(schema, (dict, bool)):
+            raise SchemaException(f'Metaschema reference "{ref}" is not a schema')
+        return base, schema
+
+    def _pattern(self, pattern: str) -> re.Pattern[str]:
+        compiled = self._patterns.get(pattern)
+        if compiled is None:
+            compiled = re.compile(pattern)
+            self._patterns[pattern] = compiled
+        return compiled
+
+
+def read_metaschema(source: SchemaSource, path: Path) -> Metaschema | None:
+    """
+    Read the metaschema in directory path of source. Returns None if there is no
+    metaschema directory, as is the case for older schema versions.
+    """
+    if not source.is_dir(path):
+        return None
+    schemas: dict[str, JObject] = {}
+    for dir_path, file_names in source.walk(path):
+        if dir_path == path:
+            for file_name in file_names:
+                if file_name.endswith(".json"):
+                    schemas[file_name] = source.read_json_object(path / file_name)
+    return Metaschema(schemas)
+
+
+def _schemas(value: JValue) -> list[JSONSchema]:
+    if not isinstance(value, list):
+        return []
+    return [v for v in value if isinstance(v, (dict, bool))]
+
+
+def _validate_number(
+    schema: JObject, instance: int | float, pointer: str, errors: list[str]
+) -> None:
+    minimum = schema.get("minimum")
+    if isinstance(minimum, (int, float)) and instance < minimum:
+        errors.append(f"{pointer or '/'}: {instance} is less than {minimum}")
+    maximum = schema.get("maximum")
+    if isinstance(maximum, (int, float)) and instance > maximum:
+        errors.append(f"{pointer or '/'}: {instance} is greater than {maximum}")
+
+
+def _is_type(instance: JValue, expected: JValue) -> bool:
+    if isinstance(expected, list):
+        return any(_is_type(instance, e) for e in expected)
+    match expected:
+        case "object":
+            return isinstance(instance, dict)
+        case "array":
+            return isinstance(instance, list)
+        case "string":
+            return isinstance(instance, str)
+        case "integer":
+            return isinstance(instance, int) and not isinstance(instance, bool)
+        case "number":
+            return isinstance(instance, (int, float)) and not isinstance(instance, bool)
+        case "boolean":
+            return isinstance(instance, bool)
+        case "null":
+            return instance is None
+        case _:
+            return True
+
+
+def _type_text(expected: JValue) -> str:
+    if isinstance(expected, list):
+        return " or ".join(str(e) for e in expected)
+    return str(expected)
+
+
+def _json_equal(a: JValue, b: JValue) -> bool:
+    # In JSON, true and 1 are different values, unlike in Python
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    return a == b
+
+
+def _escape_pointer(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
@@ -0,0 +1,182 @@
+"""
+Normalized layout of compiled schemas, where identical attribute details and enums are
+stored once and referenced by index.
+
+Compiled schemas repeat the details of dictionary attributes in every class and object
+using them, along with their enums. In the normalized layout, the "attributes" of each
+class, object, and profile, and the dictionary's attributes, map attribute names to
+indexes in the top-level "shared_attributes" array. Attribute details in that array
+have "enum" set to an index in the top-level "shared_enums" array rather than the enum
+itself. Everything else is unchanged.
+
+Normalized schemas are rehydrated to the regular layout with rehydrate, or one item at a
+time with rehydrate_item. Rehydrated items share attribute details and enums, so copy
+them before modifying them.
+"""
+
+import json
+from collections.abc import Sized
+
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.jsonish import JArray, JObject, JValue, j_array, j_object
+
+# Top-level key marking normalized schemas
+NORMALIZED_KEY = "normalized?"
+
+# Item tables whose items have attributes, including the legacy layout
+_ITEM_TABLE_KEYS = ("classes", "objects", "profiles")
+
+
+def is_normalized(schema: JObject) -> bool:
+    return schema.get(NORMALIZED_KEY) is True
+
+
+def normalize(schema: JObject) -> JObject:
+    """Returns schema in the normalized layout. Schema is not modified."""
+    tables = _SharedTables()
+    normalized = dict(schema)
+    for key in _ITEM_TABLE_KEYS:
+        if isinstance(items := schema.get(key), dict):
+            normalized[key] = {
+                name: tables.item(j_object(item)) for name, item in items.items()
+            }
+    # Legacy layout
+    if isinstance(base_event := schema.get("base_event"), dict):
+        normalized["base_event"] = tables.item(base_event)
+    if isinstance(attributes := schema.get("dictionary_attributes"), dict):
+        normalized["dictionary_attributes"] = tables.attributes(attributes)
+
+    if isinstance(dictionary := schema.get("dictionary"), dict):
+        dictionary = dict(dictionary)
+        if isinstance(attributes := dictionary.get("attributes"), dict):
+            dictionary["attributes"] = tables.attributes(attributes)
+        normalized["dictionary"] = dictionary
+
+    normalized[NORMALIZED_KEY] = True
+    normalized["shared_attributes"] = tables.attribute_list
+    normalized["shared_enums"] = tables.enum_list
+    return normalized
+
+
+def rehydrate(schema: JObject) -> JObject:
+    """Returns normalized schema in the regular layout. Schema is not modified."""
+    attributes = _rehydrated_attributes(schema)
+    rehydrated = {
+        k: v
+        for k, v in schema.items()
+        if k not in (NORMALIZED_KEY, "shared_attributes", "shared_enums")
+    }
+    for key in _ITEM_TABLE_KEYS:
+        if isinstance(items := schema.get(key), dict):
+            rehydrated[key] = {
+                name: _rehydrated_item(j_object(item), attributes)
+                for name, item in items.items()
+            }
+    if isinstance(base_event := schema.get("base_event"), dict):
+        rehydrated["base_event"] = _rehydrated_item(base_event, attributes)
+    if isinstance(indexes := schema.get("dictionary_attributes"), dict):
+        rehydrated["dictionary_attributes"] = _attributes_by_name(indexes, attributes)
+    if isinstance(dictionary := schema.get("dictionary"), dict):
+        dictionary = dict(dictionary)
+        if isinstance(indexes := dictionary.get("attributes"), dict):
+            dictionary["attributes"] = _attributes_by_name(indexes, attributes)
+        rehydrated["dictionary"] = dictionary
+    return rehydrated
+
+
+def rehydrate_item(schema: JObject, table_key: str, item_name: str) -> JObject:
+    """
+    Returns the item_name item of the table_key item table ("classes", "objects", or
+    "profiles") of normalized schema in the regular layout, rehydrating only the
+    attributes it uses.
+    """
+    item = j_object(j_object(schema[table_key])[item_name])
+    shared_attributes = j_array(schema["shared_attributes"])
+    shared_enums = j_array(schema["shared_enums"])
+    rehydrated = dict(item)
+    if "attributes" in item:
+        rehydrated["attributes"] = {
+            name: _rehydrated_attribute(
+                j_object(shared_attributes[_index(index, shared_attributes)]),
+                shared_enums,
+            )
+            for name, index in j_object(item["attributes"]).items()
+        }
+    return rehydrated
+
+
+class _SharedTables:
+    """Tables of distinct attribute details and enums, with indexes keyed by JSON."""
+
+    def __init__(self) -> None:
+        self.attribute_list: JArray = []
+        self.enum_list: JArray = []
+        self._attribute_indexes: dict[str, int] = {}
+        self._enum_indexes: dict[str, int] = {}
+
+    def item(self, item: JObject) -> JObject:
+        if not isinstance(attributes := item.get("attributes"), dict):
+            return item
+        return {**item, "attributes": self.attributes(attributes)}
+
+    def attributes(self, attributes: JObject) -> JObject:
+        return {
+            name: self.attribute(j_object(attribute))
+            for name, attribute in attributes.items()
+        }
+
+    def attribute(self, attribute: JObject) -> int:
+        if isinstance(enum := attribute.get("enum"), dict):
+            attribute = {**attribute, "enum": self._index(enum, self.enum_list, True)}
+        return self._index(attribute, self.attribute_list, False)
+
+    def _index(self, value: JObject, values: JArray, is_enum: bool) -> int:
+        indexes = self._enum_indexes if is_enum else self._attribute_indexes
+        key = json.dumps(value, sort_keys=True, separators=(",", ":"))
+        index = indexes.get(key)
+        if index is None:
+            index = len(values)
+            values.append(value)
+            indexes[key] = index
+        return index
+
+
+def _rehydrated_attributes(schema: JObject) -> list[JObject]:
+    shared_enums = j_array(schema["shared_enums"])
+    return [
+        _rehydrated_attribute(j_object(attribute), shared_enums)
+        for attribute in j_array(schema["shared_attributes"])
+    ]
+
+
+def _rehydrated_attribute(attribute: JObject, shared_enums: JArray) -> JObject:
+    if "enum" not in attribute:
+        return attribute
+    return {**attribute, "enum": shared_enums[_index(attribute["enum"], shared_enums)]}
+
+
+def _rehydrated_item(item: JObject, attributes: list[JObject]) -> JObject:
+    if not isinstance(indexes := item.get("attributes"), dict):
+        return item
+    return {**item, "attributes": _attributes_by_name(indexes, attributes)}
+
+
+def _attributes_by_name(indexes: JObject, attributes: list[JObject]) -> JObject:
+    return {
+        name: attributes[_index(index, attributes)] for name, index in indexes.items()
+    }
+
+
+def _index(value: JValue, values: Sized) -> int:
+    # Indexes come from files, so they are checked even with python -O, and negative
+    # indexes are not accepted
+    if (
+        not isinstance(value, int)
+        or isinstance(value, bool)
+        or not 0 <= value < len(values)
+    ):
+        raise SchemaException(
+            f"Normalized schema: expected index below {len(values)} but got"
+            f" {json.dumps(value)}"
+        )
+    return value
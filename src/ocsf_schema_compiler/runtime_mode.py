@@ -0,0 +1,51 @@
+"""
+Runtime mode removes documentation from compiled output, keeping what is needed to
+validate events. Values are replaced rather than modified, since attribute details and
+enums can be shared between items.
+"""
+
+from ocsf_schema_compiler.jsonish import JObject, j_object
+
+# Keys removed from classes, objects, profiles, categories, dictionary types, and enum
+# values
+ITEM_DOCUMENTATION_KEYS = frozenset(("description", "references"))
+# Keys removed from attributes. Unlike items, attributes are identified by their keys,
+# so their captions, and the captions of their types and object types, are removed too.
+ATTRIBUTE_DOCUMENTATION_KEYS = frozenset(
+    ("caption", "description", "references", "object_name", "type_name")
+)
+
+
+def remove_items_documentation(items: JObject) -> None:
+    """Replace each of items with a copy without documentation."""
+    for item_name, item in items.items():
+        items[item_name] = item_without_documentation(j_object(item))
+
+
+def item_without_documentation(item: JObject) -> JObject:
+    """Returns a shallow copy of item without documentation, including attributes."""
+    new_item = {k: v for k, v in item.items() if k not in ITEM_DOCUMENTATION_KEYS}
+    if "attributes" in item:
+        new_item["attributes"] = {
+            attribute_name: attribute_without_documentation(j_object(attribute))
+            for attribute_name, attribute in j_object(item["attributes"]).items()
+        }
+    return new_item
+
+
+def attribute_without_documentation(attribute: JObject) -> JObject:
+    """Returns a shallow copy of attribute without documentation."""
+    new_attribute = {
+        k: v for k, v in attribute.items() if k not in ATTRIBUTE_DOCUMENTATION_KEYS
+    }
+    if "enum" in attribute:
+        # Enum captions are kept, as they are the values of sibling attributes
+        new_attribute["enum"] = {
+            value: {
+                k: v
+                for k, v in j_object(detail).items()
+                if k not in ITEM_DOCUMENTATION_KEYS
+            }
+            for value, detail in j_object(attribute["enum"]).items()
+        }
+    return new_attribute
@@ -0,0 +1,215 @@
+"""
+Compatibility report of the changes between two compiled schemas, such as two OCSF
+releases.
+
+Rather than walking the schemas generically (see the schema_diff module), items are
+compared by name: each class, object, profile, and dictionary attribute of the old
+schema is looked up in the new schema, equal items are skipped, and only the parts of
+items that matter for compatibility are compared. Values are compared as JSON, so a
+change from true to 1 is reported. Captions, descriptions, and other documentation
+are ignored.
+
+A change is breaking when data that is valid with the old schema can be invalid with
+the new schema: removing a class, object, or attribute, adding a required attribute,
+making an attribute required, changing an attribute's type, or removing enum values.
+Other changes, such as adding optional attributes or enum values, are additive.
+"""
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Literal
+
+from ocsf_schema_compiler.jsonish import JObject, JValue, json_equal
+
+type Compatibility = Literal["breaking", "additive"]
+
+# Item tables compared, as (item kind, path to table), including the legacy layout
+_ITEM_TABLES: list[tuple[str, tuple[str, ...]]] = [
+    ("class", ("classes",)),
+    ("object", ("objects",)),
+    ("profile", ("profiles",)),
+    ("dictionary attribute", ("dictionary", "attributes")),
+    ("dictionary attribute", ("dictionary_attributes",)),
+]
+
+# Attribute properties that change which values are valid
+_TYPE_KEYS = ("type", "is_array", "object_type")
+
+
+@dataclass(slots=True, frozen=True)
+class Change:
+    compatibility: Compatibility
+    # Kind of item changed: "class", "object", "profile", or "dictionary attribute"
+    item_kind: str
+    item_name: str
+    # Attribute of the item changed, if the change is to an attribute
+    attribute: str | None
+    description: str
+
+    def formatted_string(self) -> str:
+        if self.attribute is None:
+            return f"{self.item_kind} {self.item_name}: {self.description}"
+        return (
+            f'{self.item_kind} {self.item_name} attribute "{self.attribute}":'
+            f" {self.description}"
+        )
+
+    def to_j_object(self) -> JObject:
+        return {
+            "compatibility": self.compatibility,
+            "item_kind": self.item_kind,
+            "item_name": self.item_name,
+            "attribute": self.attribute,
+            "description": self.description,
+        }
+
+
+def schema_changes(old: JObject, new: JObject) -> list[Change]:
+    """
+    Returns the changes from old to new, breaking changes first, then in order of item
+    kind and name.
+    """
+    changes = list(iter_schema_changes(old, new))
+    changes.sort(key=lambda c: c.compatibility != "breaking")
+    return changes
+
+
+def iter_schema_changes(old: JObject, new: JObject) -> Iterator[Change]:
+    """Yields the changes from old to new, in order of item kind and name."""
+    for item_kind, path in _ITEM_TABLES:
+        old_items = _table(old, path)
+        new_items = _table(new, path)
+        if old_items is None or new_items is None:
+            continue
+        for name in sorted(old_items.keys() | new_items.keys()):
+            old_item = old_items.get(name)
+            new_item = new_items.get(name)
+            if json_equal(old_item, new_item):
+                continue
+            if not isinstance(new_item, dict):
+                yield Change("breaking", item_kind, name, None, "removed")
+            elif not isinstance(old_item, dict):
+                yield Change("additive", item_kind, name, None, "added")
+            elif item_kind == "dictionary attribute":
+                yield from _attribute_changes(item_kind, name, None, old_item, new_item)
+            else:
+                yield from _item_changes(item_kind, name, old_item, new_item)
+
+
+def _table(schema: JObject, path: tuple[str, ...]) -> JObject | None:
+    value: JValue = schema
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    if isinstance(value, dict):
+        return value
+    return None
+
+
+def _item_changes(
+    item_kind: str, name: str, old_item: JObject, new_item: JObject
+) -> Iterator[Change]:
+    old_uid = old_item.get("uid")
+    new_uid = new_item.get("uid")
+    if not json_equal(old_uid, new_uid):
+        yield Change(
+            "breaking",
+            item_kind,
+            name,
+            None,
+            f"uid changed from {_value_string(old_uid)} to {_value_string(new_uid)}",
+        )
+
+    old_attributes = old_item.get("attributes")
+    new_attributes = new_item.get("attributes")
+    if not isinstance(old_attributes, dict) or not isinstance(new_attributes, dict):
+        return
+    for attribute_name in sorted(old_attributes.keys() | new_attributes.keys()):
+        old_attribute = old_attributes.get(attribute_name)
+        new_attribute = new_attributes.get(attribute_name)
+        if json_equal(old_attribute, new_attribute):
+            continue
+        if not isinstance(new_attribute, dict):
+            yield Change("breaking", item_kind, name, attribute_name, "removed")
+        elif not isinstance(old_attribute, dict):
+            if new_attribute.get("requirement") == "required":
+                yield Change(
+                    "breaking", item_kind, name, attribute_name, "added as required"
+                )
+            else:
+                yield Change("additive", item_kind, name, attribute_name, "added")
+        else:
+            yield from _attribute_changes(
+                item_kind, name, attribute_name, old_attribute, new_attribute
+            )
+
+
+def _attribute_changes(
+    item_kind: str,
+    name: str,
+    attribute_name: str | None,
+    old_attribute: JObject,
+    new_attribute: JObject,
+) -> Iterator[Change]:
+    if attribute_name is not None:
+        old_requirement = old_attribute.get("requirement")
+        new_requirement = new_attribute.get("requirement")
+        if not json_equal(old_requirement, new_requirement):
+            yield Change(
+                "breaking" if new_requirement == "required" else "additive",
+                item_kind,
+                name,
+                attribute_name,
+                f"requirement changed from {_value_string(old_requirement)} to"
+                f" {_value_string(new_requirement)}",
+            )
+
+    for key in _TYPE_KEYS:
+        old_value = old_attribute.get(key)
+        new_value = new_attribute.get(key)
+        if not json_equal(old_value, new_value):
+            yield Change(
+                "breaking",
+                item_kind,
+                name,
+                attribute_name,
+                f"{key} changed from {_value_string(old_value)} to"
+                f" {_value_string(new_value)}",
+            )
+
+    old_enum = old_attribute.get("enum")
+    new_enum = new_attribute.get("enum")
+    if json_equal(old_enum, new_enum):
+        return
+    if not isinstance(new_enum, dict):
+        yield Change("additive", item_kind, name, attribute_name, "enum removed")
+    elif not isinstance(old_enum, dict):
+        yield Change("breaking", item_kind, name, attribute_name, "enum added")
+    else:
+        removed = [v for v in old_enum if v not in new_enum]
+        added = [v for v in new_enum if v not in old_enum]
+        if removed:
+            yield Change(
+                "breaking",
+                item_kind,
+                name,
+                attribute_name,
+                f"enum values removed: {', '.join(removed)}",
+            )
+        if added:
+            yield Change(
+                "additive",
+                item_kind,
+                name,
+                attribute_name,
+                f"enum values added: {', '.join(added)}",
+            )
+
+
+def _value_string(value: JValue) -> str:
+    # Missing and null values are both unset
+    if value is None:
+        return "unset"
+    return json.dumps(value)
@@ -0,0 +1,162 @@
+"""
+Structural comparison of compiled schemas (or any JSON objects).
+
+Differences are yielded as they are found, in sorted key order. Values are compared as
+JSON, so booleans, integers, and floats are never equal to each other (unlike in
+Python, where True == 1 == 1.0). Values that are the same object are skipped without
+being walked. Subtrees that differ are found with Python's built-in equality (which
+runs in C) and descended into; subtrees that compare equal are only walked to check
+the types of their scalars. Paths are tuples sharing their prefixes, so no path
+copying is done for values that are equal.
+
+When the content hash manifests of both schemas are given (see the manifest module),
+items with the same hash are skipped without comparing them at all. Manifests are
+checked against their schemas, except for the hashes of items, which are trusted:
+passing a manifest that is stale for some item can hide differences in that item.
+"""
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.jsonish import JObject, JValue, json_equal
+from ocsf_schema_compiler.manifest import item_table_hashes, manifest_matches
+from ocsf_schema_compiler.normalized import is_normalized, rehydrate
+from ocsf_schema_compiler.structured_read import (
+    read_json_object_file,
+    read_json_object_zstandard_file,
+)
+
+
+class Missing:
+    """Type of MISSING, the value of a key missing from one side of a difference."""
+
+
+MISSING = Missing()
+
+type DiffValue = Missing | JValue
+
+# Item hashes of the left and right manifests, keyed by item table path
+type Skips = dict[tuple[str, ...], tuple[JObject, JObject]]
+
+
+@dataclass(slots=True, frozen=True)
+class Difference:
+    # Keys (and array indexes, as strings) from the root to the differing values
+    path: tuple[str, ...]
+    left: DiffValue
+    right: DiffValue
+
+    def path_string(self) -> str:
+        return ".".join(self.path)
+
+    def formatted_string(self) -> str:
+        return (
+            f'Diff at "{self.path_string()}":'
+            f"\n    left  : {_diff_value_to_string(self.left)}"
+            f"\n    right : {_diff_value_to_string(self.right)}"
+        )
+
+
+def iter_differences(
+    left: JObject,
+    right: JObject,
+    left_manifest: JObject | None = None,
+    right_manifest: JObject | None = None,
+) -> Iterator[Difference]:
+    """
+    Yields the differences between left and right. Objects are compared key by key,
+    with keys in only one object reported with MISSING on the other side. Arrays of
+    the same length are compared element by element; otherwise, the whole arrays are
+    reported.
+
+    If the manifests of both left and right are given, they are used to skip items
+    with the same content hash. Raises SchemaException if a manifest does not match its
+    schema (see manifest_matches in the manifest module).
+    """
+    skips: Skips = {}
+    if left_manifest is not None and right_manifest is not None:
+        if not manifest_matches(left, left_manifest):
+            raise SchemaException("Left manifest does not match the left schema")
+        if not manifest_matches(right, right_manifest):
+            raise SchemaException("Right manifest does not match the right schema")
+        # Both manifests use the same algorithm, since they matched
+        if left_manifest.get("hash") == right_manifest.get("hash"):
+            return
+        left_tables = item_table_hashes(left_manifest)
+        right_tables = item_table_hashes(right_manifest)
+        for path, left_hashes in left_tables.items():
+            if path in right_tables:
+                skips[path] = left_hashes, right_tables[path]
+    if not _equal(left, right):
+        yield from _diff_objects(left, right, (), skips)
+
+
+def diff_schemas(
+    left: JObject,
+    right: JObject,
+    left_manifest: JObject | None = None,
+    right_manifest: JObject | None = None,
+) -> list[Difference]:
+    """Returns the differences between left and right. See iter_differences."""
+    return list(iter_differences(left, right, left_manifest, right_manifest))
+
+
+def read_compiled_schema(path: Path) -> JObject:
+    """
+    Read a compiled schema written as JSON, or compressed with Zstandard if path has
+    the ".zst" suffix. Schemas in the normalized layout are rehydrated.
+    """
+    if path.suffix == ".zst":
+        schema = read_json_object_zstandard_file(path)
+    else:
+        schema = read_json_object_file(path)
+    if is_normalized(schema):
+        return rehydrate(schema)
+    return schema
+
+
+def _diff_objects(
+    left: JObject, right: JObject, base_path: tuple[str, ...], skips: Skips
+) -> Iterator[Difference]:
+    hashes = skips.get(base_path)
+    for key in sorted(left.keys() | right.keys()):
+        if hashes is not None:
+            left_hash = hashes[0].get(key)
+            if left_hash is not None and left_hash == hashes[1].get(key):
+                continue
+        left_value = left.get(key, MISSING)
+        right_value = right.get(key, MISSING)
+        if _equal(left_value, right_value):
+            continue
+        yield from _diff_values(left_value, right_value, (*base_path, key), skips)
+
+
+def _diff_values(
+    left: DiffValue, right: DiffValue, path: tuple[str, ...], skips: Skips
+) -> Iterator[Difference]:
+    # Only called with values that are not equal
+    if isinstance(left, dict) and isinstance(right, dict):
+        yield from _diff_objects(left, right, path, skips)
+    elif isinstance(left, list) and isinstance(right, list) and len(left) == len(right):
+        for i, (left_element, right_element) in enumerate(zip(left, right)):
+            if not _equal(left_element, right_element):
+                yield from _diff_values(
+                    left_element, right_element, (*path, str(i)), skips
+                )
+    else:
+        yield Difference(path, left, right)
+
+
+def _equal(left: DiffValue, right: DiffValue) -> bool:
+    if isinstance(left, Missing) or isinstance(right, Missing):
+        return left is right
+    return json_equal(left, right)
+
+
+def _diff_value_to_string(value: DiffValue) -> str:
+    if isinstance(value, Missing):
+        return "missing"
+    return json.dumps(value, sort_keys=True)
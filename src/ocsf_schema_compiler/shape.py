@@ -0,0 +1,200 @@
+"""
+Validation of the shape of schema files: that the values the compiler relies on have
+the expected JSON types. Each file is validated once, when it is read, so problems are
+reported as a SchemaException naming the file rather than as an assertion failure deep
+in the compile.
+
+The compiler's other type checks are the assertions in the jsonish j_* functions. With
+file shapes validated up front, these only catch compiler bugs, so they can be skipped
+by running Python with the -O option.
+"""
+
+from pathlib import Path
+
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.jsonish import JObject, JValue, json_type_from_value
+
+# Expected types of values in class, object, and profile files, keyed by item key.
+# Keys not listed here are not checked.
+_ITEM_TYPES: dict[str, type] = {
+    "name": str,
+    "caption": str,
+    "description": str,
+    "extends": str,
+    "category": str,
+    "uid": int,
+    "attributes": dict,
+    "profiles": list,
+    "observable": int,
+    "observables": dict,
+    "constraints": dict,
+    "associations": dict,
+    "annotations": dict,
+    "@deprecated": dict,
+    "references": list,
+}
+
+# Expected types of values in attribute details of items and the dictionary, keyed by
+# attribute detail key. Keys not listed here are not checked.
+_ATTRIBUTE_TYPES: dict[str, type] = {
+    "caption": str,
+    "description": str,
+    "requirement": str,
+    "type": str,
+    "group": str,
+    "sibling": str,
+    "enum": dict,
+    "observable": int,
+    "profiles": list,
+    "$include": str,
+    "@deprecated": dict,
+    "is_array": bool,
+    "references": list,
+}
+
+_TYPE_NAMES: dict[type, str] = {
+    str: "a string",
+    int: "an integer",
+    bool: "a boolean",
+    dict: "an object",
+    list: "an array",
+}
+
+
+def validate_item_shape(path: Path, kind: str, item: JObject) -> None:
+    """
+    Validate the shape of a class, object, or profile read from path. The kind is the
+    item directory name: "events", "objects", or "profiles".
+    """
+    where = f"{kind} file"
+    _validate_keys(path, where, item, _ITEM_TYPES)
+    _validate_strings(path, where, "profiles", item.get("profiles"))
+    _validate_values(path, where, "observables", item.get("observables"), int)
+
+    attributes = item.get("attributes")
+    if isinstance(attributes, dict):
+        for attribute_name, attribute in attributes.items():
+            if attribute_name == "$include":
+                # Attributes level include of a file or list of files
+                if isinstance(attribute, list):
+                    _validate_strings(path, where, "attributes.$include", attribute)
+                else:
+                    _validate_type(path, where, "attributes.$include", attribute, str)
+            else:
+                _validate_attribute(path, where, attribute_name, attribute)
+
+
+def validate_dictionary_shape(path: Path, dictionary: JObject) -> None:
+    """Validate the shape of a dictionary read from path."""
+    where = "dictionary file"
+    for key, value in dictionary.items():
+        if key == "attributes":
+            _validate_attributes(path, where, value)
+        elif key == "types":
+            _validate_type(path, where, "types", value, dict)
+            if isinstance(value, dict):
+                _validate_attributes(path, f"{where} types", value.get("attributes"))
+
+
+def validate_categories_shape(path: Path, categories: JObject) -> None:
+    """Validate the shape of categories read from path."""
+    where = "categories file"
+    attributes = categories.get("attributes")
+    _validate_type(path, where, "attributes", attributes, dict)
+    if isinstance(attributes, dict):
+        for category_name, category in attributes.items():
+            key = f"attributes.{category_name}"
+            _validate_type(path, where, key, category, dict, nullable=False)
+            if isinstance(category, dict):
+                uid = category.get("uid")
+                _validate_type(path, where, f"{key}.uid", uid, int, nullable=False)
+
+
+def validate_include_shape(path: Path, include: JObject) -> None:
+    """
+    Validate the shape of an included file read from path. Files with "attributes" are
+    included at the item attributes level, and others into attribute details.
+    """
+    if "attributes" in include:
+        validate_item_shape(path, "include", include)
+    else:
+        _validate_keys(path, "include file", include, _ATTRIBUTE_TYPES)
+        _validate_values(path, "include file", "enum", include.get("enum"), dict)
+
+
+def _validate_attributes(path: Path, where: str, attributes: JValue) -> None:
+    _validate_type(path, where, "attributes", attributes, dict)
+    if isinstance(attributes, dict):
+        for attribute_name, attribute in attributes.items():
+            _validate_attribute(path, where, attribute_name, attribute)
+
+
+def _validate_attribute(
+    path: Path, where: str, attribute_name: str, attribute: JValue
+) -> None:
+    key = f"attributes.{attribute_name}"
+    _validate_type(path, where, key, attribute, dict, nullable=False)
+    if not isinstance(attribute, dict):
+        return
+    for detail_key, value in attribute.items():
+        expected = _ATTRIBUTE_TYPES.get(detail_key)
+        if expected is not None:
+            _validate_type(path, where, f"{key}.{detail_key}", value, expected)
+    # Attribute "profile" and "profiles" can be null, which clears inherited profiles
+    profile = attribute.get("profile")
+    if profile is not None:
+        _validate_type(path, where, f"{key}.profile", profile, str)
+    _validate_strings(path, where, f"{key}.profiles", attribute.get("profiles"))
+    _validate_values(path, where, f"{key}.enum", attribute.get("enum"), dict)
+
+
+def _validate_keys(
+    path: Path, where: str, obj: JObject, types: dict[str, type]
+) -> None:
+    for key, value in obj.items():
+        expected = types.get(key)
+        if expected is not None:
+            _validate_type(path, where, key, value, expected)
+
+
+def _validate_strings(path: Path, where: str, key: str, value: JValue) -> None:
+    """Validate that value, if not null, is an array of strings."""
+    if isinstance(value, list):
+        for i, element in enumerate(value):
+            _validate_type(path, where, f"{key}[{i}]", element, str, nullable=False)
+
+
+def _validate_values(
+    path: Path, where: str, key: str, value: JValue, expected: type
+) -> None:
+    """Validate that the values of value, if it is an object, have expected type."""
+    if isinstance(value, dict):
+        for name, element in value.items():
+            _validate_type(
+                path, where, f"{key}.{name}", element, expected, nullable=False
+            )
+
+
+def _validate_type(
+    path: Path,
+    where: str,
+    key: str,
+    value: JValue,
+    expected: type,
+    nullable: bool = True,
+) -> None:
+    """
+    Validate that value has the expected type. By default, JSON null (or a missing
+    value) is also accepted; required values are checked where they are used.
+    """
+    if value is None and nullable:
+        return
+    # bool is a subclass of int in Python, though not in JSON
+    if isinstance(value, expected) and not (
+        expected is int and isinstance(value, bool)
+    ):
+        return
+    raise SchemaException(
+        f'The "{key}" value in {where} must be {_TYPE_NAMES[expected]}, but got'
+        f" {json_type_from_value(value)}: {path}"
+    )
@@ -0,0 +1,226 @@
+import os
+import tarfile
+import zipfile
+from collections.abc import Hashable, Iterator, Mapping
+from compression import zstd
+from pathlib import Path
+from typing import override
+
+from ocsf_schema_compiler.jsonish import JObject
+from ocsf_schema_compiler.structured_read import (
+    SchemaSource,
+    read_json_object_bytes,
+    read_json_object_file,
+)
+from ocsf_schema_compiler.utils import deep_copy_j_object
+
+# Type alias for the contents of a file held in memory: the JSON text, or the already
+# parsed JSON object.
+type MemberData = bytes | str | JObject
+
+# File name suffixes of tar archives, with any compression supported by tarfile.
+# Zstandard compressed tar archives are handled here using compression.zstd.
+_TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".tar.zst", ".tzst")
+_ZSTD_TAR_SUFFIXES = (".tar.zst", ".tzst")
+
+
+def open_source(path: Path) -> SchemaSource:
+    """
+    Return the schema source for path. A path to a zip or tar archive file gives a
+    source reading the archive's JSON files into memory, and any other path gives a
+    source for a directory in the file system.
+    """
+    name = path.name.lower()
+    if name.endswith(".zip") and path.is_file():
+        return ZipArchiveSource(path)
+    if name.endswith(_TAR_SUFFIXES) and path.is_file():
+        return TarArchiveSource(path)
+    return DirectorySource(path)
+
+
+class DirectorySource(SchemaSource):
+    """Source of schema files in a file system directory."""
+
+    @override
+    def is_file(self, path: Path) -> bool:
+        return path.is_file()
+
+    @override
+    def is_dir(self, path: Path) -> bool:
+        return path.is_dir()
+
+    @override
+    def walk(self, path: Path) -> Iterator[tuple[Path, list[str]]]:
+        for dir_path, _dir_names, file_names in os.walk(path, topdown=False):
+            yield Path(dir_path), file_names
+
+    @override
+    def read_json_object(self, path: Path) -> JObject:
+        return read_json_object_file(path)
+
+    @override
+    def cache_key(self, path: Path) -> Hashable | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return path.resolve(), stat.st_mtime_ns, stat.st_size
+
+
+class _MemberSource(SchemaSource):
+    """
+    Base class of sources holding files in memory, keyed by their POSIX-style path
+    relative to the source root (for example, "events/base_event.json").
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        members: Mapping[str, MemberData],
+        archive_key: Hashable | None = None,
+    ) -> None:
+        super().__init__(root)
+        self._members: Mapping[str, MemberData] = members
+        # Key identifying the archive's contents, or None if files should not be cached
+        self._archive_key: Hashable | None = archive_key
+        # Mapping of directory relative path to the names of files in that directory.
+        # The root directory's relative path is "".
+        self._dirs: dict[str, list[str]] = {"": []} if members else {}
+        for member_name in sorted(members):
+            dir_name, _, file_name = member_name.rpartition("/")
+            self._dirs.setdefault(dir_name, []).append(file_name)
+            while dir_name:
+                dir_name = dir_name.rpartition("/")[0]
+                _ = self._dirs.setdefault(dir_name, [])
+
+    def _relative_name(self, path: Path) -> str | None:
+        if not path.is_relative_to(self.root):
+            return None
+        name = path.relative_to(self.root).as_posix()
+        if name == ".":
+            return ""
+        return name
+
+    @override
+    def is_file(self, path: Path) -> bool:
+        return self._relative_name(path) in self._members
+
+    @override
+    def is_dir(self, path: Path) -> bool:
+        return self._relative_name(path) in self._dirs
+
+    @override
+    def walk(self, path: Path) -> Iterator[tuple[Path, list[str]]]:
+        base_name = self._relative_name(path)
+        if base_name is None or base_name not in self._dirs:
+            return
+        if base_name:
+            prefix = f"{base_name}/"
+            dir_names = [
+                d for d in self._dirs if d == base_name or d.startswith(prefix)
+            ]
+        else:
+            dir_names = list(self._dirs)
+        # Bottom-up: deepest directories first, like os.walk with topdown=False
+        dir_names.sort(key=lambda d: (-(d.count("/") + 1 if d else 0), d))
+        for dir_name in dir_names:
+            yield self.root / dir_name, self._dirs[dir_name]
+
+    @override
+    def read_json_object(self, path: Path) -> JObject:
+        name = self._relative_name(path)
+        if name is None or name not in self._members:
+            raise FileNotFoundError(f"No such file in {self.root}: {path}")
+        data = self._members[name]
+        if isinstance(data, dict):
+            # Compilation modifies what it reads, so never hand out the original
+            return deep_copy_j_object(data)
+        return read_json_object_bytes(path, data)
+
+    @override
+    def cache_key(self, path: Path) -> Hashable | None:
+        name = self._relative_name(path)
+        if self._archive_key is None or name not in self._members:
+            return None
+        return self._archive_key, name
+
+
+class MemorySource(_MemberSource):
+    """
+    Source of schema files held in memory, allowing schemas and extensions to be
+    compiled without any file system access. The files mapping is keyed by each file's
+    POSIX-style path relative to the base of the schema or extensions directory, for
+    example "extension.json" or "events/my_class.json". The values can be the file's
+    JSON text or its already parsed JSON object; the latter are copied when read, so
+    the same source can be compiled any number of times.
+
+    The root path is only used to identify files in log and error messages.
+    """
+
+    def __init__(
+        self, files: Mapping[str, MemberData], root: Path | None = None
+    ) -> None:
+        super().__init__(
+            root or Path("memory"),
+            {name.removeprefix("./"): data for name, data in files.items()},
+        )
+
+
+class ZipArchiveSource(_MemberSource):
+    """
+    Source of schema files in a zip archive. The JSON files in the archive are read
+    into memory once, when the source is created.
+    """
+
+    def __init__(self, path: Path) -> None:
+        members: dict[str, bytes] = {}
+        with zipfile.ZipFile(path) as zip_file:
+            for info in zip_file.infolist():
+                if not info.is_dir() and info.filename.endswith(".json"):
+                    members[info.filename] = zip_file.read(info)
+        super().__init__(path, _strip_common_directory(members), _archive_key(path))
+
+
+class TarArchiveSource(_MemberSource):
+    """
+    Source of schema files in a tar archive, optionally compressed (including with
+    Zstandard). The JSON files in the archive are read into memory once, when the
+    source is created, in a single sequential pass over the archive.
+    """
+
+    def __init__(self, path: Path) -> None:
+        if path.name.lower().endswith(_ZSTD_TAR_SUFFIXES):
+            with zstd.open(path) as f, tarfile.open(fileobj=f, mode="r|") as tar_file:
+                members = _read_tar_members(tar_file)
+        else:
+            with tarfile.open(path, mode="r|*") as tar_file:
+                members = _read_tar_members(tar_file)
+        super().__init__(path, _strip_common_directory(members), _archive_key(path))
+
+
+def _archive_key(path: Path) -> Hashable:
+    stat = path.stat()
+    return path.resolve(), stat.st_mtime_ns, stat.st_size
+
+
+def _read_tar_members(tar_file: tarfile.TarFile) -> dict[str, bytes]:
+    members: dict[str, bytes] = {}
+    for info in tar_file:
+        if info.isfile() and info.name.endswith(".json"):
+            f = tar_file.extractfile(info)
+            if f:
+                members[info.name.removeprefix("./")] = f.read()
+    return members
+
+
+def _strip_common_directory(members: dict[str, bytes]) -> dict[str, bytes]:
+    """
+    Archives of a schema or extension commonly hold everything in one top-level
+    directory, as with GitHub source archives. In that case, strip that directory so
+    the archive root is the schema or extension directory.
+    """
+    top_names = {name.partition("/")[0] for name in members}
+    if len(top_names) == 1 and all("/" in name for name in members):
+        prefix = f"{top_names.pop()}/"
+        return {name.removeprefix(prefix): data for name, data in members.items()}
+    return members
@@ -1,5 +1,7 @@
 import json
-import os
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterator
 from compression import zstd
 from pathlib import Path
 from typing import Any, Callable
@@ -7,10 +9,41 @@ from typing import Any, Callable
 from ocsf_schema_compiler.exceptions import SchemaException
 from ocsf_schema_compiler.jsonish import (
     JObject,
+    JValue,
     json_type_from_value,
     j_object,
     j_string,
 )
+from ocsf_schema_compiler.shape import validate_item_shape
+
+
+# Maximum length of string values that are interned when parsing. Keys are always
+# interned. Short values (captions, type names, requirements, profile and object names)
+# repeat across files, while longer values are almost always unique descriptions.
+_MAX_INTERNED_VALUE_LENGTH = 64
+
+
+def _intern_object_pairs(pairs: list[tuple[str, JValue]]) -> JObject:
+    """
+    JSON object_pairs_hook interning keys and short string values, including strings
+    in arrays. The json module shares repeated keys within a document, but not across
+    documents, and a schema is many small documents. With interning, repeated strings
+    share one instance across all files (and across copies, which share strings).
+    """
+    obj: JObject = {}
+    for key, value in pairs:
+        if isinstance(value, str):
+            if len(value) <= _MAX_INTERNED_VALUE_LENGTH:
+                value = sys.intern(value)
+        elif isinstance(value, list):
+            value = [
+                sys.intern(v)
+                if isinstance(v, str) and len(v) <= _MAX_INTERNED_VALUE_LENGTH
+                else v
+                for v in value
+            ]
+        obj[sys.intern(key)] = value
+    return obj
 
 
 # _load_json_object_file loads a JSON file an ensure the result is a JSON object.
@@ -20,7 +53,16 @@ def _load_json_object_file(
     path: Path,
     f: Any,  # pyright: ignore[reportAny, reportExplicitAny]
 ) -> JObject:
-    v: Any = json.load(f)  # pyright: ignore[reportAny, reportExplicitAny]
+    return _ensure_json_object(
+        path,
+        json.load(f, object_pairs_hook=_intern_object_pairs),  # pyright: ignore[reportAny]
+    )
+
+
+def _ensure_json_object(
+    path: Path,
+    v: Any,  # pyright: ignore[reportAny, reportExplicitAny]
+) -> JObject:
     if not isinstance(v, dict):
         t = json_type_from_value(v)  # pyright: ignore[reportAny]
         raise TypeError(
@@ -40,25 +82,84 @@ def read_json_object_zstandard_file(path: Path) -> JObject:
         return _load_json_object_file(path, f)
 
 
+def read_json_object_bytes(path: Path, data: bytes | str) -> JObject:
+    """
+    Parse a JSON object from the contents of a file. The path is only used for error
+    messages.
+    """
+    return _ensure_json_object(
+        path, json.loads(data, object_pairs_hook=_intern_object_pairs)
+    )
+
+
+class SchemaSource(ABC):
+    """
+    A source of schema files, such as a schema or extensions directory, an archive of
+    one, or files held in memory. Implement this interface to compile schemas and
+    extensions from other places, and pass an instance to SchemaCompiler in place of a
+    schema or extensions path.
+
+    Files are identified by paths under the source's root path, whether or not they
+    are in the file system. For example, a file in an archive is identified by a path
+    like `path/to/schema.zip/events/base_event.json`. These paths are used in log and
+    error messages, and as include cache keys.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root: Path = root
+
+    @abstractmethod
+    def is_file(self, path: Path) -> bool:
+        """Returns True if path is a file in this source."""
+
+    @abstractmethod
+    def is_dir(self, path: Path) -> bool:
+        """Returns True if path is a directory in this source."""
+
+    @abstractmethod
+    def walk(self, path: Path) -> Iterator[tuple[Path, list[str]]]:
+        """
+        Walk the directory tree at path bottom-up, like os.walk with topdown=False,
+        yielding tuples of a directory path and the names of the files in it. Nothing
+        is yielded if path is not a directory.
+        """
+
+    @abstractmethod
+    def read_json_object(self, path: Path) -> JObject:
+        """
+        Read a JSON file and ensure the result is a JSON object. Raises
+        FileNotFoundError if the file does not exist.
+        """
+
+    def cache_key(self, path: Path) -> Hashable | None:  # pyright: ignore[reportUnusedParameter]
+        """
+        Returns a key identifying the current contents of the file at path, used to
+        cache parsed files across compiles, or None if the file should not be cached.
+        The default is None.
+        """
+        return None
+
+
 def read_structured_items(
+    source: SchemaSource,
     base_path: Path,
     kind: str,
     item_callback_fn: Callable[[Path, JObject], None] | None = None,
 ) -> JObject:
     """
-    Read schema structured items found in `kind` directory under `base_path`,
-    recursively, and returns dict with unprocessed items, each keyed by their name
-    attribute.
+    Read schema structured items found in `kind` directory under `base_path` of
+    `source`, recursively, and returns dict with unprocessed items, each keyed by their
+    name attribute.
     """
     # event classes can be organized in subdirectories, so we must walk to find all the
     # event class JSON files
     item_path = base_path / kind
     items: JObject = {}
-    for dir_path, _dir_names, file_names in os.walk(item_path, topdown=False):
+    for dir_path, file_names in source.walk(item_path):
         for file_name in file_names:
             if file_name.endswith(".json"):
-                file_path = Path(dir_path, file_name)
-                obj = read_json_object_file(file_path)
+                file_path = dir_path / file_name
+                obj = source.read_json_object(file_path)
                 name = obj.get("name")
 
                 # The way this is tested, "no value" happens when attribute is missing,
@@ -77,6 +178,8 @@ def read_structured_items(
                         f" but got {json_type_from_value(name)}: {file_path}"
                     )
 
+                validate_item_shape(file_path, kind, obj)
+
                 if name in items:
                     existing = j_object(items[name])
                     raise SchemaException(
@@ -93,13 +196,15 @@ def read_structured_items(
 
 
 def read_patchable_structured_items(
+    source: SchemaSource,
     base_path: Path,
     kind: str,
     item_callback_fn: Callable[[Path, JObject], None] | None = None,
 ) -> tuple[JObject, JObject]:
     """
     Read schema "patchable" structured items found in `kind` directory under
-    `base_path`, recursively, and returns dataclass with unprocessed items and patches.
+    `base_path` of `source`, recursively, and returns dataclass with unprocessed items
+    and patches.
     Extension classes and objects are patchable structured items. Items are each keyed
     by their name attribute and patches are keyed by the name of the item to patch.
 
@@ -110,11 +215,11 @@ def read_patchable_structured_items(
     item_path = base_path / kind
     items: JObject = {}
     patches: JObject = {}
-    for dir_path, _dir_names, file_names in os.walk(item_path, topdown=False):
+    for dir_path, file_names in source.walk(item_path):
         for file_name in file_names:
             if file_name.endswith(".json"):
-                file_path = Path(dir_path, file_name)
-                obj = read_json_object_file(file_path)
+                file_path = dir_path / file_name
+                obj = source.read_json_object(file_path)
                 # An extension "patch" occurs in two cases:
                 #   1. The item has an "extends" key but no "name" key. This is the
                 #      common case in practice.
@@ -144,6 +249,7 @@ def read_patchable_structured_items(
                         f'The "extends" value in extension {kind} file must be a'
                         f" string, but got {json_type_from_value(extends)}: {file_path}"
                     )
+                validate_item_shape(file_path, kind, obj)
 
                 if not name or name == extends:
                     # This is a patch definition.
@@ -1,18 +1,29 @@
 import json
-from copy import deepcopy
 
 from ocsf_schema_compiler.exceptions import SchemaException
 from ocsf_schema_compiler.jsonish import JValue, JObject, JArray
 
+# The deep copy functions only handle JSON-compatible values, which makes them several
+# times faster than copy.deepcopy. Strings and other scalars are immutable, so they are
+# shared rather than copied, the same as with copy.deepcopy.
+
 
 def deep_copy_j_object(obj: JObject) -> JObject:
-    """JObject typed flavor of copy.deepcopy. Returns deep copy of obj."""
-    return deepcopy(obj)
+    """JObject typed deep copy. Returns deep copy of obj."""
+    return {key: _deep_copy_j_value(value) for key, value in obj.items()}
 
 
 def deep_copy_j_array(array: JArray) -> JArray:
-    """JArray typed flavor of copy.deepcopy. Returns deep copy of array."""
-    return deepcopy(array)
+    """JArray typed deep copy. Returns deep copy of array."""
+    return [_deep_copy_j_value(value) for value in array]
+
+
+def _deep_copy_j_value(value: JValue) -> JValue:
+    if isinstance(value, dict):
+        return deep_copy_j_object(value)
+    if isinstance(value, list):
+        return deep_copy_j_array(value)
+    return value
 
 
 def deep_merge(dest: JObject, source: JObject) -> None:
@@ -36,6 +47,25 @@ def deep_merge(dest: JObject, source: JObject) -> None:
             dest[source_key] = source_value
 
 
+def copy_merge(dest: JObject, source: JObject) -> JObject:
+    """
+    Merge a source dictionary on top of a destination dictionary, returning the result
+    as a new dictionary. Neither dictionary is modified. The result is the same as
+    deep_merge into a deep copy of dest, except that values the merge does not change
+    are shared with dest and source rather than copied.
+
+    Like deep_merge, this does not merge lists or dictionaries inside lists.
+    """
+    merged = dict(dest)
+    for source_key, source_value in source.items():
+        dest_value = merged.get(source_key)
+        if isinstance(dest_value, dict) and isinstance(source_value, dict):
+            merged[source_key] = copy_merge(dest_value, source_value)
+        else:
+            merged[source_key] = source_value
+    return merged
+
+
 def put_non_none(d: JObject, k: str, v: JValue) -> None:
     if v is not None:
         d[k] = v
@@ -1,5 +1,4 @@
 import json
-from copy import deepcopy
 from dataclasses import dataclass
 from typing import Callable
 
@@ -25,7 +24,7 @@ type DiffValue = Missing | DiffDictKeys | JValue
 @dataclass
 class Difference:
     is_expected: bool
-    path: list[str]
+    path: tuple[str, ...]
     left: DiffValue
     right: DiffValue
 
@@ -54,7 +53,7 @@ def formatted_diffs(diffs: list[Difference]) -> str:
 
 
 type DiffCallback = Callable[
-    [str, list[str], JObject, JObject, DiffValue, DiffValue], bool
+    [str, tuple[str, ...], JObject, JObject, DiffValue, DiffValue], bool
 ]
 
 
@@ -62,7 +61,7 @@ def diff_objects(
     left: JObject, right: JObject, diff_callback: DiffCallback | None = None
 ) -> tuple[bool, list[Difference]]:
     diffs: list[Difference] = []
-    _diff_objects(left, right, diff_callback, [], diffs)
+    _diff_objects(left, right, diff_callback, (), diffs)
     ok = True
     for diff in diffs:
         if not diff.is_expected:
@@ -75,14 +74,16 @@ def _diff_objects(
     left_obj: JObject,
     right_obj: JObject,
     diff_callback: DiffCallback | None,
-    base_path: list[str],
+    base_path: tuple[str, ...],
     diffs: list[Difference],
 ) -> None:
-    for key in sorted(set(left_obj.keys()) | set(right_obj.keys())):
-        path = deepcopy(base_path)
-        path.append(key)
+    for key in sorted(left_obj.keys() | right_obj.keys()):
         left_dv = _diff_get(left_obj, key)
         right_dv = _diff_get(right_obj, key)
+        # Equal values, including whole equal subtrees, are skipped without walking them
+        if left_dv is right_dv or left_dv == right_dv:
+            continue
+        path = (*base_path, key)
         if isinstance(left_dv, dict) and isinstance(right_dv, dict):
             has_equal_key, left_key_dv, right_key_dv = _is_equal_keys(left_dv, right_dv)
             if has_equal_key:
@@ -98,7 +99,7 @@ def _diff_objects(
                     diff_callback,
                     diffs,
                 )
-        elif left_dv != right_dv:
+        else:
             _callback_append(
                 key,
                 path,
@@ -113,7 +114,7 @@ def _diff_objects(
 
 def _callback_append(
     key: str,
-    path: list[str],
+    path: tuple[str, ...],
     left_obj: JObject,
     right_obj: JObject,
     left_dv: DiffValue,
@@ -149,7 +150,7 @@ def _diff_get(o: JObject, k: str) -> DiffValue:
     return MISSING
 
 
-def _path_to_string(path: list[str]) -> str:
+def _path_to_string(path: tuple[str, ...]) -> str:
     return ".".join(path)
 
 
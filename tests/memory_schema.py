@@ -0,0 +1,41 @@
+import json
+from pathlib import Path
+
+from ocsf_schema_compiler.jsonish import JObject, j_object
+from ocsf_schema_compiler.sources import MemberData, MemorySource
+
+SCHEMA_DIR = Path(Path(__file__).parent, "uncompiled-schemas/ocsf-schema-v1.6.0")
+
+
+def schema_with_files(extra_files: dict[str, JObject]) -> MemorySource:
+    """
+    Returns the 1.6.0 schema as a memory source, with extra_files (keyed by path
+    relative to the schema directory) added or replacing schema files.
+    """
+    files = _schema_files()
+    files.update(extra_files)
+    return MemorySource(files)
+
+
+def schema_with_objects(
+    objects: list[JObject], dictionary_attributes: JObject | None = None
+) -> MemorySource:
+    """
+    Returns the 1.6.0 schema as a memory source, with objects added and
+    dictionary_attributes added to the dictionary.
+    """
+    files = _schema_files()
+    if dictionary_attributes:
+        dictionary = j_object(json.loads(files["dictionary.json"]))  # pyright: ignore[reportAny, reportArgumentType]
+        j_object(dictionary["attributes"]).update(dictionary_attributes)
+        files["dictionary.json"] = dictionary
+    for obj in objects:
+        files[f"objects/{obj['name']}.json"] = obj
+    return MemorySource(files)
+
+
+def _schema_files() -> dict[str, MemberData]:
+    files: dict[str, MemberData] = {}
+    for path in SCHEMA_DIR.rglob("*.json"):
+        files[path.relative_to(SCHEMA_DIR).as_posix()] = path.read_bytes()
+    return files
@@ -0,0 +1,26 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import ocsf_schema_compiler
+
+SRC_DIR = Path(ocsf_schema_compiler.__file__).parent.parent
+
+
+def run_python(*args: str, check: bool = True) -> subprocess.CompletedProcess[str]:
+    """
+    Run Python with args in a new process, with the compiler's source directory on the
+    path, returning the completed process. Raises CalledProcessError if it fails, unless
+    check is false.
+    """
+    python_path = os.pathsep.join(
+        [str(SRC_DIR), *filter(None, [os.environ.get("PYTHONPATH")])]
+    )
+    return subprocess.run(
+        [sys.executable, *args],
+        check=check,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": python_path},
+    )
@@ -0,0 +1,76 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import ClassVar, override
+
+from ocsf_schema_compiler.compiler import (
+    COMPILE_PHASES,
+    CompileProgress,
+    SchemaCompiler,
+)
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.jsonish import JObject
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+AWS_EXTENSION_DIR = Path(BASE_DIR, "uncompiled-schemas/aws-v1.0.0")
+
+
+class TestAsyncCompile(unittest.IsolatedAsyncioTestCase):
+    full: ClassVar[JObject]
+
+    @classmethod
+    @override
+    def setUpClass(cls):
+        cls.full = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_EXTENSION_DIR]
+        ).compile()
+
+    async def test_same_as_compile(self):
+        events: list[CompileProgress] = []
+        compiler = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_EXTENSION_DIR], progress=events.append
+        )
+        output = await compiler.compile_async()
+        self.assertEqual(output, self.full)
+        self.assertEqual([e.phase for e in events], list(COMPILE_PHASES))
+        self.assertEqual([e.completed for e in events], list(range(1, 9)))
+        with self.assertRaisesRegex(SchemaException, "already compiled"):
+            _ = await compiler.compile_async()
+
+    async def test_concurrent(self):
+        with ThreadPoolExecutor(2) as executor:
+            outputs = await asyncio.gather(
+                *(
+                    SchemaCompiler(
+                        SCHEMA_DIR, extensions_paths=[AWS_EXTENSION_DIR], threads=2
+                    ).compile_async(executor=executor)
+                    for _ in range(3)
+                )
+            )
+        for output in outputs:
+            self.assertEqual(output, self.full)
+
+    async def test_cancel_between_phases(self):
+        phases: list[str] = []
+
+        def progress(event: CompileProgress) -> None:
+            phases.append(event.phase)
+            if event.phase == "classes":
+                _ = task.cancel()
+
+        compiler = SchemaCompiler(SCHEMA_DIR, progress=progress)
+        task = asyncio.create_task(compiler.compile_async())
+        with self.assertRaises(asyncio.CancelledError):
+            _ = await task
+        self.assertEqual(phases, ["read", "extensions", "classes"])
+
+    async def test_errors(self):
+        compiler = SchemaCompiler(Path(BASE_DIR, "no-such-schema"))
+        with self.assertRaises(FileNotFoundError):
+            _ = await compiler.compile_async()
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
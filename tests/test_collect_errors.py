@@ -0,0 +1,82 @@
+import logging
+import unittest
+from pathlib import Path
+from sys import stderr
+from typing import override
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.sources import MemorySource
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+
+BROKEN_EXTENSION = MemorySource(
+    {
+        "extension.json": {"uid": 999, "name": "broken", "version": "1.0.0"},
+        # Collides with base schema object
+        "objects/device.json": {
+            "name": "device",
+            "caption": "Device",
+            "description": "Device.",
+        },
+        # Patches an undefined object
+        "objects/missing.json": {"extends": "no_such_object"},
+        # Uses an undefined profile
+        "events/authentication.json": {
+            "extends": "authentication",
+            "profiles": ["no_such_profile"],
+        },
+        # Changes the type of a base schema attribute
+        "dictionary.json": {
+            "attributes": {
+                "name": {"caption": "Name", "description": "Name.", "type": "long_t"}
+            }
+        },
+    },
+    root=Path("broken"),
+)
+
+
+class TestCollectErrors(unittest.TestCase):
+    @classmethod
+    @override
+    def setUpClass(cls):
+        logging.basicConfig(
+            format="%(levelname)s: %(message)s", style="%", stream=stderr, level="INFO"
+        )
+
+    @override
+    def setUp(self):
+        print(file=stderr)  # so logs start on new line
+
+    def test_first_error_raised(self):
+        compiler = SchemaCompiler(SCHEMA_DIR, extensions_paths=[BROKEN_EXTENSION])
+        with self.assertRaisesRegex(
+            SchemaException, 'references profile "no_such_profile"'
+        ):
+            _ = compiler.compile()
+
+    def test_errors_collected(self):
+        compiler = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[BROKEN_EXTENSION], collect_errors=True
+        )
+        with self.assertRaises(SchemaException) as cm:
+            _ = compiler.compile()
+        message = str(cm.exception)
+        self.assertIn("Compile failed with 4 error(s)", message)
+        self.assertIn('references profile "no_such_profile"', message)
+        self.assertIn(
+            'Collision: extension "broken" object "device" collides with base schema'
+            " object",
+            message,
+        )
+        self.assertIn('"name" attempted to make unsafe type', message)
+        self.assertIn('attempted to patch undefined object "no_such_object"', message)
+        for line in message.splitlines()[1:]:
+            self.assertTrue(line.endswith(": broken"), line)
+        self.assertEqual(compiler.stats.error_count, 4)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,111 @@
+import logging
+import unittest
+from pathlib import Path
+from sys import stderr
+from typing import override
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.diagnostics import Diagnostic, filter_diagnostics
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.sources import MemorySource
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+
+
+def extension(files: dict[str, object]) -> MemorySource:
+    return MemorySource(
+        {
+            "extension.json": {"uid": 999, "name": "example", "version": "1.0.0"},
+            **files,  # pyright: ignore[reportArgumentType]
+        },
+        root=Path("example"),
+    )
+
+
+class TestDiagnostics(unittest.TestCase):
+    @classmethod
+    @override
+    def setUpClass(cls):
+        logging.basicConfig(
+            format="%(levelname)s: %(message)s", style="%", stream=stderr, level="INFO"
+        )
+
+    @override
+    def setUp(self):
+        print(file=stderr)  # so logs start on new line
+
+    def test_warnings(self):
+        compiler = SchemaCompiler(
+            SCHEMA_DIR,
+            extensions_paths=[
+                extension(
+                    {
+                        "objects/widget.json": {
+                            "name": "widget",
+                            "caption": "Widget",
+                            "description": "Widget.",
+                            "extends": "object",
+                            "attributes": {
+                                "name": {},
+                                "uid": {"requirement": "required"},
+                            },
+                        }
+                    }
+                )
+            ],
+        )
+        _ = compiler.compile()
+        diagnostics = filter_diagnostics(compiler.diagnostics, ["missing-requirement"])
+        self.assertEqual(
+            diagnostics,
+            [
+                Diagnostic(
+                    "warning",
+                    "missing-requirement",
+                    'object "widget" attribute "name" does not have a "requirement"'
+                    ' property; "optional" is used',
+                    "object",
+                    "widget",
+                    "name",
+                    Path("example"),
+                )
+            ],
+        )
+        self.assertEqual(
+            [d.code for d in compiler.diagnostics],
+            [
+                "placeholder-description",
+                "placeholder-description",
+                "missing-requirement",
+            ],
+        )
+        # Missing requirements are logged as one warning
+        self.assertEqual(compiler.stats.warning_count, 3)
+
+    def test_error(self):
+        compiler = SchemaCompiler(
+            SCHEMA_DIR,
+            extensions_paths=[
+                extension({"objects/missing.json": {"extends": "no_such_object"}})
+            ],
+        )
+        with self.assertRaises(SchemaException):
+            _ = compiler.compile()
+        [diagnostic] = compiler.diagnostics
+        self.assertEqual(
+            diagnostic.to_j_object(),
+            {
+                "severity": "error",
+                "code": "undefined-patch-target",
+                "message": 'extension "example" object patch "no_such_object"'
+                ' attempted to patch undefined object "no_such_object"',
+                "item_kind": "object",
+                "item_name": "no_such_object",
+                "path": "example",
+            },
+        )
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -56,7 +56,7 @@ class TestExpectedChanges(unittest.TestCase):
 
 def diff_callback(
     key: str,
-    path: list[str],
+    path: tuple[str, ...],
     left: JObject,
     right: JObject,
     left_diff: DiffValue,
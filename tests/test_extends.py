@@ -0,0 +1,76 @@
+import logging
+import unittest
+from sys import stderr
+from typing import override
+
+from memory_schema import schema_with_objects  # pyright: ignore[reportImplicitRelativeImport]
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.jsonish import j_object
+
+
+class TestExtends(unittest.TestCase):
+    @classmethod
+    @override
+    def setUpClass(cls):
+        logging.basicConfig(
+            format="%(levelname)s: %(message)s", style="%", stream=stderr, level="INFO"
+        )
+
+    @override
+    def setUp(self):
+        print(file=stderr)  # so logs start on new line
+
+    def test_circular_extends(self):
+        source = schema_with_objects(
+            [
+                {"name": "loop_a", "caption": "Loop A", "extends": "loop_b"},
+                {"name": "loop_b", "caption": "Loop B", "extends": "loop_c"},
+                {"name": "loop_c", "caption": "Loop C", "extends": "loop_a"},
+            ]
+        )
+        with self.assertRaisesRegex(SchemaException, 'circular "extends"'):
+            _ = SchemaCompiler(source).compile()
+
+    def test_circular_extends_without_captions(self):
+        # Items without a caption get one from their ancestors, which finds the cycle
+        # before extends is resolved
+        source = schema_with_objects(
+            [
+                {"name": "loop_a", "extends": "loop_b"},
+                {"name": "loop_b", "extends": "loop_a"},
+            ]
+        )
+        with self.assertRaisesRegex(SchemaException, 'circular "extends"'):
+            _ = SchemaCompiler(source).compile()
+
+    def test_undefined_parent(self):
+        source = schema_with_objects(
+            [{"name": "orphan", "caption": "Orphan", "extends": "missing"}]
+        )
+        with self.assertRaisesRegex(
+            SchemaException, 'object "orphan" extends undefined object "missing"'
+        ):
+            _ = SchemaCompiler(source).compile()
+
+    def test_inherited_caption(self):
+        source = schema_with_objects(
+            [
+                {"name": "grand", "caption": "Grand", "description": "Grand object."},
+                {"name": "parent", "extends": "grand"},
+                {"name": "child", "extends": "parent", "observable": 999},
+            ]
+        )
+        schema = SchemaCompiler(source).compile()
+        objects = j_object(schema["objects"])
+        child = j_object(objects["child"])
+        self.assertEqual(child["caption"], "Grand")
+        observable = j_object(objects["observable"])
+        type_id = j_object(j_object(observable["attributes"])["type_id"])
+        entry = j_object(j_object(type_id["enum"])["999"])
+        self.assertEqual(entry["caption"], "Grand")
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
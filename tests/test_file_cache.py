@@ -0,0 +1,63 @@
+import logging
+import unittest
+from pathlib import Path
+from sys import stderr
+from typing import override
+
+from ocsf_schema_compiler.cache import FileCache
+from ocsf_schema_compiler.compiler import SchemaCompiler
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+AWS_DIR = Path(BASE_DIR, "uncompiled-schemas/aws-v1.0.0")
+
+
+class TestFileCache(unittest.TestCase):
+    @classmethod
+    @override
+    def setUpClass(cls):
+        logging.basicConfig(
+            format="%(levelname)s: %(message)s", style="%", stream=stderr, level="INFO"
+        )
+
+    @override
+    def setUp(self):
+        print(file=stderr)  # so logs start on new line
+
+    def test_shared_cache(self):
+        expected_schema = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_DIR]
+        ).compile()
+
+        cache = FileCache()
+        first = SchemaCompiler(SCHEMA_DIR, extensions_paths=[AWS_DIR], file_cache=cache)
+        first_schema = first.compile()
+        self.assertEqual(first_schema, expected_schema, "schema should be the same")
+        self.assertGreater(len(cache), 0)
+        self.assertEqual(first.stats.file_cache_hits, 0)
+        self.assertGreater(first.stats.file_cache_misses, 0)
+        self.assertEqual(first.stats.file_cache_misses, len(cache))
+
+        # The second compile must not see modifications made by the first compile
+        second = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_DIR], file_cache=cache
+        )
+        second_schema = second.compile()
+        self.assertEqual(second_schema, expected_schema, "schema should be the same")
+        self.assertGreater(second.stats.file_cache_hits, 0)
+        self.assertEqual(second.stats.file_cache_hits, len(cache))
+        self.assertEqual(second.stats.file_cache_misses, 0)
+
+    def test_least_recently_used_eviction(self):
+        cache = FileCache(max_entries=2)
+        cache.put("a", {"name": "a"})
+        cache.put("b", {"name": "b"})
+        _ = cache.get("a")
+        cache.put("c", {"name": "c"})
+        self.assertEqual(cache.get("a"), {"name": "a"})
+        self.assertIsNone(cache.get("b"), "least recently used entry is evicted")
+        self.assertEqual(cache.get("c"), {"name": "c"})
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from pathlib import Path
+from typing import ClassVar, override
+
+from memory_schema import schema_with_objects  # pyright: ignore[reportImplicitRelativeImport]
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.jsonish import JObject, j_object
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+AWS_EXTENSION_DIR = Path(BASE_DIR, "uncompiled-schemas/aws-v1.0.0")
+
+
+class TestLazy(unittest.TestCase):
+    full: ClassVar[JObject]
+
+    @classmethod
+    @override
+    def setUpClass(cls):
+        cls.full = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_EXTENSION_DIR]
+        ).compile()
+
+    def test_same_as_full_compile(self):
+        compiler = SchemaCompiler(SCHEMA_DIR, extensions_paths=[AWS_EXTENSION_DIR])
+        for name, cls in j_object(self.full["classes"]).items():
+            self.assertEqual(compiler.get_class(name), cls, f"class {name}")
+        for name, obj in j_object(self.full["objects"]).items():
+            self.assertEqual(compiler.get_object(name), obj, f"object {name}")
+
+    def test_memoized(self):
+        compiler = SchemaCompiler(SCHEMA_DIR)
+        file_activity = compiler.get_class("file_activity")
+        self.assertIs(compiler.get_class("file_activity"), file_activity)
+        self.assertEqual(
+            compiler.get_object("file"), j_object(self.full["objects"])["file"]
+        )
+
+    def test_errors(self):
+        compiler = SchemaCompiler(SCHEMA_DIR)
+        with self.assertRaisesRegex(SchemaException, 'Class "nope" is not defined'):
+            _ = compiler.get_class("nope")
+        with self.assertRaisesRegex(SchemaException, "cannot be used with them"):
+            _ = compiler.compile()
+
+        compiler = SchemaCompiler(SCHEMA_DIR)
+        _ = compiler.compile()
+        with self.assertRaisesRegex(SchemaException, "already compiled"):
+            _ = compiler.get_object("file")
+
+        with self.assertRaisesRegex(SchemaException, "not supported in browser mode"):
+            _ = SchemaCompiler(SCHEMA_DIR, browser_mode=True).get_class("file_activity")
+
+    def test_prepare_error(self):
+        # A failed prepare is raised again rather than using the partly prepared state
+        source = schema_with_objects(
+            [{"name": "orphan", "caption": "Orphan", "extends": "missing"}]
+        )
+        compiler = SchemaCompiler(source)
+        with self.assertRaisesRegex(SchemaException, "extends undefined") as first:
+            _ = compiler.get_object("file")
+        with self.assertRaises(SchemaException) as second:
+            _ = compiler.get_class("file_activity")
+        self.assertIs(second.exception, first.exception)
+        with self.assertRaisesRegex(SchemaException, "cannot be used with them"):
+            _ = compiler.compile()
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,100 @@
+import copy
+import unittest
+from pathlib import Path
+from typing import ClassVar, override
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.jsonish import JObject, j_object
+from ocsf_schema_compiler.manifest import (
+    build_manifest,
+    item_table_hashes,
+    manifest_matches,
+)
+from ocsf_schema_compiler.schema_diff import Difference, diff_schemas
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+
+
+class TestManifest(unittest.TestCase):
+    schema: ClassVar[JObject]
+    manifest: ClassVar[JObject]
+
+    @classmethod
+    @override
+    def setUpClass(cls):
+        compiler = SchemaCompiler(SCHEMA_DIR, create_manifest=True)
+        cls.schema = compiler.compile()
+        assert compiler.manifest is not None
+        cls.manifest = compiler.manifest
+
+    def test_stable(self):
+        self.assertEqual(build_manifest(copy.deepcopy(self.schema)), self.manifest)
+        tables = item_table_hashes(self.manifest)
+        self.assertEqual(
+            set(tables),
+            {("classes",), ("objects",), ("profiles",), ("dictionary", "attributes")},
+        )
+        self.assertEqual(
+            tables[("objects",)].keys(), j_object(self.schema["objects"]).keys()
+        )
+
+    def test_changed_item(self):
+        changed = copy.deepcopy(self.schema)
+        j_object(j_object(changed["objects"])["file"])["caption"] = "Changed"
+        changed_manifest = build_manifest(changed)
+        self.assertNotEqual(changed_manifest["hash"], self.manifest["hash"])
+
+        tables = item_table_hashes(self.manifest)
+        changed_tables = item_table_hashes(changed_manifest)
+        for path, hashes in tables.items():
+            changed_hashes = changed_tables[path]
+            changed_names = [n for n in hashes if hashes[n] != changed_hashes[n]]
+            if path == ("objects",):
+                self.assertEqual(changed_names, ["file"])
+            else:
+                self.assertEqual(changed_names, [])
+
+    def test_diff_with_manifests(self):
+        changed = copy.deepcopy(self.schema)
+        j_object(j_object(changed["objects"])["file"])["caption"] = "Changed"
+        changed_manifest = build_manifest(changed)
+        expected = [Difference(("objects", "file", "caption"), "File", "Changed")]
+        self.assertEqual(diff_schemas(self.schema, changed), expected)
+        self.assertEqual(
+            diff_schemas(self.schema, changed, self.manifest, changed_manifest),
+            expected,
+        )
+
+        # Schemas with equal hashes are skipped entirely. Item hashes are trusted, so
+        # a manifest that is stale for an item hides differences in that item.
+        self.assertEqual(
+            diff_schemas(self.schema, changed, self.manifest, self.manifest), []
+        )
+
+    def test_manifest_matches(self):
+        self.assertTrue(manifest_matches(self.schema, self.manifest))
+        self.assertTrue(manifest_matches(copy.deepcopy(self.schema), self.manifest))
+
+        changed = copy.deepcopy(self.schema)
+        changed["version"] = "0.0.0"
+        self.assertFalse(manifest_matches(changed, self.manifest))
+
+        changed = copy.deepcopy(self.schema)
+        del j_object(changed["objects"])["file"]
+        self.assertFalse(manifest_matches(changed, self.manifest))
+
+        changed_manifest = copy.deepcopy(self.manifest)
+        changed_manifest["algorithm"] = "md5"
+        self.assertFalse(manifest_matches(self.schema, changed_manifest))
+
+    def test_diff_with_mismatched_manifest(self):
+        changed = copy.deepcopy(self.schema)
+        changed["version"] = "0.0.0"
+        with self.assertRaisesRegex(SchemaException, "Right manifest does not match"):
+            _ = diff_schemas(self.schema, changed, self.manifest, self.manifest)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,96 @@
+import logging
+import unittest
+from pathlib import Path
+from sys import stderr
+from typing import override
+
+from memory_schema import schema_with_files  # pyright: ignore[reportImplicitRelativeImport]
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.metaschema import Metaschema
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+AWS_DIR = Path(BASE_DIR, "uncompiled-schemas/aws-v1.0.0")
+
+
+class TestMetaschema(unittest.TestCase):
+    @classmethod
+    @override
+    def setUpClass(cls):
+        logging.basicConfig(
+            format="%(levelname)s: %(message)s", style="%", stream=stderr, level="INFO"
+        )
+
+    @override
+    def setUp(self):
+        print(file=stderr)  # so logs start on new line
+
+    def test_valid_schema(self):
+        compiler = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_DIR], validate_metaschema=True
+        )
+        _ = compiler.compile()
+        self.assertEqual(compiler.stats.warning_count, 0)
+
+    def test_errors_aggregated(self):
+        source = schema_with_files(
+            {
+                "objects/bad.json": {
+                    "name": "bad",
+                    "caption": "Bad",
+                    "description": "Bad.",
+                    "attributes": {"name": {"requirement": "bogus"}},
+                    "color": "red",
+                },
+                "events/bad.json": {
+                    "name": "Bad Event",
+                    "caption": "Bad",
+                    "description": "Bad.",
+                    "extends": "base_event",
+                    "attributes": {},
+                },
+            }
+        )
+        with self.assertRaises(SchemaException) as cm:
+            _ = SchemaCompiler(source, validate_metaschema=True).compile()
+        message = str(cm.exception)
+        self.assertIn("failed with 3 error(s)", message)
+        self.assertIn("events/bad.json: /name: 'Bad Event' does not match", message)
+        self.assertIn("objects/bad.json: /attributes/name/requirement:", message)
+        self.assertIn('objects/bad.json: /: unexpected "color"', message)
+
+    def test_validator(self):
+        metaschema = Metaschema(
+            {
+                "item.schema.json": {
+                    "type": "object",
+                    "required": ["name"],
+                    "properties": {
+                        "name": {"$ref": "common.schema.json#/$defs/name"},
+                        "size": {"type": "integer", "minimum": 0},
+                    },
+                    "additionalProperties": False,
+                },
+                "common.schema.json": {
+                    "$defs": {"name": {"type": "string", "pattern": "^[a-z]+$"}}
+                },
+            }
+        )
+        self.assertEqual(metaschema.validate("item.schema.json", {"name": "ok"}), [])
+        self.assertEqual(
+            metaschema.validate("item.schema.json", {"name": "NO", "size": True}),
+            [
+                "/name: 'NO' does not match pattern '^[a-z]+$'",
+                "/size: expected integer, but got true",
+            ],
+        )
+        self.assertEqual(
+            metaschema.validate("item.schema.json", {"extra": 1}),
+            ['/: missing required "name"', '/: unexpected "extra"'],
+        )
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,80 @@
+import json
+import unittest
+from pathlib import Path
+from typing import ClassVar, override
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.jsonish import JObject, j_array, j_object
+from ocsf_schema_compiler.normalized import (
+    is_normalized,
+    normalize,
+    rehydrate,
+    rehydrate_item,
+)
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+
+
+class TestNormalized(unittest.TestCase):
+    schema: ClassVar[JObject]
+    legacy_schema: ClassVar[JObject]
+
+    @classmethod
+    @override
+    def setUpClass(cls):
+        cls.schema = SchemaCompiler(SCHEMA_DIR).compile()
+        cls.legacy_schema = SchemaCompiler(SCHEMA_DIR, legacy_mode=True).compile()
+
+    def test_round_trip(self):
+        for schema in (self.schema, self.legacy_schema):
+            # Through JSON, as written and read
+            normalized = j_object(json.loads(json.dumps(normalize(schema))))  # pyright: ignore[reportAny]
+            self.assertTrue(is_normalized(normalized))
+            self.assertFalse(is_normalized(schema))
+            self.assertEqual(rehydrate(normalized), schema)
+
+    def test_shared(self):
+        normalized = normalize(self.schema)
+        shared_attributes = j_array(normalized["shared_attributes"])
+        shared_enums = j_array(normalized["shared_enums"])
+        # Attribute details and enums are each stored once
+        self.assertEqual(
+            len({json.dumps(a, sort_keys=True) for a in shared_attributes}),
+            len(shared_attributes),
+        )
+        self.assertEqual(
+            len({json.dumps(e, sort_keys=True) for e in shared_enums}),
+            len(shared_enums),
+        )
+        self.assertLess(len(json.dumps(normalized)), len(json.dumps(self.schema)) // 2)
+
+        file_activity = j_object(j_object(normalized["classes"])["file_activity"])
+        index = j_object(file_activity["attributes"])["activity_id"]
+        assert isinstance(index, int)
+        self.assertIsInstance(j_object(shared_attributes[index])["enum"], int)
+
+    def test_rehydrate_item(self):
+        normalized = normalize(self.schema)
+        for table_key, name in (("classes", "file_activity"), ("objects", "file")):
+            self.assertEqual(
+                rehydrate_item(normalized, table_key, name),
+                j_object(self.schema[table_key])[name],
+            )
+
+    def test_invalid_indexes(self):
+        normalized = normalize(self.schema)
+        file = j_object(j_object(normalized["objects"])["file"])
+        attributes = j_object(file["attributes"])
+        # Booleans, negative indexes, and indexes past the end are all rejected
+        for index in (True, -1, len(j_array(normalized["shared_attributes"]))):
+            attributes["name"] = index
+            with self.assertRaisesRegex(SchemaException, "expected index below"):
+                _ = rehydrate(normalized)
+            with self.assertRaisesRegex(SchemaException, "expected index below"):
+                _ = rehydrate_item(normalized, "objects", "file")
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
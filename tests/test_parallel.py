@@ -0,0 +1,52 @@
+import logging
+import unittest
+from pathlib import Path
+from sys import stderr
+from typing import override
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+AWS_DIR = Path(BASE_DIR, "uncompiled-schemas/aws-v1.0.0")
+
+
+class TestParallel(unittest.TestCase):
+    @classmethod
+    @override
+    def setUpClass(cls):
+        logging.basicConfig(
+            format="%(levelname)s: %(message)s", style="%", stream=stderr, level="INFO"
+        )
+
+    @override
+    def setUp(self):
+        print(file=stderr)  # so logs start on new line
+
+    def test_processes(self):
+        expected_schema = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_DIR], browser_mode=True
+        ).compile()
+        schema = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_DIR], browser_mode=True, processes=2
+        ).compile()
+        self.assertEqual(schema, expected_schema, "schema should be the same")
+        # Items must also be in the same order
+        self.assertEqual(list(schema["classes"]), list(expected_schema["classes"]))  # pyright: ignore[reportArgumentType]
+        self.assertEqual(list(schema["objects"]), list(expected_schema["objects"]))  # pyright: ignore[reportArgumentType]
+
+    def test_threads(self):
+        expected_schema = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_DIR], browser_mode=True
+        ).compile()
+        schema = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_DIR], browser_mode=True, threads=4
+        ).compile()
+        self.assertEqual(schema, expected_schema, "schema should be the same")
+        # Items must also be in the same order
+        self.assertEqual(list(schema["classes"]), list(expected_schema["classes"]))  # pyright: ignore[reportArgumentType]
+        self.assertEqual(list(schema["objects"]), list(expected_schema["objects"]))  # pyright: ignore[reportArgumentType]
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
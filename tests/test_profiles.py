@@ -0,0 +1,71 @@
+import logging
+import unittest
+from sys import stderr
+from typing import override
+
+from memory_schema import schema_with_objects  # pyright: ignore[reportImplicitRelativeImport]
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.jsonish import j_object
+
+
+class TestProfiles(unittest.TestCase):
+    @classmethod
+    @override
+    def setUpClass(cls):
+        logging.basicConfig(
+            format="%(levelname)s: %(message)s", style="%", stream=stderr, level="INFO"
+        )
+
+    @override
+    def setUp(self):
+        print(file=stderr)  # so logs start on new line
+
+    def test_recursive_objects(self):
+        # loop_a and loop_b refer to each other, so both get the profiles of both, as
+        # does holder, which refers to loop_a
+        source = schema_with_objects(
+            [
+                {
+                    "name": "loop_a",
+                    "caption": "Loop A",
+                    "description": "Loop A.",
+                    "profiles": ["cloud"],
+                    "attributes": {"loop_b_ref": {"requirement": "optional"}},
+                },
+                {
+                    "name": "loop_b",
+                    "caption": "Loop B",
+                    "description": "Loop B.",
+                    "profiles": ["host"],
+                    "attributes": {"loop_a_ref": {"requirement": "optional"}},
+                },
+                {
+                    "name": "holder",
+                    "caption": "Holder",
+                    "description": "Holder.",
+                    "attributes": {"loop_a_ref": {"requirement": "optional"}},
+                },
+            ],
+            {
+                "loop_a_ref": {
+                    "caption": "Loop A",
+                    "description": "Loop A.",
+                    "type": "loop_a",
+                },
+                "loop_b_ref": {
+                    "caption": "Loop B",
+                    "description": "Loop B.",
+                    "type": "loop_b",
+                },
+            },
+        )
+        schema = SchemaCompiler(source).compile()
+        objects = j_object(schema["objects"])
+        for name in ["loop_a", "loop_b", "holder"]:
+            obj = j_object(objects[name])
+            self.assertEqual(obj["profiles"], ["cloud", "host"], name)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from pathlib import Path
+
+from ocsf_schema_compiler.compiler import (
+    COMPILE_PHASES,
+    CompileProgress,
+    SchemaCompiler,
+)
+from ocsf_schema_compiler.jsonish import j_object
+from run_python import run_python  # pyright: ignore[reportImplicitRelativeImport]
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+AWS_EXTENSION_DIR = Path(BASE_DIR, "uncompiled-schemas/aws-v1.0.0")
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+class TestProgress(unittest.TestCase):
+    def test_compile(self):
+        events: list[CompileProgress] = []
+        output = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_EXTENSION_DIR], progress=events.append
+        ).compile()
+
+        self.assertEqual([e.phase for e in events], list(COMPILE_PHASES))
+        self.assertEqual([e.completed for e in events], list(range(1, 9)))
+        self.assertTrue(all(e.total == len(COMPILE_PHASES) for e in events))
+        elapsed = [e.elapsed_seconds for e in events]
+        self.assertEqual(elapsed, sorted(elapsed))
+
+        read, extensions = events[0], events[1]
+        self.assertGreater(read.class_count, 0)
+        self.assertGreater(extensions.class_count, read.class_count)
+        self.assertGreater(extensions.object_count, read.object_count)
+        self.assertGreater(extensions.profile_count, read.profile_count)
+        self.assertGreater(
+            extensions.dictionary_attribute_count, read.dictionary_attribute_count
+        )
+        last = events[-1]
+        self.assertEqual(last.class_count, len(j_object(output["classes"])))
+        self.assertEqual(last.object_count, len(j_object(output["objects"])))
+
+    def test_get_class(self):
+        events: list[CompileProgress] = []
+        compiler = SchemaCompiler(SCHEMA_DIR, progress=events.append)
+        _ = compiler.get_class("file_activity")
+        _ = compiler.get_object("file")
+        self.assertEqual(
+            [(e.phase, e.completed, e.total) for e in events],
+            [(phase, i, 5) for i, phase in enumerate(COMPILE_PHASES[:5], 1)],
+        )
+
+    def test_budget(self):
+        phases: list[str] = []
+
+        def budget(progress: CompileProgress) -> None:
+            phases.append(progress.phase)
+            if progress.phase == "extensions":
+                raise BudgetExceeded()
+
+        with self.assertRaises(BudgetExceeded):
+            _ = SchemaCompiler(SCHEMA_DIR, progress=budget).compile()
+        self.assertEqual(phases, ["read", "extensions"])
+
+    def test_command_line(self):
+        result = run_python(
+            "-m",
+            "ocsf_schema_compiler",
+            str(SCHEMA_DIR),
+            "--progress",
+            "--log-level",
+            "WARNING",
+        )
+        lines = result.stderr.splitlines()
+        self.assertEqual(len(lines), len(COMPILE_PHASES))
+        self.assertTrue(lines[0].startswith("[#.......] read (1/8) "))
+        self.assertTrue(lines[-1].startswith("[########] output (8/8) "))
+        self.assertIn(" classes, ", lines[-1])
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
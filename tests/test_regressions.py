@@ -135,7 +135,7 @@ class TestRegressions(unittest.TestCase):
 
 def legacy_aws_diff_callback(
     key: str,
-    path: list[str],
+    path: tuple[str, ...],
     _left: JObject,
     _right: JObject,
     left_diff: DiffValue,
@@ -154,8 +154,8 @@ def legacy_aws_diff_callback(
         return True
 
     if (
-        path == ["dictionary_attributes", "last_used_time"]
-        or path == ["dictionary_attributes", "last_used_time_dt"]
+        path == ("dictionary_attributes", "last_used_time")
+        or path == ("dictionary_attributes", "last_used_time_dt")
     ) and left_diff == MISSING:
         # These will be missing with this compiler and scope_extension_keys (left value)
         return True
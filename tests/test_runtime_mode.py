@@ -0,0 +1,86 @@
+import unittest
+from pathlib import Path
+from typing import ClassVar, override
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.jsonish import JObject, JValue, j_object
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+
+
+def keys(value: JValue) -> set[str]:
+    """Returns all keys of objects in value, recursively."""
+    found: set[str] = set()
+    if isinstance(value, dict):
+        for k, v in value.items():
+            found.add(k)
+            found |= keys(v)
+    elif isinstance(value, list):
+        for v in value:
+            found |= keys(v)
+    return found
+
+
+class TestRuntimeMode(unittest.TestCase):
+    full: ClassVar[JObject]
+    runtime: ClassVar[JObject]
+
+    @classmethod
+    @override
+    def setUpClass(cls):
+        cls.full = SchemaCompiler(SCHEMA_DIR).compile()
+        cls.runtime = SchemaCompiler(SCHEMA_DIR, runtime_mode=True).compile()
+
+    def test_no_documentation(self):
+        self.assertNotIn("description", keys(self.runtime))
+        self.assertIs(self.runtime["runtime_mode?"], True)
+
+    def test_validation_data_kept(self):
+        for kind in ("classes", "objects"):
+            full_items = j_object(self.full[kind])
+            runtime_items = j_object(self.runtime[kind])
+            self.assertEqual(runtime_items.keys(), full_items.keys())
+            for name, item in runtime_items.items():
+                full_item = j_object(full_items[name])
+                item = j_object(item)
+                self.assertEqual(item.get("caption"), full_item.get("caption"))
+                self.assertEqual(item.get("profiles"), full_item.get("profiles"))
+                attributes = j_object(item["attributes"])
+                full_attributes = j_object(full_item["attributes"])
+                self.assertEqual(attributes.keys(), full_attributes.keys())
+                for attribute_name, attribute in attributes.items():
+                    attribute = j_object(attribute)
+                    full_attribute = j_object(full_attributes[attribute_name])
+                    self.assertNotIn("caption", attribute)
+                    for key in ("type", "object_type", "is_array", "requirement"):
+                        self.assertEqual(
+                            attribute.get(key), full_attribute.get(key), attribute_name
+                        )
+                    if "enum" in full_attribute:
+                        self.assertEqual(
+                            {
+                                k: j_object(v).get("caption")
+                                for k, v in j_object(attribute["enum"]).items()
+                            },
+                            {
+                                k: j_object(v).get("caption")
+                                for k, v in j_object(full_attribute["enum"]).items()
+                            },
+                        )
+
+    def test_get_class(self):
+        compiler = SchemaCompiler(SCHEMA_DIR, runtime_mode=True)
+        self.assertEqual(
+            compiler.get_class("file_activity"),
+            j_object(self.runtime["classes"])["file_activity"],
+        )
+
+    def test_browser_mode(self):
+        with self.assertRaisesRegex(SchemaException, "mutually exclusive"):
+            _ = SchemaCompiler(SCHEMA_DIR, browser_mode=True, runtime_mode=True)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
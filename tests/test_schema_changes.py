@@ -0,0 +1,114 @@
+import unittest
+
+from ocsf_schema_compiler.jsonish import JObject
+from ocsf_schema_compiler.schema_changes import Change, schema_changes
+
+
+class TestSchemaChanges(unittest.TestCase):
+    def test_equal(self):
+        schema: JObject = {"classes": {"a": {"uid": 1, "attributes": {}}}}
+        self.assertEqual(schema_changes(schema, schema), [])
+
+    def test_items(self):
+        old: JObject = {
+            "classes": {"a": {"uid": 1}, "b": {"uid": 2}},
+            "objects": {"c": {"caption": "C"}},
+        }
+        new: JObject = {
+            "classes": {"a": {"uid": 3}, "d": {"uid": 4}},
+            "objects": {"c": {"caption": "Changed"}},
+        }
+        self.assertEqual(
+            schema_changes(old, new),
+            [
+                Change("breaking", "class", "a", None, "uid changed from 1 to 3"),
+                Change("breaking", "class", "b", None, "removed"),
+                Change("additive", "class", "d", None, "added"),
+            ],
+        )
+
+    def test_attributes(self):
+        old: JObject = {
+            "objects": {
+                "o": {
+                    "attributes": {
+                        "gone": {"type": "string_t"},
+                        "loosened": {"type": "string_t", "requirement": "required"},
+                        "tightened": {"type": "string_t", "requirement": "optional"},
+                        "retyped": {"type": "integer_t"},
+                        "type_id": {
+                            "type": "integer_t",
+                            "enum": {"0": {"caption": "Unknown"}, "1": {}},
+                        },
+                    }
+                }
+            }
+        }
+        new: JObject = {
+            "objects": {
+                "o": {
+                    "attributes": {
+                        "loosened": {"type": "string_t", "requirement": "optional"},
+                        "new_optional": {"type": "string_t"},
+                        "new_required": {"type": "string_t", "requirement": "required"},
+                        "tightened": {"type": "string_t", "requirement": "required"},
+                        "retyped": {"type": "long_t"},
+                        "type_id": {
+                            "type": "integer_t",
+                            "enum": {"0": {"caption": "Changed"}, "2": {}},
+                        },
+                    }
+                }
+            }
+        }
+        self.assertEqual(
+            [c.formatted_string() for c in schema_changes(old, new)],
+            [
+                'object o attribute "gone": removed',
+                'object o attribute "new_required": added as required',
+                'object o attribute "retyped": type changed from "integer_t" to'
+                ' "long_t"',
+                'object o attribute "tightened": requirement changed from "optional"'
+                ' to "required"',
+                'object o attribute "type_id": enum values removed: 1',
+                'object o attribute "loosened": requirement changed from "required"'
+                ' to "optional"',
+                'object o attribute "new_optional": added',
+                'object o attribute "type_id": enum values added: 2',
+            ],
+        )
+
+    def test_dictionary_attributes(self):
+        old: JObject = {"dictionary": {"attributes": {"a": {"type": "string_t"}}}}
+        new: JObject = {
+            "dictionary": {"attributes": {"a": {"type": "string_t", "is_array": True}}}
+        }
+        self.assertEqual(
+            schema_changes(old, new),
+            [
+                Change(
+                    "breaking",
+                    "dictionary attribute",
+                    "a",
+                    None,
+                    "is_array changed from unset to true",
+                )
+            ],
+        )
+
+    def test_json_types(self):
+        # True == 1 in Python, but not in JSON
+        old: JObject = {
+            "dictionary": {"attributes": {"a": {"type": "string_t", "is_array": True}}}
+        }
+        new: JObject = {
+            "dictionary": {"attributes": {"a": {"type": "string_t", "is_array": 1}}}
+        }
+        self.assertEqual(
+            [c.formatted_string() for c in schema_changes(old, new)],
+            ["dictionary attribute a: is_array changed from true to 1"],
+        )
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,99 @@
+import json
+import tempfile
+import unittest
+from compression import zstd
+from pathlib import Path
+
+from run_python import run_python  # pyright: ignore[reportImplicitRelativeImport]
+
+from ocsf_schema_compiler.jsonish import JObject
+from ocsf_schema_compiler.schema_diff import MISSING, Difference, diff_schemas
+
+
+class TestSchemaDiff(unittest.TestCase):
+    def test_equal(self):
+        shared: JObject = {"attributes": {"name": {"type": "string_t"}}}
+        left: JObject = {"objects": {"a": shared}, "version": "1.0.0"}
+        right: JObject = {"objects": {"a": shared}, "version": "1.0.0"}
+        self.assertEqual(diff_schemas(left, right), [])
+
+    def test_differences(self):
+        left: JObject = {
+            "objects": {
+                "a": {"caption": "A", "profiles": ["cloud", "host"]},
+                "b": {"caption": "B"},
+            },
+            "classes": {"c": {"uid": 1}},
+        }
+        right: JObject = {
+            "objects": {
+                "a": {"caption": "A2", "profiles": ["cloud", "user"]},
+                "c": {"caption": "C"},
+            },
+            "classes": {"c": {"uid": 1, "links": [1]}},
+        }
+        self.assertEqual(
+            diff_schemas(left, right),
+            [
+                Difference(("classes", "c", "links"), MISSING, [1]),
+                Difference(("objects", "a", "caption"), "A", "A2"),
+                Difference(("objects", "a", "profiles", "1"), "host", "user"),
+                Difference(("objects", "b"), {"caption": "B"}, MISSING),
+                Difference(("objects", "c"), MISSING, {"caption": "C"}),
+            ],
+        )
+
+    def test_arrays_of_different_length(self):
+        left: JObject = {"profiles": ["cloud"]}
+        right: JObject = {"profiles": ["cloud", "host"]}
+        [difference] = diff_schemas(left, right)
+        self.assertEqual(difference.path_string(), "profiles")
+        self.assertEqual(
+            difference.formatted_string(),
+            'Diff at "profiles":\n    left  : ["cloud"]\n    right : ["cloud", "host"]',
+        )
+
+    def test_scalar_types(self):
+        # True == 1 == 1.0 in Python, but not in JSON
+        left: JObject = {"a": True, "b": [1], "c": {"d": 1}, "e": 1.5}
+        right: JObject = {"a": 1, "b": [1.0], "c": {"d": True}, "e": 1.5}
+        self.assertEqual(
+            diff_schemas(left, right),
+            [
+                Difference(("a",), True, 1),
+                Difference(("b", "0"), 1, 1.0),
+                Difference(("c", "d"), 1, True),
+            ],
+        )
+
+    def test_cli(self):
+        left: JObject = {"objects": {"a": {"caption": "A"}}, "version": "1.0.0"}
+        right: JObject = {"objects": {"a": {"caption": "A2"}}, "version": "1.0.0"}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            left_path = Path(temp_dir, "left.json")
+            right_path = Path(temp_dir, "right.json.zst")
+            _ = left_path.write_text(json.dumps(left))
+            _ = right_path.write_bytes(zstd.compress(json.dumps(right).encode()))
+
+            result = run_python(
+                "-m",
+                "ocsf_schema_compiler",
+                "diff",
+                str(left_path),
+                str(right_path),
+                check=False,
+            )
+            self.assertEqual(result.returncode, 1)
+            self.assertEqual(
+                result.stdout,
+                'Diff at "objects.a.caption":\n    left  : "A"\n    right : "A2"\n',
+            )
+
+            result = run_python(
+                "-m", "ocsf_schema_compiler", "diff", str(left_path), str(left_path)
+            )
+            self.assertEqual(result.stdout, "")
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,67 @@
+import logging
+import unittest
+from sys import stderr
+from typing import override
+
+from memory_schema import schema_with_files  # pyright: ignore[reportImplicitRelativeImport]
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.exceptions import SchemaException
+
+
+class TestShape(unittest.TestCase):
+    @classmethod
+    @override
+    def setUpClass(cls):
+        logging.basicConfig(
+            format="%(levelname)s: %(message)s", style="%", stream=stderr, level="INFO"
+        )
+
+    @override
+    def setUp(self):
+        print(file=stderr)  # so logs start on new line
+
+    def test_attributes_not_object(self):
+        source = schema_with_files(
+            {"objects/bad.json": {"name": "bad", "caption": "Bad", "attributes": []}}
+        )
+        with self.assertRaisesRegex(
+            SchemaException,
+            'The "attributes" value in objects file must be an object, but got array',
+        ):
+            _ = SchemaCompiler(source).compile()
+
+    def test_attribute_detail_wrong_type(self):
+        source = schema_with_files(
+            {
+                "objects/bad.json": {
+                    "name": "bad",
+                    "caption": "Bad",
+                    "attributes": {"name": {"requirement": 1}},
+                }
+            }
+        )
+        with self.assertRaisesRegex(
+            SchemaException,
+            'The "attributes.name.requirement" value in objects file must be a string',
+        ):
+            _ = SchemaCompiler(source).compile()
+
+    def test_profiles_not_strings(self):
+        source = schema_with_files(
+            {
+                "objects/bad.json": {
+                    "name": "bad",
+                    "caption": "Bad",
+                    "profiles": ["host", 2],
+                }
+            }
+        )
+        with self.assertRaisesRegex(
+            SchemaException, r'The "profiles\[1\]" value in objects file must be'
+        ):
+            _ = SchemaCompiler(source).compile()
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
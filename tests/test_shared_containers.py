@@ -0,0 +1,82 @@
+import unittest
+from pathlib import Path
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.jsonish import JValue, j_object
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+AWS_EXTENSION_DIR = Path(BASE_DIR, "uncompiled-schemas/aws-v1.0.0")
+RC_2_SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.0.0-rc.2")
+SPLUNK_EXTENSION_DIR = Path(BASE_DIR, "uncompiled-schemas/splunk-v1.16.2")
+
+
+def shared_containers(value: JValue) -> list[tuple[str, str]]:
+    """
+    Returns the paths of dictionaries and lists in value that are the same object as
+    one found earlier, along with the path of the earlier one.
+    """
+    paths: dict[int, str] = {}
+    shared: list[tuple[str, str]] = []
+    stack: list[tuple[JValue, str]] = [(value, "")]
+    while stack:
+        value, path = stack.pop()
+        if isinstance(value, dict):
+            children = [(v, f"{path}.{k}") for k, v in value.items()]
+        elif isinstance(value, list):
+            children = [(v, f"{path}.{i}") for i, v in enumerate(value)]
+        else:
+            continue
+        if id(value) in paths:
+            shared.append((path, paths[id(value)]))
+            continue
+        paths[id(value)] = path
+        stack.extend(children)
+    return shared
+
+
+class TestSharedContainers(unittest.TestCase):
+    """
+    Included files and dictionary attributes are shared while compiling, but items in
+    the output must not share containers, so modifying one item of a compiled schema
+    does not change others.
+    """
+
+    def test_compile(self):
+        output = SchemaCompiler(SCHEMA_DIR).compile()
+        self.assertEqual(shared_containers(output), [])
+
+    def test_browser_mode(self):
+        output = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_EXTENSION_DIR], browser_mode=True
+        ).compile()
+        self.assertEqual(shared_containers(output), [])
+
+    def test_processes(self):
+        # Included containers are copied before finishing in worker processes
+        output = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_EXTENSION_DIR], processes=2
+        ).compile()
+        self.assertEqual(shared_containers(output), [])
+
+    def test_legacy_mode(self):
+        output = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_EXTENSION_DIR], legacy_mode=True
+        ).compile()
+        # The legacy layout has base_event both at the top level and in classes
+        self.assertIs(
+            output.pop("base_event"), j_object(output["classes"])["base_event"]
+        )
+        self.assertEqual(shared_containers(output), [])
+
+    def test_includes(self):
+        output = SchemaCompiler(
+            RC_2_SCHEMA_DIR,
+            ignore_platform_extensions=True,
+            extensions_paths=[SPLUNK_EXTENSION_DIR],
+        ).compile()
+        self.assertEqual(shared_containers(output), [])
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
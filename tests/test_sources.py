@@ -0,0 +1,137 @@
+import io
+import logging
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from compression import zstd
+from pathlib import Path
+from sys import stderr
+from typing import override
+
+from memory_schema import schema_with_files  # pyright: ignore[reportImplicitRelativeImport]
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.jsonish import JObject, j_object
+from ocsf_schema_compiler.sources import MemberData, MemorySource
+from ocsf_schema_compiler.structured_read import read_json_object_file
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+AWS_DIR = Path(BASE_DIR, "uncompiled-schemas/aws-v1.0.0")
+
+
+class TestSources(unittest.TestCase):
+    @classmethod
+    @override
+    def setUpClass(cls):
+        logging.basicConfig(
+            format="%(levelname)s: %(message)s", style="%", stream=stderr, level="INFO"
+        )
+
+    @override
+    def setUp(self):
+        print(file=stderr)  # so logs start on new line
+
+    def test_zip_archive_schema(self):
+        # Zip archive with everything under one top-level directory, like a GitHub
+        # source archive. This includes the platform extensions.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_path = Path(temp_dir, "ocsf-schema-1.6.0.zip")
+            with zipfile.ZipFile(zip_path, "w") as zip_file:
+                for path in sorted(SCHEMA_DIR.rglob("*")):
+                    if path.is_file():
+                        arc_name = f"ocsf-schema-1.6.0/{path.relative_to(SCHEMA_DIR)}"
+                        zip_file.write(path, arc_name)
+
+            schema = SchemaCompiler(zip_path).compile()
+
+        expected_schema = SchemaCompiler(SCHEMA_DIR).compile()
+        self.assertEqual(schema, expected_schema, "archive should compile the same")
+
+    def test_tar_zstandard_archive_extension(self):
+        tar_data = io.BytesIO()
+        with tarfile.open(fileobj=tar_data, mode="w") as tar_file:
+            tar_file.add(AWS_DIR, arcname=".")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tar_path = Path(temp_dir, "aws-1.0.0.tar.zst")
+            _ = tar_path.write_bytes(zstd.compress(tar_data.getvalue()))
+
+            schema = SchemaCompiler(SCHEMA_DIR, extensions_paths=[tar_path]).compile()
+
+        expected_schema = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_DIR]
+        ).compile()
+        self.assertEqual(schema, expected_schema, "archive should compile the same")
+
+    def test_memory_source(self):
+        # Schema files as JSON text and extension files as parsed JSON objects
+        schema_files: dict[str, MemberData] = {}
+        for path in SCHEMA_DIR.rglob("*.json"):
+            schema_files[path.relative_to(SCHEMA_DIR).as_posix()] = path.read_bytes()
+        extension_files: dict[str, MemberData] = {}
+        for path in AWS_DIR.rglob("*.json"):
+            extension_files[path.relative_to(AWS_DIR).as_posix()] = (
+                read_json_object_file(path)
+            )
+        extension_info = extension_files["extension.json"]
+        original_extension_info = read_json_object_file(AWS_DIR / "extension.json")
+        extension_source = MemorySource(extension_files, root=Path("aws"))
+
+        expected_schema = SchemaCompiler(
+            SCHEMA_DIR, extensions_paths=[AWS_DIR]
+        ).compile()
+        # Compile twice to make sure the in-memory files are not modified
+        for _ in range(2):
+            schema = SchemaCompiler(
+                MemorySource(schema_files), extensions_paths=[extension_source]
+            ).compile()
+            self.assertEqual(schema, expected_schema, "source should compile the same")
+        self.assertEqual(
+            extension_info, original_extension_info, "source should be unchanged"
+        )
+
+    def test_memory_sources_with_same_paths(self):
+        # Memory sources have the same default root, so the schema and extension
+        # include files with the same path must still be kept apart
+        def thing(name: str) -> JObject:
+            return {
+                "name": name,
+                "caption": name,
+                "description": name,
+                "attributes": {"$include": "includes/a.json"},
+            }
+
+        source = schema_with_files(
+            {
+                "includes/a.json": {
+                    "caption": "A",
+                    "attributes": {"name": {"requirement": "optional"}},
+                },
+                "objects/schema_thing.json": thing("schema_thing"),
+            }
+        )
+        extension_files: dict[str, MemberData] = {
+            "extension.json": {"uid": 999, "name": "example", "version": "1.0.0"},
+            "includes/a.json": {
+                "caption": "A",
+                "attributes": {"uid": {"requirement": "optional"}},
+            },
+            "objects/extension_thing.json": thing("extension_thing"),
+        }
+
+        schema = SchemaCompiler(
+            source, extensions_paths=[MemorySource(extension_files)]
+        ).compile()
+        objects = j_object(schema["objects"])
+        self.assertEqual(
+            list(j_object(j_object(objects["schema_thing"])["attributes"])), ["name"]
+        )
+        self.assertEqual(
+            list(j_object(j_object(objects["extension_thing"])["attributes"])),
+            ["uid"],
+        )
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
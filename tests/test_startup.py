@@ -0,0 +1,28 @@
+import unittest
+
+import ocsf_schema_compiler
+from run_python import run_python  # pyright: ignore[reportImplicitRelativeImport]
+
+
+class TestStartup(unittest.TestCase):
+    def test_entry_module_does_not_import_compiler(self):
+        result = run_python(
+            "-c",
+            "import sys, ocsf_schema_compiler.__main__;"
+            " print(sorted(m for m in sys.modules if m.startswith(('ocsf', 'multi'))))",
+        )
+        self.assertEqual(
+            result.stdout.strip(),
+            "['ocsf_schema_compiler', 'ocsf_schema_compiler.__main__',"
+            " 'ocsf_schema_compiler.jsonish']",
+        )
+
+    def test_version(self):
+        result = run_python("-m", "ocsf_schema_compiler", "--version")
+        self.assertTrue(
+            result.stdout.strip().endswith(f" {ocsf_schema_compiler.__version__}")
+        )
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
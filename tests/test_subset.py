@@ -0,0 +1,73 @@
+import unittest
+from pathlib import Path
+from typing import ClassVar, override
+
+from ocsf_schema_compiler.compiler import SchemaCompiler
+from ocsf_schema_compiler.exceptions import SchemaException
+from ocsf_schema_compiler.jsonish import JObject, j_object
+
+BASE_DIR = Path(__file__).parent
+SCHEMA_DIR = Path(BASE_DIR, "uncompiled-schemas/ocsf-schema-v1.6.0")
+
+
+class TestSubset(unittest.TestCase):
+    full: ClassVar[JObject]
+
+    @classmethod
+    @override
+    def setUpClass(cls):
+        cls.full = SchemaCompiler(SCHEMA_DIR).compile()
+
+    def assert_subset(self, subset: JObject) -> None:
+        # Selected items are the same as in a full compile
+        for key in ("classes", "objects"):
+            items = j_object(subset[key])
+            full_items = j_object(self.full[key])
+            for name, item in items.items():
+                self.assertEqual(item, full_items[name], f"{key} {name}")
+        attributes = j_object(j_object(subset["dictionary"])["attributes"])
+        full_attributes = j_object(j_object(self.full["dictionary"])["attributes"])
+        for name, attribute in attributes.items():
+            self.assertEqual(attribute, full_attributes[name], f"attribute {name}")
+
+    def test_classes(self):
+        subset = SchemaCompiler(SCHEMA_DIR, classes=["file_activity"]).compile()
+        self.assertEqual(
+            set(j_object(subset["classes"])), {"base_event", "file_activity"}
+        )
+        objects = j_object(subset["objects"])
+        self.assertIn("file", objects)
+        # Objects only used through other objects are included
+        self.assertIn("fingerprint", objects)
+        self.assertLess(len(objects), len(j_object(self.full["objects"])))
+        self.assert_subset(subset)
+
+    def test_categories_and_profiles(self):
+        subset = SchemaCompiler(
+            SCHEMA_DIR, categories=["findings"], profiles=["cloud"]
+        ).compile()
+        classes = j_object(subset["classes"])
+        for name, cls in classes.items():
+            if name != "base_event":
+                self.assertEqual(j_object(cls)["category"], "findings")
+        self.assertIn("detection_finding", classes)
+        self.assertEqual(list(j_object(subset["profiles"])), ["cloud"])
+        self.assert_subset(subset)
+
+    def test_all_profiles(self):
+        # Selecting profiles alone does not drop classes, objects, or attributes
+        profiles = list(j_object(self.full["profiles"]))
+        subset = SchemaCompiler(SCHEMA_DIR, profiles=profiles).compile()
+        self.assertEqual(subset, self.full)
+
+    def test_undefined(self):
+        with self.assertRaisesRegex(SchemaException, 'class "nope" is not defined'):
+            _ = SchemaCompiler(SCHEMA_DIR, classes=["nope"]).compile()
+        with self.assertRaisesRegex(SchemaException, 'category "nope" is not'):
+            _ = SchemaCompiler(SCHEMA_DIR, categories=["nope"]).compile()
+        with self.assertRaisesRegex(SchemaException, 'profile "nope" is not'):
+            _ = SchemaCompiler(SCHEMA_DIR, profiles=["nope"]).compile()
+
+
+if __name__ == "__main__":
+    _ = unittest.main()